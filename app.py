@@ -1,7 +1,18 @@
+import os
 import streamlit as st
-from export_utils import export_to_pdf, export_to_docx
+from export_utils import export_to_pdf, export_to_docx, start_warm_up, set_render_cache
 from models import PersonalInformation, Education, Experience, Skills, CVData
-from cv_builder import generate_cv_content
+from cv_builder import IncrementalRenderer
+from cv_document import build_document, as_document
+from export_cache import ExportCache, DiskExportCache, DeferredExport
+from export_timing import observe_exports
+from render_service import render_remote
+from multi_export import export_zip
+from page_fit import estimate_pages, fit_to_pages
+from cv_import import import_cv
+from ats_score import score_cv
+from taxonomy import get_taxonomy, canonical_name
+from validation import ERROR, check_field, check_entry, has_errors, validate_cv
 
 st.set_page_config(layout="wide", page_title="ATS CV Creator")
 st.title("ATS-Friendly CV Creator")
@@ -10,6 +21,55 @@ st.title("ATS-Friendly CV Creator")
 with open("style.css") as f:
     st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
+# The PDF/DOCX backends are imported on first export; load them in the background once
+# per process so the first download is fast (set EXPORT_WARM_UP=0 to skip)
+@st.cache_resource
+def warm_up_exports():
+    return start_warm_up()
+
+if os.environ.get("EXPORT_WARM_UP", "1") != "0":
+    warm_up_exports()
+
+# Rendered PDF/DOCX bytes are shared across reruns and sessions, keyed by CV content
+@st.cache_resource
+def get_export_cache():
+    return ExportCache(max_entries=128)
+
+# Set RENDER_CACHE_DIR to also keep renders on disk, shared by all app workers and kept across restarts
+@st.cache_resource
+def use_disk_render_cache(directory):
+    cache = DiskExportCache(directory, max_bytes=int(os.environ.get("RENDER_CACHE_MAX_MB", "512")) * 1024 * 1024)
+    set_render_cache(cache)
+    return cache
+
+if os.environ.get("RENDER_CACHE_DIR"):
+    use_disk_render_cache(os.environ["RENDER_CACHE_DIR"])
+
+# Set RENDER_SERVICE_URL (e.g. http://127.0.0.1:8765) to render PDF/DOCX in a shared render_service
+RENDER_SERVICE_URL = os.environ.get("RENDER_SERVICE_URL")
+
+def render_pdf(cv):
+    if RENDER_SERVICE_URL:
+        try:
+            return render_remote(RENDER_SERVICE_URL, 'pdf', cv)
+        except OSError:
+            pass # Service unavailable, render in-process instead
+    cv_document = as_document(cv)
+    return export_to_pdf(cv_document, f"{cv_document.name.replace(' ', '_')}_CV.pdf").getvalue()
+
+def render_fitted_pdf(cv, pages):
+    # Scaling is done in-process; the render service only renders the template at its normal size
+    return fit_to_pages(as_document(cv), pages).pdf.getvalue()
+
+def render_docx(cv):
+    if RENDER_SERVICE_URL:
+        try:
+            return render_remote(RENDER_SERVICE_URL, 'docx', cv)
+        except OSError:
+            pass # Service unavailable, render in-process instead
+    cv_document = as_document(cv)
+    return export_to_docx(cv_document, f"{cv_document.name.replace(' ', '_')}_CV.docx").getvalue()
+
 # Function to reset all CV data
 def reset_cv_data():
     st.session_state.cv_data = CVData()
@@ -23,7 +83,25 @@ if st.button("Reset All Fields", help="Clear all entered information and start f
 if 'cv_data' not in st.session_state:
     st.session_state.cv_data = CVData()
 
+# Import an existing CV once per uploaded file, replacing the current data
+uploaded_cv = st.file_uploader("Import an existing CV (.docx or .pdf)", type=['docx', 'pdf'],
+                               help="Fills in the form from a DOCX or text-based PDF CV. Check the imported fields before exporting.")
+if uploaded_cv is not None and st.session_state.get('imported_cv_id') != uploaded_cv.file_id:
+    st.session_state.imported_cv_id = uploaded_cv.file_id
+    try:
+        st.session_state.cv_data = import_cv(uploaded_cv.getvalue(), uploaded_cv.name)
+        st.rerun()
+    except ValueError as e:
+        st.error(f"Could not import {uploaded_cv.name}: {e}")
+# Re-renders only the preview sections that changed since the last rerun
+if 'preview_renderer' not in st.session_state:
+    st.session_state.preview_renderer = IncrementalRenderer()
+
 # Main content area and live preview
+def show_issues(issues):
+    for issue in issues:
+        (st.error if issue.severity == ERROR else st.warning)(issue.message)
+
 input_column, preview_column = st.columns([2, 1])
 
 with input_column:
@@ -32,28 +110,24 @@ with input_column:
     with tabs[0]: # Personal Information
         st.header("Personal Information")
         with st.expander("Contact Details", expanded=True):
-            st.session_state.cv_data.personal_info.name = st.text_input("Full Name", value=st.session_state.cv_data.personal_info.name, help="Your full legal name.")
-            
+            name_input = st.text_input("Full Name", value=st.session_state.cv_data.personal_info.name, help="Your full legal name.")
+            show_issues(check_field(PersonalInformation, "name", name_input))
+            st.session_state.cv_data.personal_info.name = name_input
+
             email_input = st.text_input("Email", value=st.session_state.cv_data.personal_info.email, help="A professional email address.")
-            if not email_input:
-                st.warning("Email is required.")
-            elif "@" not in email_input or "." not in email_input:
-                st.error("Please enter a valid email address.")
+            show_issues(check_field(PersonalInformation, "email", email_input))
             st.session_state.cv_data.personal_info.email = email_input
 
             phone_input = st.text_input("Phone (e.g., +1 123 456 7890)", value=st.session_state.cv_data.personal_info.phone, help="Include country code for international numbers.")
-            if not phone_input:
-                st.warning("Phone number is required.")
+            show_issues(check_field(PersonalInformation, "phone", phone_input))
             st.session_state.cv_data.personal_info.phone = phone_input
 
             linkedin_input = st.text_input("LinkedIn Profile URL", value=st.session_state.cv_data.personal_info.linkedin, help="Full URL to your LinkedIn profile.")
-            if linkedin_input and not linkedin_input.startswith("http"):
-                st.error("Please enter a valid URL (e.g., https://linkedin.com/in/yourprofile).")
+            show_issues(check_field(PersonalInformation, "linkedin", linkedin_input))
             st.session_state.cv_data.personal_info.linkedin = linkedin_input
 
             github_input = st.text_input("GitHub Profile URL", value=st.session_state.cv_data.personal_info.github, help="Full URL to your GitHub profile.")
-            if github_input and not github_input.startswith("http"):
-                st.error("Please enter a valid URL (e.g., https://github.com/yourusername).")
+            show_issues(check_field(PersonalInformation, "github", github_input))
             st.session_state.cv_data.personal_info.github = github_input
 
         with st.expander("Professional Summary/Objective", expanded=True):
@@ -62,8 +136,10 @@ with input_column:
     with tabs[1]: # Education
         st.header("Education")
         with st.expander("Add New Education", expanded=True):
+            # Outside the form so the degree list follows the search as it is typed
+            degree_search = st.text_input("Search degrees", key="degree_search", help="Type part of a degree name or an abbreviation (e.g., MSc, MBA).")
             with st.form("education_form", clear_on_submit=True):
-                common_degrees = ["Bachelor of Science", "Master of Arts", "PhD", "Associate Degree", "High School Diploma", "MBA", "Juris Doctor (J.D.)", "Doctor of Medicine (M.D.)", "Other"]
+                common_degrees = get_taxonomy('degrees').search(degree_search, 20) + ["Other"]
                 selected_degree = st.selectbox("Degree", common_degrees, help="Select your degree or choose 'Other' to enter a custom one.")
                 if selected_degree == "Other":
                     degree = st.text_input("Custom Degree", help="e.g., Bachelor of Engineering in Robotics")
@@ -78,13 +154,15 @@ with input_column:
                 
                 submitted = st.form_submit_button("Add Education")
                 if submitted:
-                    if not all([degree, major, institution, location, start_date, end_date]):
-                        st.error("Please fill in all required fields for education.")
+                    entry = Education(
+                        degree=degree, major=major, institution=institution,
+                        location=location, start_date=start_date, end_date=end_date, gpa=gpa
+                    )
+                    issues = check_entry(entry)
+                    if has_errors(issues):
+                        show_issues(issues)
                     else:
-                        st.session_state.cv_data.education.append(Education(
-                            degree=degree, major=major, institution=institution,
-                            location=location, start_date=start_date, end_date=end_date, gpa=gpa
-                        ))
+                        st.session_state.cv_data.education.append(entry)
                         st.success("Education added!")
 
         st.subheader("Your Education")
@@ -105,11 +183,9 @@ with input_column:
     with tabs[2]: # Experience
         st.header("Work Experience")
         with st.expander("Add New Experience", expanded=True):
+            title_search = st.text_input("Search job titles", key="title_search", help="Type part of a job title (e.g., engineer, analyst).")
             with st.form("experience_form", clear_on_submit=True):
-                common_titles = ["Software Engineer", "Data Scientist", "Project Manager", "Product Manager", "Marketing Specialist", 
-                                 "Human Resources Manager", "Financial Analyst", "Graphic Designer", "Customer Service Representative", 
-                                 "Operations Manager", "Business Analyst", "DevOps Engineer", "UI/UX Designer", "Consultant", "Sales Manager", 
-                                 "Accountant", "Researcher", "Educator", "Other"]
+                common_titles = get_taxonomy('titles').search(title_search, 20) + ["Other"]
                 selected_title = st.selectbox("Job Title", common_titles, help="Select your job title or choose 'Other' to enter a custom one.")
                 if selected_title == "Other":
                     title = st.text_input("Custom Job Title", help="e.g., Senior AI/ML Engineer")
@@ -123,13 +199,15 @@ with input_column:
                 
                 submitted = st.form_submit_button("Add Experience")
                 if submitted:
-                    if not all([title, company, location, start_date, end_date, description]):
-                        st.error("Please fill in all required fields for experience.")
+                    entry = Experience(
+                        title=title, company=company, location=location,
+                        start_date=start_date, end_date=end_date, description=description
+                    )
+                    issues = check_entry(entry)
+                    if has_errors(issues):
+                        show_issues(issues)
                     else:
-                        st.session_state.cv_data.experience.append(Experience(
-                            title=title, company=company, location=location,
-                            start_date=start_date, end_date=end_date, description=description
-                        ))
+                        st.session_state.cv_data.experience.append(entry)
                         st.success("Experience added!")
 
         st.subheader("Your Experience")
@@ -150,7 +228,10 @@ with input_column:
 
         def add_skill(skill_type, new_skill_input):
             if new_skill_input:
-                getattr(st.session_state.cv_data.skills, skill_type).append(new_skill_input)
+                skill = canonical_name('skills', new_skill_input)
+                skills = getattr(st.session_state.cv_data.skills, skill_type)
+                if skill not in skills:
+                    skills.append(skill)
                 # Clear the input box after adding the skill
                 if skill_type == "technical":
                     st.session_state.new_technical_skill = ""
@@ -160,12 +241,22 @@ with input_column:
                     st.session_state.new_languages_skill = ""
 
 
+        def skill_suggestions(skill_type, typed):
+            # Known skills matching what has been typed so far, added on click
+            suggestions = [name for name in get_taxonomy('skills').search(typed, 5) if name != typed.strip()]
+            if typed.strip() and suggestions:
+                columns = st.columns(len(suggestions))
+                for column, suggestion in zip(columns, suggestions):
+                    with column:
+                        st.button(suggestion, key=f"suggest_{skill_type}_{suggestion}", on_click=add_skill, args=(skill_type, suggestion))
+
         def remove_skill(skill_type, index):
             getattr(st.session_state.cv_data.skills, skill_type).pop(index)
 
         # Technical Skills
         st.subheader("Technical Skills")
         new_tech_skill = st.text_input("Add Technical Skill", key="new_technical_skill", help="e.g., Python, SQL, AWS, Docker.")
+        skill_suggestions("technical", new_tech_skill)
         if st.button("Add Technical Skill", key="add_tech_button"):
             add_skill("technical", new_tech_skill)
             st.rerun()
@@ -182,6 +273,7 @@ with input_column:
         # Soft Skills
         st.subheader("Soft Skills")
         new_soft_skill = st.text_input("Add Soft Skill", key="new_soft_skill", help="e.g., Communication, Teamwork, Problem-solving.")
+        skill_suggestions("soft", new_soft_skill)
         if st.button("Add Soft Skill", key="add_soft_button"):
             add_skill("soft", new_soft_skill)
             st.rerun()
@@ -198,6 +290,7 @@ with input_column:
         # Languages
         st.subheader("Languages")
         new_lang_skill = st.text_input("Add Language", key="new_languages_skill", help="e.g., English, Spanish, French.")
+        skill_suggestions("languages", new_lang_skill)
         if st.button("Add Language", key="add_lang_button"):
             add_skill("languages", new_lang_skill)
             st.rerun()
@@ -215,9 +308,16 @@ with preview_column:
     st.header("Live CV Preview")
     
     if st.session_state.cv_data.personal_info.name:
-        cv_output = generate_cv_content(st.session_state.cv_data)
+        cv_output = st.session_state.preview_renderer.render(st.session_state.cv_data)
         st.markdown(f"<div class='a4-page'>{cv_output}</div>", unsafe_allow_html=True)
 
+        # Whole-CV check, e.g. for imported entries; cached, so unchanged CVs cost a lookup per rerun
+        cv_issues = validate_cv(st.session_state.cv_data)
+        if cv_issues:
+            with st.expander(f"{len(cv_issues)} item(s) to review", expanded=has_errors(cv_issues)):
+                for issue in cv_issues:
+                    st.caption(f"{'Error' if issue.severity == ERROR else 'Warning'} in {issue.path}: {issue.message}")
+
         st.download_button(
             label="Download CV as Markdown (.md)",
             data=cv_output,
@@ -231,20 +331,67 @@ with preview_column:
             mime="text/plain"
         )
         
-        pdf_buffer = export_to_pdf(st.session_state.cv_data, f"{st.session_state.cv_data.personal_info.name.replace(' ', '_')}_CV.pdf")
+        # Keyword match against a pasted job description; term vectors are cached per CV version
+        job_description = st.text_area("Job description (optional)", key="job_description",
+                                       help="Paste a job ad to see how many of its keywords your CV covers.")
+        if job_description.strip():
+            keyword_score = score_cv(st.session_state.cv_data, job_description)
+            st.metric("ATS keyword match", f"{keyword_score.score:.0f}%", help=f"{keyword_score.coverage} keywords found")
+            if keyword_score.missing:
+                st.caption("Missing keywords: " + ", ".join(keyword_score.missing[:15]))
+            if keyword_score.matched:
+                st.caption("Matched keywords: " + ", ".join(keyword_score.matched[:15]))
+
+        # PDF and DOCX are only built when the user clicks the download button,
+        # from an immutable snapshot shared by both formats (the render service takes CVData)
+        cv_document = build_document(st.session_state.cv_data)
+        export_source = st.session_state.cv_data if RENDER_SERVICE_URL else cv_document
+        export_cache = get_export_cache()
+
+        # Page count from a layout pass over cached text widths, without building the PDF
+        estimated_pages = estimate_pages(cv_document)
+        st.caption(f"Estimated PDF length: {estimated_pages} page{'s' if estimated_pages != 1 else ''}")
+        fit_pages = st.selectbox("Fit PDF to", [0, 1, 2], format_func=lambda n: f"{n} page{'s' if n > 1 else ''}" if n else "No limit",
+                                 help="Shrinks text and spacing (down to 70%) so the PDF fits in this many pages.")
+        if fit_pages and estimated_pages > fit_pages:
+            pdf_export = DeferredExport(export_cache, cv_document, f"pdf-fit{fit_pages}",
+                                        lambda cv: render_fitted_pdf(cv, fit_pages))
+        else:
+            pdf_export = DeferredExport(export_cache, export_source, "pdf", render_pdf)
         st.download_button(
             label="Download CV as PDF (.pdf)",
-            data=pdf_buffer.getvalue(),
+            data=pdf_export,
             file_name=f"{st.session_state.cv_data.personal_info.name.replace(' ', '_')}_CV.pdf",
             mime="application/pdf"
         )
 
-        docx_buffer = export_to_docx(st.session_state.cv_data, f"{st.session_state.cv_data.personal_info.name.replace(' ', '_')}_CV.docx")
         st.download_button(
             label="Download CV as DOCX (.docx)",
-            data=docx_buffer.getvalue(),
+            data=DeferredExport(export_cache, export_source, "docx", render_docx),
             file_name=f"{st.session_state.cv_data.personal_info.name.replace(' ', '_')}_CV.docx",
             mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         )
+
+        # All formats in one archive, rendered concurrently on the shared export pool
+        st.download_button(
+            label="Download all formats (.zip)",
+            data=DeferredExport(export_cache, cv_document, "zip", lambda cv: export_zip(cv).getvalue()),
+            file_name=f"{st.session_state.cv_data.personal_info.name.replace(' ', '_')}_CV.zip",
+            mime="application/zip"
+        )
+
+        # Opt-in debug panel: renders both formats uncached and shows where the time went
+        if st.sidebar.checkbox("Show export timings", help="Profile the PDF/DOCX export pipeline stage by stage."):
+            with st.expander("Export timings", expanded=True):
+                if st.button("Profile PDF and DOCX export"):
+                    profiles = []
+                    with observe_exports(profiles.append): # Always in-process, even with a render service
+                        export_to_pdf(cv_document, "cv.pdf", cache=False)
+                        export_to_docx(cv_document, "cv.docx", cache=False)
+                    st.session_state.export_profiles = profiles
+                for profile in st.session_state.get('export_profiles', []):
+                    st.write(f"**{profile.fmt.upper()}** ({profile.engine}): {profile.total_seconds*1000:.1f} ms, "
+                             f"{profile.output_bytes / 1024:.1f} KiB")
+                    st.table(profile.as_rows())
     else:
         st.info("Fill in your personal information to see the live preview.")
\ No newline at end of file
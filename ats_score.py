@@ -0,0 +1,251 @@
+"""
+ATS keyword-match scoring of a CV against a job description.
+
+Both texts are reduced to term vectors: lowercased tokens (keeping "c++", "c#",
+"node.js", "ci/cd"), stop words and job-ad filler removed, plurals folded, plus
+two-word phrases ("machine learning"). A job description's vector weights each term by
+1 + ln(count); phrases only count when they occur at least twice, so one-off word pairs
+do not dominate. The CV's vector is the set of terms in the summary, experience titles
+and descriptions, education degrees and majors, and every skill.
+
+Vectors are cached: per CV version (keyed by the field values that are scored) and
+per job description text. A score is then one set intersection and a sum over the matches,
+cheap enough to recompute on every preview rerun:
+
+    result = score_cv(cv_data, job_description)
+    result.score, result.matched, result.missing
+"""
+import math
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, Iterator, List, NamedTuple, Tuple
+
+from models import CVData
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+_LETTER = re.compile(r"[a-z]")
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between
+both but by can could did do does doing down during each etc every few for from further had has have having he
+her here hers how i if in into is it its itself just least less may me might more most must my no nor not now of
+off on once only or other our ours out over own per same shall she should so some such than that the their them
+then there these they this those through to too under until up upon us very via was we well were what when where
+which while who whom why will with within without would you your yours
+""".split())
+
+# Words common to job ads that say nothing about the role
+FILLER_WORDS = frozenset("""
+ability able apply candidate candidates company etc excellent experience experienced good great ideal ideally
+including job join knowledge looking new opportunity plus position preferred proven required requirement
+requirements responsibilities responsibility role seeking skill skills strong understanding using work working
+year years
+""".split())
+
+_IGNORED = STOP_WORDS | FILLER_WORDS
+
+
+def _fold(token: str) -> str:
+    """
+    Folds simple plurals ("apis" -> "api", "databases" -> "database").
+    """
+    if (len(token) > 3 and token.isalpha() and token.endswith('s') and not token.endswith(('ss', 'us'))
+            and not (len(token) > 4 and token.endswith('is'))): # "analysis", "basis"
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased, plural-folded tokens of text, with stop words and filler words removed.
+    Numbers ("5+", "2024") are dropped; a removed word still separates phrases (see terms).
+    """
+    return [token for token in _tokens(text) if token]
+
+
+def _tokens(text: str) -> Iterator[str]:
+    # Yields '' in place of ignored words so that phrases never span them
+    return map(_term, _TOKEN.findall(text.lower()))
+
+
+@lru_cache(maxsize=65536)
+def _term(word: str) -> str:
+    """
+    The term for one lowercased word, or '' if it is ignored. Memoized: CV and job text
+    repeats the same words.
+    """
+    word = word.rstrip('.-/')
+    if word in _IGNORED or not _LETTER.search(word) or len(word) < 2 and word not in ('c', 'r'):
+        return ''
+    return _fold(word)
+
+
+def _surface_forms(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (term, original wording) for every term in text, phrases included.
+    """
+    words = [(folded, original) for folded, original in
+             ((_term(word), word.rstrip('.-/')) for word in _TOKEN.findall(text.lower()))]
+    previous = ('', '')
+    for folded, original in words:
+        if folded:
+            yield folded, original
+            if previous[0]:
+                yield f"{previous[0]} {folded}", f"{previous[1]} {original}"
+        previous = (folded, original)
+
+
+def terms(text: str) -> Iterator[str]:
+    """
+    Yields the terms of text: its tokens and every pair of adjacent tokens.
+    """
+    previous = ''
+    for token in _tokens(text):
+        if token:
+            yield token
+            if previous:
+                yield f"{previous} {token}"
+        previous = token
+
+
+class JobVector(NamedTuple):
+    weights: Dict[str, float] # term -> weight
+    total: float # Sum of the weights
+    labels: Dict[str, str] # term -> wording used in the job description
+
+
+def job_vector(job_description: str) -> JobVector:
+    """
+    Builds the weighted term vector of a job description.
+    """
+    counts: Dict[str, int] = {}
+    labels: Dict[str, str] = {}
+    for term, original in _surface_forms(job_description):
+        counts[term] = counts.get(term, 0) + 1
+        labels.setdefault(term, original)
+    weights = {term: 1 + math.log(count) for term, count in counts.items() if ' ' not in term or count > 1}
+    return JobVector(weights, math.fsum(weights.values()), {term: labels[term] for term in weights})
+
+
+def cv_texts(cv_data: CVData) -> Iterator[str]:
+    """
+    Yields the CV text that is matched against job descriptions.
+    """
+    yield cv_data.personal_info.summary
+    for exp in cv_data.experience:
+        yield exp.title
+        yield exp.description
+    for edu in cv_data.education:
+        yield edu.degree
+        yield edu.major
+    skills = cv_data.skills
+    yield from skills.technical
+    yield from skills.soft
+    yield from skills.languages
+
+
+def cv_terms(cv_data: CVData) -> FrozenSet[str]:
+    """
+    The set of terms in a CV.
+    """
+    found = set()
+    for text in cv_texts(cv_data):
+        found.update(terms(text))
+    return frozenset(found)
+
+
+@dataclass(frozen=True)
+class KeywordScore:
+    score: float # Weighted share of the job description's terms found in the CV, 0-100
+    matched: Tuple[str, ...] # Most important first
+    missing: Tuple[str, ...] # Most important first
+
+    @property
+    def coverage(self) -> str:
+        return f"{len(self.matched)}/{len(self.matched) + len(self.missing)}"
+
+
+def score_terms(found: FrozenSet[str], job: JobVector) -> KeywordScore:
+    """
+    Scores a CV's terms against a job vector.
+    """
+    if not job.weights:
+        return KeywordScore(0.0, (), ())
+    matched = job.weights.keys() & found
+    ranked = sorted(job.weights, key=lambda term: (-job.weights[term], term))
+    score = 100 * math.fsum(job.weights[term] for term in matched) / job.total
+    return KeywordScore(round(score, 1),
+                        tuple(job.labels[term] for term in ranked if term in matched),
+                        tuple(job.labels[term] for term in ranked if term not in matched))
+
+
+def _cv_key(cv_data: CVData) -> Hashable:
+    # The values scoring depends on; cheaper than a full fingerprint on every rerun
+    return (cv_data.personal_info.summary,
+            tuple((exp.title, exp.description) for exp in cv_data.experience),
+            tuple((edu.degree, edu.major) for edu in cv_data.education),
+            tuple(cv_data.skills.technical), tuple(cv_data.skills.soft), tuple(cv_data.skills.languages))
+
+
+class KeywordScorer:
+    """
+    Scores CVs against job descriptions, caching the term vectors of recent CV versions
+    and job descriptions (LRU, max_entries each). Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cvs: "OrderedDict[Hashable, FrozenSet[str]]" = OrderedDict()
+        self._jobs: "OrderedDict[str, JobVector]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, entries: OrderedDict, key: Hashable, build):
+        with self._lock:
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = build()
+        with self._lock:
+            entries[key] = value
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return value
+
+    def cv_terms(self, cv_data: CVData) -> FrozenSet[str]:
+        return self._cached(self._cvs, _cv_key(cv_data), lambda: cv_terms(cv_data))
+
+    def job_vector(self, job_description: str) -> JobVector:
+        return self._cached(self._jobs, job_description, lambda: job_vector(job_description))
+
+    def score(self, cv_data: CVData, job_description: str) -> KeywordScore:
+        return score_terms(self.cv_terms(cv_data), self.job_vector(job_description))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cvs.clear()
+            self._jobs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "cvs": len(self._cvs), "jobs": len(self._jobs)}
+
+
+_DEFAULT_SCORER = KeywordScorer()
+
+
+def score_cv(cv_data: CVData, job_description: str) -> KeywordScore:
+    """
+    Scores cv_data against job_description using the shared, cached scorer.
+    """
+    return _DEFAULT_SCORER.score(cv_data, job_description)
@@ -0,0 +1,347 @@
+"""
+Bulk CV rendering from the command line.
+
+Reads a JSONL file (one CVData record per line), a JSON array of records or a binary CV
+stream written by serialization.dump_stream, renders each record to the requested
+formats and writes the files to an output directory:
+
+    python batch_render.py cvs.jsonl -o out/ -f pdf,docx,md --workers 8 --chunksize 16
+
+Records are rendered in a process pool; chunksize controls how many records are sent to
+a worker per task. A record that cannot be parsed or rendered is reported and skipped
+without stopping the batch; if the input itself turns out to be unreadable partway
+through, the records before the error are still rendered and the error is reported. The run ends with throughput and per-format latency percentiles.
+With --cache-dir, PDF/DOCX renders are kept in a disk cache (export_cache.DiskExportCache),
+so records unchanged since an earlier run are not rendered again.
+"""
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import serialization
+from models import CVData
+from cv_document import build_document
+from cv_builder import generate_cv_content
+from export_utils import export_to_pdf, export_to_docx, PDF_ENGINES, DOCX_ENGINES
+from export_cache import DiskExportCache
+
+FORMATS = ('pdf', 'docx', 'md')
+
+
+@dataclass
+class RenderOptions:
+    output_dir: str
+    formats: Tuple[str, ...] = FORMATS
+    theme: str = 'classic'
+    pdf_engine: str = 'platypus'
+    docx_engine: str = 'python-docx'
+    cache_dir: Optional[str] = None # Disk render cache shared by the workers and later runs
+    cache_max_bytes: int = 1024 * 1024 * 1024
+
+
+@dataclass
+class RecordResult:
+    index: int
+    files: Dict[str, str] = field(default_factory=dict) # Format -> written path
+    timings: Dict[str, float] = field(default_factory=dict) # Format -> render seconds
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchReport:
+    results: List[RecordResult]
+    elapsed: float
+
+    @property
+    def failures(self) -> List[RecordResult]:
+        return [result for result in self.results if result.error]
+
+    @property
+    def throughput(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latencies(self, fmt: str) -> List[float]:
+        return sorted(result.timings[fmt] for result in self.results if fmt in result.timings)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values (q in 0..100).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+_READ_SIZE = 1 << 16 # Characters read at a time from a JSON array file
+_WHITESPACE = re.compile(r'[ \t\n\r]*').match
+
+
+def _iter_json_array(f: TextIO) -> Iterator[object]:
+    """
+    Decodes the elements of the JSON array in f one at a time, reading only as much of
+    the file as the next element needs. Raises ValueError for malformed input, after
+    yielding the elements before it.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, at_eof = "", 0, False
+    expected = '[' # Then 'first' (an element or ']'), ',' (',' or ']') and 'element'
+    while True:
+        pos = _WHITESPACE(buffer, pos).end()
+        if pos == len(buffer):
+            if at_eof:
+                raise ValueError("Unterminated JSON array")
+            buffer, pos = f.read(_READ_SIZE), 0
+            at_eof = not buffer
+            continue
+        char = buffer[pos]
+        if expected == '[':
+            if char != '[':
+                raise ValueError("Expected a JSON array")
+            pos, expected = pos + 1, 'first'
+        elif char == ']' and expected != 'element':
+            return
+        elif expected == ',':
+            if char != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {buffer[pos:pos + 20]!r}")
+            pos, expected = pos + 1, 'element'
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                complete = end < len(buffer) or at_eof # A number at the end of the buffer may go on
+            except ValueError:
+                if at_eof:
+                    raise
+                complete = False
+            if not complete:
+                # Read at least as much again, so a large element is not re-parsed many times
+                more = f.read(max(_READ_SIZE, len(buffer) - pos))
+                at_eof = not more
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            yield value
+            pos, expected = end, ','
+
+
+def iter_records(path: str) -> Iterator[Tuple[int, object]]:
+    """
+    Yields (index, record) pairs from a JSON array, JSONL or binary CV stream file
+    (serialization.dump_stream). A JSONL line that is not valid JSON is yielded as the
+    ValueError it raised, so it fails only its own record; a malformed JSON array raises
+    ValueError when the iteration reaches the error. All formats are read incrementally.
+    Binary records are yielded undecoded and decoded by the worker that renders them.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(serialization.MAGIC)) == serialization.MAGIC:
+            f.seek(0)
+            yield from enumerate(serialization.iter_stream_records(f))
+            return
+    with open(path, encoding='utf-8') as f:
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == '[':
+            yield from enumerate(_iter_json_array(f))
+            return
+        index = 0
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield index, json.loads(line)
+            except ValueError as exc:
+                yield index, exc
+            index += 1
+
+
+def parse_record(record: object) -> CVData:
+    """
+    Decodes a record yielded by iter_records, raising the error of a record that could not
+    be read.
+    """
+    if isinstance(record, Exception):
+        raise record
+    if isinstance(record, bytes):
+        return serialization.decode_record(record)
+    return serialization.from_dict(record)
+
+
+def _file_stem(index: int, cv_data: CVData) -> str:
+    name = re.sub(r'[^\w-]+', '_', cv_data.personal_info.name).strip('_') or 'CV'
+    return f"{index:06d}_{name}"
+
+
+_DISK_CACHES: Dict[Tuple[str, int], DiskExportCache] = {}
+
+def _disk_cache(options: RenderOptions) -> Optional[DiskExportCache]:
+    """
+    The disk cache in options.cache_dir, opened once per process, or None without one. It
+    is passed to each export rather than installed with set_render_cache, so rendering in
+    the calling process leaves its render cache alone.
+    """
+    if not options.cache_dir:
+        return None
+    key = (options.cache_dir, options.cache_max_bytes)
+    cache = _DISK_CACHES.get(key)
+    if cache is None:
+        cache = _DISK_CACHES[key] = DiskExportCache(options.cache_dir, max_bytes=options.cache_max_bytes)
+    return cache
+
+
+def render_record(index: int, record: object, options: RenderOptions) -> RecordResult:
+    result = RecordResult(index)
+    try:
+        cache = _disk_cache(options) # An unusable cache directory fails each record, not the batch
+        cv_data = parse_record(record)
+        document = build_document(cv_data)
+        stem = os.path.join(options.output_dir, _file_stem(index, cv_data))
+        for fmt in options.formats:
+            start = time.perf_counter()
+            if fmt == 'pdf':
+                data = export_to_pdf(document, f"{stem}.pdf", theme=options.theme, engine=options.pdf_engine,
+                                     cache=cache).getvalue()
+            elif fmt == 'docx':
+                data = export_to_docx(document, f"{stem}.docx", engine=options.docx_engine, cache=cache).getvalue()
+            else:
+                data = generate_cv_content(document).encode('utf-8')
+            result.timings[fmt] = time.perf_counter() - start
+            path = f"{stem}.{fmt}"
+            with open(path, 'wb') as f:
+                f.write(data)
+            result.files[fmt] = path
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def _render_chunk(chunk: List[Tuple[int, object]], options: RenderOptions) -> List[RecordResult]:
+    return [render_record(index, record, options) for index, record in chunk]
+
+
+def _chunks(records: Iterable[Tuple[int, object]], size: int) -> Iterator[List[Tuple[int, object]]]:
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _read_records(records: Iterable[Tuple[int, object]], failed: List[RecordResult]) -> Iterator[Tuple[int, object]]:
+    """
+    Yields from records until reading them fails, then records the error in failed as the
+    result of the next index and stops.
+    """
+    iterator = iter(records)
+    index = -1
+    while True:
+        try:
+            index, record = next(iterator)
+        except StopIteration:
+            return
+        except Exception as exc:
+            failed.append(RecordResult(index + 1, error=f"{type(exc).__name__}: {exc}"))
+            return
+        yield index, record
+
+
+def render_batch(records: Iterable[Tuple[int, object]], options: RenderOptions,
+                 workers: Optional[int] = None, chunksize: int = 8) -> BatchReport:
+    """
+    Renders (index, record) pairs with a pool of worker processes. workers=1 renders in
+    the current process; None uses one per CPU. At most two chunks per worker are in
+    flight, so large inputs are never held in memory all at once. If reading the records
+    fails (a malformed JSON array, say), the records before it are still rendered and the
+    error is reported as a failure.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    os.makedirs(options.output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    results = []
+    input_errors: List[RecordResult] = []
+    chunks = _chunks(_read_records(records, input_errors), chunksize)
+    start = time.perf_counter()
+    if workers == 1:
+        for chunk in chunks:
+            results.extend(_render_chunk(chunk, options))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for chunk in chunks:
+                pending.append(executor.submit(_render_chunk, chunk, options))
+                if len(pending) >= 2 * workers:
+                    results.extend(pending.pop(0).result())
+            for future in pending:
+                results.extend(future.result())
+    results.extend(input_errors)
+    return BatchReport(results, time.perf_counter() - start)
+
+
+def format_report(report: BatchReport, formats: Sequence[str]) -> str:
+    lines = [f"Rendered {len(report.results) - len(report.failures)}/{len(report.results)} CVs "
+             f"in {report.elapsed:.2f}s ({report.throughput:.1f} CVs/s)"]
+    lines.append(f"{'format':<8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for fmt in formats:
+        latencies = report.latencies(fmt)
+        lines.append(f"{fmt:<8}{percentile(latencies, 50)*1000:>10.1f}{percentile(latencies, 95)*1000:>10.1f}"
+                     f"{(latencies[-1] if latencies else 0)*1000:>10.1f}")
+    for result in report.failures:
+        lines.append(f"record {result.index}: {result.error}")
+    return "\n".join(lines)
+
+
+def _parse_formats(value: str) -> Tuple[str, ...]:
+    formats = tuple(dict.fromkeys(fmt.strip() for fmt in value.split(',') if fmt.strip()))
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(f"formats must be a comma-separated subset of {', '.join(FORMATS)}")
+    return formats
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render CVData records from a JSON, JSONL or binary CV stream file in bulk.")
+    parser.add_argument("input", help="JSONL file (one record per line), JSON array of records or binary CV stream.")
+    parser.add_argument("-o", "--output-dir", default="rendered_cvs", help="Directory for the generated files.")
+    parser.add_argument("-f", "--formats", type=_parse_formats, default=FORMATS,
+                        help="Comma-separated formats to render (default: pdf,docx,md).")
+    parser.add_argument("-w", "--workers", type=_positive_int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunksize", type=_positive_int, default=8, help="Records sent to a worker per task.")
+    parser.add_argument("--theme", default='classic', help="PDF theme.")
+    parser.add_argument("--pdf-engine", choices=PDF_ENGINES, default='platypus')
+    parser.add_argument("--docx-engine", choices=DOCX_ENGINES, default='python-docx')
+    parser.add_argument("--cache-dir", default=None,
+                        help="Disk cache for rendered PDF/DOCX files; CVs rendered by an earlier run are copied from it.")
+    parser.add_argument("--cache-max-mb", type=int, default=1024, help="Size limit of the disk cache in MiB.")
+    args = parser.parse_args(argv)
+
+    options = RenderOptions(output_dir=args.output_dir, formats=args.formats, theme=args.theme,
+                            pdf_engine=args.pdf_engine, docx_engine=args.docx_engine,
+                            cache_dir=args.cache_dir, cache_max_bytes=args.cache_max_mb * 1024 * 1024)
+    report = render_batch(iter_records(args.input), options, workers=args.workers, chunksize=args.chunksize)
+    print(format_report(report, options.formats))
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
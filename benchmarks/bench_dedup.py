@@ -0,0 +1,89 @@
+"""
+Benchmarks near-duplicate detection (cv_dedup.DuplicateIndex) over synthetic corpora
+in which a share of the records are edited copies of earlier ones: time per record at
+ingest, recall of the planted duplicates and spurious matches, against comparing every
+new record with all earlier ones.
+
+Run from the repository root:
+    python -m benchmarks.bench_dedup [--sizes 1000,10000,50000] [--duplicates 0.1]
+"""
+import argparse
+import copy
+import random
+import time
+
+from benchmarks.synthetic import make_cv
+from cv_dedup import DuplicateIndex, signature, similarity
+
+PAIRWISE_SAMPLE = 200 # Records checked against all earlier ones; the full-corpus time is extrapolated
+
+
+def edited_copy(cv_data, rng):
+    """
+    A resubmission: new contact details, one reworded bullet and an extra skill.
+    """
+    cv_data = copy.deepcopy(cv_data)
+    cv_data.personal_info.phone = f"+44 {rng.randrange(10**9):09d}"
+    exp = cv_data.experience[rng.randrange(len(cv_data.experience))]
+    bullets = exp.description.split("\n")
+    bullets[rng.randrange(len(bullets))] = "Led the quarterly planning for the platform team."
+    exp.description = "\n".join(bullets)
+    cv_data.skills.technical.append("Rust")
+    return cv_data
+
+
+def make_corpus(size, duplicate_share, seed=0):
+    """
+    Returns (records, planted) where planted maps a copy's position to its original's.
+    """
+    rng = random.Random(seed)
+    records, planted = [], {}
+    for position in range(size):
+        if records and rng.random() < duplicate_share:
+            original = rng.randrange(len(records))
+            planted[position] = planted.get(original, original)
+            records.append(edited_copy(records[original], rng))
+        else:
+            records.append(make_cv(seed=position))
+    return records, planted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated corpus sizes.")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Share of records that are edited copies.")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    args = parser.parse_args()
+
+    print(f"{'CVs':>8}{'signature us':>14}{'index us':>10}{'recall':>8}{'spurious':>10}{'all-pairs us':>14}{'speed-up':>10}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        records, planted = make_corpus(size, args.duplicates)
+
+        start = time.perf_counter()
+        signatures = [signature(cv_data) for cv_data in records]
+        signing = (time.perf_counter() - start) / size
+
+        index = DuplicateIndex(args.threshold)
+        found = {}
+        start = time.perf_counter()
+        for position, sig in enumerate(signatures):
+            found[position] = {duplicate.key for duplicate in index.add_signature(position, sig)}
+        indexing = (time.perf_counter() - start) / size
+
+        # A planted copy is found when it is flagged against its original or another copy of it
+        hits = sum(bool(found[copy]) for copy in planted)
+        spurious = sum(1 for position, keys in found.items() for key in keys
+                       if planted.get(position, position) != planted.get(key, key))
+
+        # Baseline: compare each of the last records with every earlier signature
+        start = time.perf_counter()
+        for position in range(size - min(PAIRWISE_SAMPLE, size), size):
+            [other for other in range(position) if similarity(signatures[position], signatures[other]) >= args.threshold]
+        pairwise = (time.perf_counter() - start) / min(PAIRWISE_SAMPLE, size) / 2 # Average record sees half the corpus
+
+        print(f"{size:>8}{signing * 1e6:>14.0f}{indexing * 1e6:>10.1f}{hits / max(len(planted), 1):>8.1%}{spurious:>10}"
+              f"{pairwise * 1e6:>14.0f}{pairwise / indexing:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
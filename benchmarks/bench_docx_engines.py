@@ -0,0 +1,46 @@
+"""
+Compares the python-docx and streaming DOCX engines for bulk generation.
+
+Run from the repository root:
+    python -m benchmarks.bench_docx_engines [--count N]
+"""
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_cv, ten_page_cv
+from export_utils import export_to_docx, DOCX_ENGINES
+
+
+def run(cvs, engine: str):
+    export_to_docx(cvs[0], "bench.docx", engine=engine) # Warm up the template/skeleton
+    tracemalloc.start()
+    start = time.perf_counter()
+    total_bytes = 0
+    for cv_data in cvs:
+        total_bytes += export_to_docx(cv_data, "bench.docx", engine=engine).getbuffer().nbytes
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="Number of typical CVs to generate per engine.")
+    args = parser.parse_args()
+
+    workloads = (
+        (f"{args.count} typical", [make_cv(seed=seed) for seed in range(args.count)]),
+        ("10-page x20", [ten_page_cv(seed=seed) for seed in range(20)]),
+    )
+    print(f"{'workload':<14}{'engine':<13}{'total s':>9}{'CVs/s':>9}{'peak KiB':>10}{'avg KiB':>9}")
+    for label, cvs in workloads:
+        for engine in DOCX_ENGINES:
+            elapsed, peak, total_bytes = run(cvs, engine)
+            print(f"{label:<14}{engine:<13}{elapsed:>9.2f}{len(cvs)/elapsed:>9.0f}{peak/1024:>10.0f}"
+                  f"{total_bytes/len(cvs)/1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
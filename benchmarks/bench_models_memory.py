@@ -0,0 +1,75 @@
+"""
+Measures the memory held per CV by the models: plain dataclasses (the previous
+models, rebuilt here with a per-instance __dict__ and no interning) against the
+slotted, interning CVData and its frozen variant.
+
+Records go through JSON first, like the batch pipeline and session state, so every
+record starts out with its own copies of the repeated strings.
+
+Run from the repository root:
+    python -m benchmarks.bench_models_memory [--count N]
+"""
+import argparse
+import json
+import tracemalloc
+from dataclasses import asdict, field, fields, make_dataclass
+
+import models
+from benchmarks.synthetic import iter_cvs
+
+
+def _plain(cls):
+    """
+    Same fields as cls, as a plain dataclass without slots or interning.
+    """
+    return make_dataclass(cls.__name__, [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory)) for f in fields(cls)
+    ])
+
+
+_PLAIN = {name: _plain(getattr(models, name))
+          for name in ('PersonalInformation', 'Education', 'Experience', 'Skills', 'CVData')}
+
+
+def plain_from_dict(data):
+    return _PLAIN['CVData'](
+        personal_info=_PLAIN['PersonalInformation'](**data["personal_info"]),
+        education=[_PLAIN['Education'](**item) for item in data["education"]],
+        experience=[_PLAIN['Experience'](**item) for item in data["experience"]],
+        skills=_PLAIN['Skills'](**data["skills"]),
+    )
+
+
+def measure(payloads, build):
+    """
+    Returns the bytes per CV still allocated after building every payload.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build(json.loads(payload)) for payload in payloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(held)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="Number of CVs to hold in memory.")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(asdict(cv_data)) for cv_data in iter_cvs(args.count)]
+    variants = (
+        ("plain dataclasses", plain_from_dict),
+        ("slotted CVData", models.CVData.from_dict),
+        ("frozen CVData", lambda data: models.CVData.from_dict(data).freeze()),
+    )
+    baseline = None
+    print(f"{'models':<20}{'bytes/CV':>10}{'vs plain':>10}")
+    for label, build in variants:
+        per_cv = measure(payloads, build)
+        baseline = baseline or per_cv
+        print(f"{label:<20}{per_cv:>10.0f}{per_cv / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares the platypus and canvas PDF engines on a typical CV and a ~10-page CV.
+
+Run from the repository root:
+    python -m benchmarks.bench_pdf_engines [--repeat N]
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.synthetic import typical_cv, ten_page_cv
+from export_utils import export_to_pdf, PDF_ENGINES
+
+
+def time_export(cv_data, engine: str, repeat: int) -> float:
+    export_to_pdf(cv_data, "bench.pdf", engine=engine) # Warm up fonts and the theme registry
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        export_to_pdf(cv_data, "bench.pdf", engine=engine)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def count_pages(data: bytes) -> int:
+    return data.count(b"/Type /Page\n") + data.count(b"/Type /Page ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per engine and CV (median is reported).")
+    args = parser.parse_args()
+
+    print(f"{'cv':<10}{'pages':>6}" + "".join(f"{engine + ' ms':>14}" for engine in PDF_ENGINES) + f"{'speedup':>10}")
+    for label, cv_data in (("typical", typical_cv()), ("10-page", ten_page_cv())):
+        pages = count_pages(export_to_pdf(cv_data, "bench.pdf").getvalue())
+        timings = {engine: time_export(cv_data, engine, args.repeat) for engine in PDF_ENGINES}
+        speedup = timings['platypus'] / timings['canvas']
+        print(f"{label:<10}{pages:>6}" + "".join(f"{timings[engine]*1000:>14.2f}" for engine in PDF_ENGINES)
+              + f"{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmarks cv_ranking.CVIndex over synthetic corpora of increasing size: index build,
+incremental updates and top-k ranking of job descriptions, against scoring every
+(CV, job) pair with ats_score.
+
+Run from the repository root:
+    python -m benchmarks.bench_ranking [--sizes 1000,10000,50000] [--jobs 100] [-k 20]
+"""
+import argparse
+import heapq
+import time
+
+from ats_score import KeywordScorer
+from benchmarks.synthetic import keyword_cv, job_description
+from cv_ranking import CVIndex
+
+PAIRWISE_SAMPLE = 2000 # CVs scored pairwise per size; the full-corpus time is extrapolated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated corpus sizes.")
+    parser.add_argument("--jobs", type=int, default=100, help="Job descriptions ranked per size.")
+    parser.add_argument("-k", type=int, default=20, help="CVs returned per job.")
+    parser.add_argument("--weighting", choices=('keywords', 'tfidf'), default='keywords')
+    args = parser.parse_args()
+
+    jobs = [job_description(seed) for seed in range(args.jobs)]
+    print(f"{'CVs':>8}{'build s':>10}{'update us':>11}{'top-k ms/job':>14}{'pairwise ms/job':>17}{'speed-up':>10}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        cvs = [keyword_cv(seed) for seed in range(size)]
+
+        start = time.perf_counter()
+        index = CVIndex(args.weighting)
+        index.add_many(enumerate(cvs))
+        build = time.perf_counter() - start
+
+        # Replace 1% of the corpus with other CVs
+        replacements = [keyword_cv(size + seed) for seed in range(max(size // 100, 1))]
+        start = time.perf_counter()
+        for key, cv_data in enumerate(replacements):
+            index.add(key, cv_data)
+        update = (time.perf_counter() - start) / len(replacements)
+
+        start = time.perf_counter()
+        for text in jobs:
+            index.top_k(text, args.k)
+        ranked = (time.perf_counter() - start) / len(jobs)
+
+        # Pairwise baseline: ats_score with warm caches, on a sample of the corpus
+        sample = cvs[:PAIRWISE_SAMPLE]
+        scorer = KeywordScorer(max_entries=len(sample) + len(jobs))
+        for cv_data in sample:
+            scorer.cv_terms(cv_data)
+        start = time.perf_counter()
+        for text in jobs[:10]:
+            heapq.nlargest(args.k, range(len(sample)), key=lambda i: scorer.score(sample[i], text).score)
+        pairwise = (time.perf_counter() - start) / min(len(jobs), 10) * size / len(sample)
+
+        print(f"{size:>8}{build:>10.2f}{update * 1e6:>11.0f}{ranked * 1e3:>14.2f}{pairwise * 1e3:>17.1f}"
+              f"{pairwise / ranked:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares the serialization formats in serialization.py with a naive
+dataclasses.asdict + json round trip.
+
+Run from the repository root:
+    python -m benchmarks.bench_serialization [--count N] [--repeat N]
+"""
+import argparse
+import io
+import json
+import time
+from dataclasses import asdict
+
+import serialization
+from benchmarks.synthetic import iter_cvs
+from models import CVData
+
+
+def naive_encode(cv_data):
+    return json.dumps(asdict(cv_data))
+
+
+def naive_decode(text):
+    return CVData.from_dict(json.loads(text))
+
+
+def best_of(repeat, func):
+    """
+    Returns (fastest time, result) over repeat calls.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def bench(cvs, encode, decode, repeat):
+    encode_time, encoded = best_of(repeat, lambda: [encode(cv_data) for cv_data in cvs])
+    decode_time, decoded = best_of(repeat, lambda: [decode(data) for data in encoded])
+    assert decoded == cvs
+    size = sum(len(data.encode("utf-8") if isinstance(data, str) else data) for data in encoded)
+    return encode_time, decode_time, size
+
+
+def bench_stream(cvs, repeat):
+    def dump():
+        buffer = io.BytesIO()
+        serialization.dump_stream(cvs, buffer)
+        return buffer
+
+    encode_time, buffer = best_of(repeat, dump)
+    decode_time, decoded = best_of(repeat, lambda: list(serialization.iter_load_stream(io.BytesIO(buffer.getvalue()))))
+    assert decoded == cvs
+    return encode_time, decode_time, buffer.getbuffer().nbytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="Number of CVs to round-trip.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is reported.")
+    args = parser.parse_args()
+
+    cvs = list(iter_cvs(args.count))
+    results = (
+        ("asdict + json", bench(cvs, naive_encode, naive_decode, args.repeat)),
+        ("to_json/from_json", bench(cvs, serialization.to_json, serialization.from_json, args.repeat)),
+        ("to_bytes/from_bytes", bench(cvs, serialization.to_bytes, serialization.from_bytes, args.repeat)),
+        ("binary stream", bench_stream(cvs, args.repeat)),
+    )
+    print(f"{'format':<22}{'encode us':>11}{'decode us':>11}{'bytes/CV':>10}")
+    for label, (encode_time, decode_time, size) in results:
+        print(f"{label:<22}{encode_time/len(cvs)*1e6:>11.1f}{decode_time/len(cvs)*1e6:>11.1f}{size/len(cvs):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measures import (startup) time of the app's modules with python -X importtime.
+
+Each module is imported in a fresh interpreter; the report shows its cumulative import
+time, whether the ReportLab/python-docx backends were loaded, and the heaviest imports.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [--modules export_utils,app] [--top N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, NamedTuple, Sequence
+
+HEAVY_BACKENDS = ('reportlab', 'docx')
+DEFAULT_MODULES = ('models', 'cv_builder', 'export_utils', 'batch_render', 'render_service', 'app')
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTime(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int # 0 for imports made by the -c code itself, 1 for what those imported, ...
+
+
+def import_times(module: str, code: str = '') -> List[ImportTime]:
+    """
+    Imports module (then runs code) in a fresh interpreter and returns one entry per
+    imported module, in the order -X importtime reports them. Raises RuntimeError if the
+    import fails.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}\n{code}"],
+                            cwd=_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {result.stderr.strip().splitlines()[-1]}")
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), depth))
+    return times
+
+
+def loaded_backends(times: Sequence[ImportTime]) -> List[str]:
+    return sorted({entry.name.split('.')[0] for entry in times if entry.name.split('.')[0] in HEAVY_BACKENDS})
+
+
+def module_time(times: Sequence[ImportTime], module: str) -> ImportTime:
+    return next(entry for entry in reversed(times) if entry.name == module and entry.depth == 0)
+
+
+def direct_imports(times: Sequence[ImportTime], module: str) -> List[ImportTime]:
+    """
+    Imports made directly by module, heaviest first. -X importtime reports an import after
+    everything it imported, so they are the depth-1 entries just before the module.
+    """
+    index = max(i for i, entry in enumerate(times) if entry.name == module and entry.depth == 0)
+    children = []
+    for entry in reversed(times[:index]):
+        if entry.depth == 0:
+            break
+        if entry.depth == 1:
+            children.append(entry)
+    return sorted(children, key=lambda entry: entry.cumulative_us, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", default=",".join(DEFAULT_MODULES), help="Comma-separated modules to import.")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest direct imports listed per module.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module (median is reported).")
+    args = parser.parse_args()
+
+    print(f"{'module':<16}{'import ms':>11}  backends")
+    for module in filter(None, (name.strip() for name in args.modules.split(','))):
+        try:
+            runs = [import_times(module) for _ in range(args.repeat)]
+        except RuntimeError as exc:
+            print(f"{module:<16}{'-':>11}  {exc}")
+            continue
+        total = statistics.median(module_time(times, module).cumulative_us for times in runs)
+        print(f"{module:<16}{total / 1000:>11.1f}  {', '.join(loaded_backends(runs[0])) or 'none'}")
+        for entry in direct_imports(runs[0], module)[:args.top]:
+            print(f"  {entry.name:<30}{entry.cumulative_us / 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmarks taxonomy.Taxonomy on a synthetic taxonomy: build time, index size, time to
+open the memory-mapped index, and suggestion latency per keystroke (every prefix of
+sampled names) and for misspelled queries.
+
+Run from the repository root:
+    python -m benchmarks.bench_taxonomy [--entries 200000] [--queries 500]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from taxonomy import Taxonomy, build_index
+
+
+def synthetic_entries(count: int, seed: int = 0):
+    """
+    count distinct names of one to four pseudo-words, with Zipf-like weights and an
+    alias for every tenth entry.
+    """
+    rng = random.Random(seed)
+    syllables = [consonant + vowel for consonant in "bcdfghjklmnpqrstvwxyz" for vowel in "aeiou"]
+    words = list({"".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(20000)})
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.choice(words).capitalize() for _ in range(rng.randint(1, 4))))
+    for rank, name in enumerate(sorted(names, key=lambda name: rng.random()), 1):
+        aliases = ["".join(word[0] for word in name.split()) + str(rank)] if rank % 10 == 0 else []
+        yield name, 1_000_000 // rank, aliases
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    position = rng.randrange(len(name) - 1)
+    return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=500, help="Names whose every prefix is looked up.")
+    parser.add_argument("--limit", type=int, default=10, help="Suggestions per lookup.")
+    args = parser.parse_args()
+
+    entries = list(synthetic_entries(args.entries))
+    start = time.perf_counter()
+    data = build_index(entries)
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.idx")
+        with open(path, 'wb') as f:
+            f.write(data)
+        start = time.perf_counter()
+        taxonomy = Taxonomy.open(path)
+        opened = time.perf_counter() - start
+
+        rng = random.Random(1)
+        sample = [rng.choice(entries)[0] for _ in range(args.queries)]
+        keystrokes = []
+        for name in sample:
+            for end in range(1, len(name) + 1):
+                start = time.perf_counter()
+                taxonomy.search(name[:end], args.limit)
+                keystrokes.append(time.perf_counter() - start)
+        typos, found = [], 0
+        for name in sample:
+            query = misspell(name, rng)
+            start = time.perf_counter()
+            suggestions = taxonomy.search(query, args.limit)
+            typos.append(time.perf_counter() - start)
+            found += name in suggestions
+        del taxonomy # Release the mapping before the directory is removed
+
+    print(f"{len(entries)} entries: built in {build:.1f} s, {len(data) / 1024 / 1024:.1f} MiB, opened in {opened * 1e3:.2f} ms")
+    p50, p99 = percentiles(keystrokes)
+    print(f"per keystroke ({len(keystrokes)} lookups): p50 {p50 * 1e6:.0f} us, p99 {p99 * 1e6:.0f} us")
+    p50, p99 = percentiles(typos)
+    print(f"misspelled names ({len(typos)} lookups): p50 {p50 * 1e6:.0f} us, p99 {p99 * 1e6:.0f} us, "
+          f"intended name suggested {found / len(typos):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmarks CV validation (validation.py): time per record for a typical and a ten-page
+CV, uncached, answered from the cache and keyed by a SHA-256 fingerprint instead, and
+the throughput of validate_records over a corpus of serialized records by worker count.
+
+Run from the repository root:
+    python -m benchmarks.bench_validation [--records 20000] [--workers 1,2,4]
+"""
+import argparse
+import time
+
+import serialization
+from benchmarks.synthetic import make_cv, ten_page_cv
+from export_cache import fingerprint
+from validation import Validator, validate_records
+
+
+def per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="Records in the batch corpus.")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts.")
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'CV':<10}{'uncached us':>13}{'cached us':>11}{'sha-256 key us':>16}")
+    for label, cv_data in (("typical", make_cv(seed=1)), ("ten-page", ten_page_cv(seed=1))):
+        validator = Validator()
+        uncached = per_call(lambda: validator.issues(cv_data), args.repeat)
+        cached = per_call(lambda: validator.validate(cv_data), args.repeat)
+        # What a cache keyed by export_cache.fingerprint would pay per lookup, before any validation
+        hashed = per_call(lambda: fingerprint(cv_data), max(args.repeat // 10, 1))
+        print(f"{label:<10}{uncached * 1e6:>13.1f}{cached * 1e6:>11.1f}{hashed * 1e6:>16.1f}")
+
+    records = [(index, serialization.encode_record(make_cv(seed=index))) for index in range(args.records)]
+    print(f"\n{'workers':>8}{'records/s':>12}{'invalid':>9}")
+    for workers in (int(value) for value in args.workers.split(',')):
+        start = time.perf_counter()
+        invalid = sum(not result.valid for result in validate_records(records, workers=workers, chunksize=args.chunksize))
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>8}{len(records) / elapsed:>12.0f}{invalid:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Regression benchmark suite for cv_builder and export_utils over synthetic CVs.
+
+Each scenario is a synthetic CV (benchmarks.synthetic.make_cv) sized by its number of
+education/experience entries, words per description bullet and skill count. For every
+scenario and output target it records the median latency, the peak traced memory of one
+render and the output size. Results can be saved as a JSON baseline and later compared
+against it; compare mode exits with status 1 when a metric regresses past its threshold.
+
+Run from the repository root:
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json [--latency-threshold 0.25]
+"""
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from benchmarks.synthetic import make_cv
+from cv_builder import generate_cv_content
+from export_utils import export_to_pdf, export_to_docx
+from models import CVData
+
+SUITE_VERSION = 1 # Bump when scenarios or metrics change meaning; baselines of another version are rejected
+
+TARGETS: Dict[str, Callable[[CVData], int]] = {
+    "md": lambda cv_data: len(generate_cv_content(cv_data).encode("utf-8")),
+    "pdf": lambda cv_data: export_to_pdf(cv_data, "bench.pdf").getbuffer().nbytes,
+    "pdf-canvas": lambda cv_data: export_to_pdf(cv_data, "bench.pdf", engine='canvas').getbuffer().nbytes,
+    "docx": lambda cv_data: export_to_docx(cv_data, "bench.docx").getbuffer().nbytes,
+    "docx-stream": lambda cv_data: export_to_docx(cv_data, "bench.docx", engine='stream').getbuffer().nbytes,
+    "pdf-small": lambda cv_data: export_to_pdf(cv_data, "bench.pdf", optimize_size=True).getbuffer().nbytes,
+    "docx-small": lambda cv_data: export_to_docx(cv_data, "bench.docx", optimize_size=True).getbuffer().nbytes,
+}
+
+# Allowed relative increase per metric before compare reports a regression
+DEFAULT_THRESHOLDS = {"latency_ms": 0.25, "peak_kib": 0.10, "size_bytes": 0.05}
+
+
+def scenario_name(entries: int, words: int, skills: int) -> str:
+    return f"e{entries}-w{words}-s{skills}"
+
+
+def scenario_cv(entries: int, words: int, skills: int) -> CVData:
+    return make_cv(n_education=max(entries // 4, 1), n_experience=entries, words_per_bullet=words,
+                   n_skills=skills, summary_words=words * 3)
+
+
+def measure(render: Callable[[CVData], int], cv_data: CVData, repeat: int) -> Dict[str, float]:
+    """
+    Median latency over repeat renders, then the peak memory of one more traced render.
+    """
+    size = render(cv_data) # Warm up fonts, stylesheets and templates
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(cv_data)
+        samples.append(time.perf_counter() - start)
+    tracemalloc.start()
+    render(cv_data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"latency_ms": statistics.median(samples) * 1000, "peak_kib": peak / 1024, "size_bytes": size}
+
+
+def run_suite(entries: Iterable[int], words: Iterable[int], skills: Iterable[int], targets: Sequence[str],
+              repeat: int, progress: Optional[Callable[[str], None]] = None) -> Dict[str, object]:
+    results = {}
+    for params in itertools.product(entries, words, skills):
+        cv_data = scenario_cv(*params)
+        for target in targets:
+            key = f"{scenario_name(*params)}/{target}"
+            results[key] = measure(TARGETS[target], cv_data, repeat)
+            if progress:
+                progress(key)
+    return {
+        "version": SUITE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object],
+            thresholds: Dict[str, float] = DEFAULT_THRESHOLDS) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Returns (key, metric, baseline, current, relative change) for every metric of a
+    result present in both runs that grew by more than its threshold.
+    """
+    if baseline.get("version") != SUITE_VERSION:
+        raise ValueError(f"Baseline was written by suite version {baseline.get('version')}, not {SUITE_VERSION}")
+    regressions = []
+    for key, metrics in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            continue
+        for metric, threshold in thresholds.items():
+            old, new = before.get(metric), metrics.get(metric)
+            if old is None or new is None or old <= 0:
+                continue
+            change = new / old - 1
+            if change > threshold:
+                regressions.append((key, metric, old, new, change))
+    return regressions
+
+
+def format_results(report: Dict[str, object], baseline: Optional[Dict[str, object]] = None) -> str:
+    lines = [f"{'scenario/target':<28}{'ms':>10}{'peak KiB':>10}{'bytes':>10}" + (f"{'ms vs base':>12}" if baseline else "")]
+    for key, metrics in report["results"].items():
+        line = f"{key:<28}{metrics['latency_ms']:>10.2f}{metrics['peak_kib']:>10.0f}{metrics['size_bytes']:>10.0f}"
+        before = baseline["results"].get(key) if baseline else None
+        if before:
+            line += f"{metrics['latency_ms'] / before['latency_ms'] - 1:>+12.1%}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def _target_list(value: str) -> List[str]:
+    targets = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [target for target in targets if target not in TARGETS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown target(s): {', '.join(unknown)} (choose from {', '.join(TARGETS)})")
+    return targets
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=_int_list, default=[3, 25], help="Experience entries per CV (comma-separated).")
+    parser.add_argument("--words", type=_int_list, default=[14, 40], help="Words per description bullet (comma-separated).")
+    parser.add_argument("--skills", type=_int_list, default=[6, 60], help="Technical skills per CV (comma-separated).")
+    parser.add_argument("--targets", type=_target_list, default=list(TARGETS), help="Comma-separated output targets.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement (median is reported).")
+    parser.add_argument("--save", metavar="PATH", help="Write the results to a JSON baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a JSON baseline; exit 1 on regressions.")
+    for metric, threshold in DEFAULT_THRESHOLDS.items():
+        parser.add_argument(f"--{metric.split('_')[0]}-threshold", type=float, default=threshold, dest=metric,
+                            help=f"Allowed relative increase in {metric} (default: {threshold}).")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = run_suite(args.entries, args.words, args.skills, args.targets, args.repeat,
+                       progress=lambda key: print(f"  {key}", file=sys.stderr))
+    print(format_results(report, baseline))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {len(report['results'])} results to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(baseline, report, {metric: getattr(args, metric) for metric in DEFAULT_THRESHOLDS})
+        for key, metric, old, new, change in regressions:
+            print(f"REGRESSION {key} {metric}: {old:.2f} -> {new:.2f} ({change:+.1%})")
+        if regressions:
+            return 1
+        print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Deterministic synthetic CVData generators for benchmarks.
+"""
+import random
+from typing import Iterator, List, Tuple
+
+from models import PersonalInformation, Education, Experience, Skills, CVData
+
+_WORDS = ("design", "deliver", "scalable", "services", "team", "customer", "data", "platform", "migration",
+          "reduced", "latency", "improved", "revenue", "pipeline", "automated", "testing", "cloud", "budget",
+          "stakeholders", "roadmap", "analysis", "security", "release", "mentored", "engineers", "quality")
+_DEGREES = ("Bachelor of Science", "Master of Arts", "PhD", "MBA", "Associate Degree")
+_TITLES = ("Software Engineer", "Data Scientist", "Project Manager", "DevOps Engineer", "Business Analyst")
+_SKILLS = ("Python", "SQL", "AWS", "Docker", "Kubernetes", "Java", "Go", "React", "Terraform", "Spark",
+           "Communication", "Leadership", "Negotiation", "Teamwork", "English", "Spanish", "French", "German")
+
+
+def make_cv(n_education: int = 2, n_experience: int = 3, bullets_per_job: int = 4, words_per_bullet: int = 14,
+            n_skills: int = 6, summary_words: int = 40, seed: int = 0) -> CVData:
+    rng = random.Random(seed)
+
+    def sentence(n_words):
+        return " ".join(rng.choice(_WORDS) for _ in range(n_words)).capitalize() + "."
+
+    personal_info = PersonalInformation(
+        name=f"Candidate {seed}",
+        email=f"candidate{seed}@example.com",
+        phone="+1 123 456 7890",
+        linkedin=f"https://linkedin.com/in/candidate{seed}",
+        github=f"https://github.com/candidate{seed}",
+        summary=sentence(summary_words),
+    )
+    education = [
+        Education(degree=rng.choice(_DEGREES), major="Computer Science", institution=f"University {i}",
+                  location="London, UK", start_date=f"{2000 + i}-09", end_date=f"{2004 + i}-06",
+                  gpa="3.8" if i % 2 else None)
+        for i in range(n_education)
+    ]
+    experience = [
+        Experience(title=rng.choice(_TITLES), company=f"Company {i}", location="Berlin, Germany",
+                   start_date=f"{2010 + i}-01", end_date=f"{2011 + i}-01",
+                   description="\n".join(sentence(words_per_bullet) for _ in range(bullets_per_job)))
+        for i in range(n_experience)
+    ]
+    skills = Skills(
+        technical=[rng.choice(_SKILLS[:10]) for _ in range(n_skills)],
+        soft=[rng.choice(_SKILLS[10:14]) for _ in range(max(n_skills // 2, 1))],
+        languages=[rng.choice(_SKILLS[14:]) for _ in range(max(n_skills // 3, 1))],
+    )
+    return CVData(personal_info=personal_info, education=education, experience=experience, skills=skills)
+
+
+def typical_cv(seed: int = 0) -> CVData:
+    return make_cv(seed=seed)
+
+
+def ten_page_cv(seed: int = 0) -> CVData:
+    return make_cv(n_education=4, n_experience=25, bullets_per_job=6, words_per_bullet=22, n_skills=30, seed=seed)
+
+
+def iter_cvs(count: int, **kwargs) -> Iterator[CVData]:
+    for seed in range(count):
+        yield make_cv(seed=seed, **kwargs)
+
+
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "to", "vi", "ze", "do", "pa", "qu", "ri", "fu", "be", "go")
+
+
+def vocabulary(size: int = 3000) -> Tuple[str, ...]:
+    """
+    size distinct pseudo-words ("kalo", "lolo", ...), for corpora with a realistic number of distinct terms.
+    """
+    words = []
+    for n in range(size):
+        word = ""
+        n += len(_SYLLABLES)
+        while n:
+            n, digit = divmod(n, len(_SYLLABLES))
+            word += _SYLLABLES[digit]
+        words.append(word)
+    return tuple(words)
+
+
+def _zipf_words(rng: random.Random, words: Tuple[str, ...], count: int) -> List[str]:
+    # Word frequencies fall off as 1/rank, as in natural text
+    return rng.choices(words, cum_weights=_zipf_weights(len(words)), k=count)
+
+
+_ZIPF_WEIGHTS = {}
+
+
+def _zipf_weights(size: int) -> List[float]:
+    if size not in _ZIPF_WEIGHTS:
+        total, weights = 0.0, []
+        for rank in range(1, size + 1):
+            total += 1 / rank
+            weights.append(total)
+        _ZIPF_WEIGHTS[size] = weights
+    return _ZIPF_WEIGHTS[size]
+
+
+def keyword_cv(seed: int = 0, words: Tuple[str, ...] = vocabulary()) -> CVData:
+    """
+    A typical-size CV whose summary, descriptions and skills are drawn from words.
+    """
+    rng = random.Random(seed)
+    cv_data = make_cv(seed=seed)
+    cv_data.personal_info.summary = " ".join(_zipf_words(rng, words, 40))
+    for exp in cv_data.experience:
+        exp.description = "\n".join("- " + " ".join(_zipf_words(rng, words, 14)) for _ in range(4))
+    cv_data.skills.technical = _zipf_words(rng, words, 8)
+    return cv_data
+
+
+def job_description(seed: int = 0, n_words: int = 120, words: Tuple[str, ...] = vocabulary()) -> str:
+    rng = random.Random(-1 - seed)
+    return " ".join(_zipf_words(rng, words, n_words))
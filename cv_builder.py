@@ -1,64 +1,134 @@
+from dataclasses import fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, Hashable, Iterator, List, TextIO, Tuple, Union
+
 from models import PersonalInformation, Education, Experience, Skills, CVData
+from cv_document import (CVDocument, Entry, Run, contact_items, education_entry, experience_entry,
+                         iter_section_parts, skill_lines)
+
+def _markdown(runs) -> str:
+    return "".join(f"**{run.text}**" if run.bold else run.text for run in runs)
+
+def _header_markdown(name: str, contacts) -> str:
+    if contacts:
+        return f"# {name}\n" + " | ".join(contact.labelled for contact in contacts) + "\n\n"
+    return f"# {name}\n"
 
-def generate_cv_content(cv_data: CVData) -> str:
+def _paragraphs_markdown(paragraphs) -> str:
+    return "".join(_markdown(paragraph) + "\n" for paragraph in paragraphs) + "\n"
+
+def _entry_markdown(section_key: str, entry: Entry) -> str:
+    if section_key == 'experience':
+        # Experience keeps its location on the heading line
+        lines = [f"- {_markdown(entry.heading)}, {entry.place}\n"]
+    else:
+        lines = [f"- {_markdown(entry.heading)}\n", f"  {entry.place}\n"]
+    lines.append(f"  {entry.start_date} - {entry.end_date}\n")
+    if entry.gpa:
+        lines.append(f"  GPA: {entry.gpa}\n")
+    lines.extend(f"  - {bullet}\n" for bullet in entry.bullets)
+    lines.append("\n")
+    return "".join(lines)
+
+def iter_cv_content(cv_data: Union[CVData, CVDocument]) -> Iterator[str]:
     """
-    Generates the CV content in markdown format from structured CVData.
+    Yields the markdown CV in chunks: the header, then each section title, paragraph
+    block and entry. Large CVs can be streamed to a file or socket chunk by chunk; CVData
+    is walked lazily, so only the entry being written is held in memory.
     """
-    cv_content = ""
+    if isinstance(cv_data, CVDocument):
+        name, contacts = cv_data.name, cv_data.contacts
+        sections = ((section.key, section.title, section.paragraphs, section.entries) for section in cv_data.sections)
+    else:
+        name, contacts = cv_data.personal_info.name, contact_items(cv_data.personal_info)
+        sections = iter_section_parts(cv_data)
 
     # Personal Information
-    if cv_data.personal_info.name:
-        cv_content += f"# {cv_data.personal_info.name}\n"
-        contact_details = []
-        if cv_data.personal_info.email:
-            contact_details.append(cv_data.personal_info.email)
-        if cv_data.personal_info.phone:
-            contact_details.append(cv_data.personal_info.phone)
-        if cv_data.personal_info.linkedin:
-            contact_details.append(f"LinkedIn: {cv_data.personal_info.linkedin}")
-        if cv_data.personal_info.github:
-            contact_details.append(f"GitHub: {cv_data.personal_info.github}")
-        
-        if contact_details:
-            cv_content += " | ".join(contact_details) + "\n\n"
-
-    # Summary/Objective (Optional)
-    if cv_data.personal_info.summary:
-        cv_content += f"## Summary\n{cv_data.personal_info.summary}\n\n"
-
-    # Education
-    if cv_data.education:
-        cv_content += "## Education\n"
-        for edu in cv_data.education:
-            cv_content += f"- **{edu.degree}** in {edu.major}\n"
-            cv_content += f"  {edu.institution}, {edu.location}\n"
-            cv_content += f"  {edu.start_date} - {edu.end_date}\n"
-            if edu.gpa:
-                cv_content += f"  GPA: {edu.gpa}\n"
-            cv_content += "\n"
-
-    # Experience
-    if cv_data.experience:
-        cv_content += "## Experience\n"
-        for exp in cv_data.experience:
-            cv_content += f"- **{exp.title}** at {exp.company}, {exp.location}\n"
-            cv_content += f"  {exp.start_date} - {exp.end_date}\n"
-            # Format description as bullet points
-            if exp.description:
-                for line in exp.description.split('\n'):
-                    if line.strip(): # Only add non-empty lines
-                        cv_content += f"  - {line.strip()}\n"
-            cv_content += "\n"
-
-    # Skills
-    if cv_data.skills.technical or cv_data.skills.soft or cv_data.skills.languages:
-        cv_content += "## Skills\n"
-        if cv_data.skills.technical:
-            cv_content += f"**Technical Skills:** {', '.join(cv_data.skills.technical)}\n"
-        if cv_data.skills.soft:
-            cv_content += f"**Soft Skills:** {', '.join(cv_data.skills.soft)}\n"
-        if cv_data.skills.languages:
-            cv_content += f"**Languages:** {', '.join(cv_data.skills.languages)}\n"
-        cv_content += "\n"
-
-    return cv_content
+    if name:
+        yield _header_markdown(name, contacts)
+
+    for key, title, paragraphs, entries in sections:
+        yield f"## {title}\n"
+        if paragraphs:
+            yield _paragraphs_markdown(paragraphs)
+        for entry in entries:
+            yield _entry_markdown(key, entry)
+
+def generate_cv_content(cv_data: Union[CVData, CVDocument]) -> str:
+    """
+    Generates the CV content in markdown format from structured CVData (or its CVDocument).
+    """
+    return "".join(iter_cv_content(cv_data))
+
+def write_cv_content(cv_data: Union[CVData, CVDocument], fileobj: TextIO) -> int:
+    """
+    Streams the markdown CV to a text file object and returns the number of characters written.
+    """
+    written = 0
+    for chunk in iter_cv_content(cv_data):
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
+
+@lru_cache(maxsize=None)
+def _field_getter(cls) -> Callable[[object], tuple]:
+    return attrgetter(*(f.name for f in fields(cls)))
+
+def _values(obj) -> tuple:
+    return _field_getter(type(obj))(obj)
+
+class IncrementalRenderer:
+    """
+    Markdown renderer for the live preview that re-renders only what changed.
+
+    Each piece of the CV (header, summary, every education and experience entry, skills)
+    is memoized against a key made of that piece's own field values. A rerun after a
+    one-field edit rebuilds a single chunk and joins the rest from the memo, so the
+    output always equals generate_cv_content(cv_data). Only the chunks used by the
+    latest render are kept.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._chunks: Dict[Hashable, str] = {}
+
+    def _pieces(self, cv_data: CVData) -> Iterator[Tuple[Hashable, Callable[[], str]]]:
+        personal_info = cv_data.personal_info
+        if personal_info.name:
+            yield (('header', personal_info.name, personal_info.email, personal_info.phone,
+                    personal_info.linkedin, personal_info.github),
+                   lambda: _header_markdown(personal_info.name, contact_items(personal_info)))
+        if personal_info.summary:
+            yield (('summary', personal_info.summary),
+                   lambda: f"## Summary\n{_paragraphs_markdown(((Run(personal_info.summary),),))}")
+        if cv_data.education:
+            yield 'education', lambda: "## Education\n"
+            for edu in cv_data.education:
+                yield ('education',) + _values(edu), lambda edu=edu: _entry_markdown('education', education_entry(edu))
+        if cv_data.experience:
+            yield 'experience', lambda: "## Experience\n"
+            for exp in cv_data.experience:
+                yield ('experience',) + _values(exp), lambda exp=exp: _entry_markdown('experience', experience_entry(exp))
+        skills = cv_data.skills
+        if skills.technical or skills.soft or skills.languages:
+            yield (('skills', tuple(skills.technical), tuple(skills.soft), tuple(skills.languages)),
+                   lambda: f"## Skills\n{_paragraphs_markdown(skill_lines(skills))}")
+
+    def render(self, cv_data: CVData) -> str:
+        previous, current = self._chunks, {}
+        parts: List[str] = []
+        for key, build in self._pieces(cv_data):
+            chunk = current.get(key)
+            if chunk is None:
+                chunk = previous.get(key)
+            if chunk is None:
+                chunk = build()
+                self.misses += 1
+            else:
+                self.hits += 1
+            current[key] = chunk
+            parts.append(chunk)
+        self._chunks = current
+        return "".join(parts)
@@ -0,0 +1,125 @@
+"""
+Normalized, immutable representation of a CV shared by all export backends.
+
+build_document walks CVData once and does the text normalization every backend needs
+(contact details, description bullets split and stripped, skills joined, bold runs).
+The markdown, PDF and DOCX renderers consume the resulting CVDocument, so exporting
+several formats only traverses the CV once, and new formats plug into the same IR.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from models import CVData, PersonalInformation, Education, Experience, Skills
+
+
+class Run(NamedTuple):
+    text: str
+    bold: bool = False
+
+
+@dataclass(frozen=True)
+class ContactItem:
+    label: str # Empty for email and phone
+    value: str
+
+    @property
+    def labelled(self) -> str:
+        return f"{self.label}: {self.value}" if self.label else self.value
+
+
+@dataclass(frozen=True)
+class Entry:
+    heading: Tuple[Run, ...] # e.g. (Run("M.Sc.", bold=True), Run(" in Computer Science"))
+    place: str # "Institution, Location" for education, the location for experience
+    start_date: str = ""
+    end_date: str = ""
+    gpa: Optional[str] = None
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Section:
+    key: str # 'summary', 'education', 'experience' or 'skills'
+    title: str
+    paragraphs: Tuple[Tuple[Run, ...], ...] = ()
+    entries: Tuple[Entry, ...] = ()
+
+
+@dataclass(frozen=True)
+class CVDocument:
+    name: str = ""
+    contacts: Tuple[ContactItem, ...] = ()
+    sections: Tuple[Section, ...] = ()
+
+    def section(self, key: str) -> Optional[Section]:
+        for section in self.sections:
+            if section.key == key:
+                return section
+        return None
+
+
+def split_bullets(description: str) -> Tuple[str, ...]:
+    """
+    One bullet per non-empty line of a multi-line description, stripped.
+    """
+    return tuple(filter(None, map(str.strip, description.split('\n'))))
+
+
+def contact_items(personal_info: PersonalInformation) -> Tuple[ContactItem, ...]:
+    if not personal_info.name:
+        return () # Contact details are only shown under a name
+    return tuple(ContactItem(label, value) for label, value in (
+        ("", personal_info.email), ("", personal_info.phone),
+        ("LinkedIn", personal_info.linkedin), ("GitHub", personal_info.github)) if value)
+
+
+def education_entry(edu: Education) -> Entry:
+    return Entry(heading=(Run(edu.degree, bold=True), Run(f" in {edu.major}")),
+                 place=f"{edu.institution}, {edu.location}",
+                 start_date=edu.start_date, end_date=edu.end_date, gpa=edu.gpa or None)
+
+
+def experience_entry(exp: Experience) -> Entry:
+    return Entry(heading=(Run(exp.title, bold=True), Run(f" at {exp.company}")),
+                 place=exp.location,
+                 start_date=exp.start_date, end_date=exp.end_date,
+                 bullets=split_bullets(exp.description))
+
+
+def skill_lines(skills: Skills) -> Tuple[Tuple[Run, ...], ...]:
+    return tuple(
+        (Run(label, bold=True), Run(f" {', '.join(values)}"))
+        for label, values in (("Technical Skills:", skills.technical), ("Soft Skills:", skills.soft),
+                              ("Languages:", skills.languages))
+        if values
+    )
+
+
+def iter_section_parts(cv_data: CVData) -> Iterator[Tuple[str, str, Tuple[Tuple[Run, ...], ...], Iterable[Entry]]]:
+    """
+    Yields (key, title, paragraphs, entries) for each non-empty section. Entries are
+    produced lazily, so a caller streaming output holds only one entry at a time.
+    """
+    if cv_data.personal_info.summary:
+        yield 'summary', "Summary", ((Run(cv_data.personal_info.summary),),), ()
+    if cv_data.education:
+        yield 'education', "Education", (), map(education_entry, cv_data.education)
+    if cv_data.experience:
+        yield 'experience', "Experience", (), map(experience_entry, cv_data.experience)
+    skills = skill_lines(cv_data.skills)
+    if skills:
+        yield 'skills', "Skills", skills, ()
+
+
+def build_document(cv_data: CVData) -> CVDocument:
+    sections = tuple(Section(key, title, paragraphs, tuple(entries))
+                     for key, title, paragraphs, entries in iter_section_parts(cv_data))
+    return CVDocument(name=cv_data.personal_info.name, contacts=contact_items(cv_data.personal_info),
+                      sections=sections)
+
+
+def as_document(cv: Union[CVData, CVDocument]) -> CVDocument:
+    """
+    Lets every backend accept either CVData or an already built CVDocument.
+    """
+    return cv if isinstance(cv, CVDocument) else build_document(cv)
@@ -0,0 +1,641 @@
+"""
+Imports existing CVs (DOCX, or PDF with a text layer) into CVData.
+
+Each format is reduced to a flat sequence of Blocks (title, section heading, entry
+heading, bullet or text, with bold runs), which one set of heuristics turns into CVData:
+section headings are recognised by keyword ("Work Experience", "EDUCATION", "Profile",
+...), dates, GPA, place and bullet lines are attached to the entry above them, and
+skills are split by their "Label:" prefix. Files made by export_to_docx and export_to_pdf
+import back into the CV they were made from.
+
+DOCX: word/document.xml is read with an incremental parser straight from the zip, and
+paragraphs are discarded as soon as they are classified, so memory does not grow with
+the document; python-docx is not used. Only styles.xml is parsed whole.
+PDF: lines come from pdf_text; wrapped lines are joined into paragraphs and classified
+by font size and weight.
+
+Bulk imports run in a process pool:
+
+    python cv_import.py cvs/ -o imported.jsonl --workers 8
+
+The JSONL output can be rendered with batch_render.py.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from xml.etree import ElementTree
+
+import serialization
+from cv_document import Run
+from models import CVData, PersonalInformation, Education, Experience, Skills
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_DOCUMENT_PART = 'word/document.xml'
+IMPORT_EXTENSIONS = ('.docx', '.pdf')
+
+SECTION_KEYWORDS = {
+    'summary': ('summary', 'profile', 'professional summary', 'professional profile', 'about', 'about me',
+                'objective', 'career objective', 'personal statement', 'overview', 'career summary'),
+    'education': ('education', 'academic background', 'qualifications', 'education and training',
+                  'academic qualifications', 'academic history'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'career history', 'relevant experience'),
+    'skills': ('skills', 'technical skills', 'key skills', 'core competencies', 'competencies', 'expertise',
+               'skills and languages', 'languages', 'soft skills', 'tools', 'technologies', 'skills and tools'),
+}
+_SECTION_BY_TITLE = {title: key for key, titles in SECTION_KEYWORDS.items() for title in titles}
+
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+_PHONE = re.compile(r'^\+?[\d(][\d\s().-]{5,}\d$')
+_DATE_WORD = re.compile(r'\b(?:\d{4}|\d{1,2}[/.]\d{2,4}|present|current|now|today|'
+                        r'jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)', re.IGNORECASE)
+_DATE_RANGE = re.compile(r'^(?P<start>.*?)\s*(?:\s-\s|\s–\s|\s—\s|–|—|\bto\b|^-\s|\s-$)\s*(?P<end>.*)$', re.IGNORECASE)
+_GPA = re.compile(r'^(?:GPA|grade)\s*:?\s*(?P<gpa>.+)$', re.IGNORECASE)
+_BULLET_PREFIX = re.compile('^[\u2022\u25cf\u25aa\u25a0\u25e6\u2023\uf0b7*]\\s*')
+_SKILL_SEPARATORS = re.compile('\\s*[,;|\u2022\u00b7]\\s*')
+
+
+class Block(NamedTuple):
+    kind: str # 'title', 'heading', 'entry', 'bullet' or 'text'
+    runs: Tuple[Run, ...]
+
+    @property
+    def text(self) -> str:
+        return "".join(run.text for run in self.runs).strip()
+
+
+def section_key(text: str) -> Optional[str]:
+    """
+    The CVData section a heading names, or None.
+    """
+    normalized = re.sub(r'\s+', ' ', text.replace('&', 'and')).strip(' :').lower()
+    return _SECTION_BY_TITLE.get(normalized)
+
+
+# DOCX
+
+class _Part:
+    """
+    A member of a DOCX package opened for reading. zipfile reports damaged members with
+    zlib.error, EOFError or NotImplementedError (a garbled compression method or version);
+    they are raised as BadZipFile like its other errors.
+    """
+
+    def __init__(self, package: zipfile.ZipFile, name: str):
+        self.name = name
+        try:
+            self._file = package.open(name)
+        except NotImplementedError as exc:
+            raise zipfile.BadZipFile(f"Damaged package part {name}: {exc}") from exc
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._file.read(size)
+        except (zlib.error, EOFError) as exc:
+            raise zipfile.BadZipFile(f"Damaged package part {self.name}: {exc}") from exc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+
+
+def _docx_styles(package: zipfile.ZipFile) -> Dict[str, Tuple[str, bool]]:
+    """
+    Maps style ids to (kind, numbered); kind follows basedOn, so a custom style built on
+    Heading 2 is a heading too.
+    """
+    try:
+        with _Part(package, 'word/styles.xml') as part:
+            root = ElementTree.fromstring(part.read())
+    except KeyError:
+        return {}
+    styles = {}
+    for style in root.iter(f'{_W}style'):
+        name = style.find(f'{_W}name')
+        based_on = style.find(f'{_W}basedOn')
+        styles[style.get(f'{_W}styleId')] = (
+            (name.get(f'{_W}val') if name is not None else '').lower(),
+            based_on.get(f'{_W}val') if based_on is not None else None,
+            style.find(f'{_W}pPr/{_W}numPr') is not None,
+        )
+
+    def kind(style_id: str, depth: int = 0) -> str:
+        name, based_on, _ = styles[style_id]
+        if name == 'title':
+            return 'title'
+        match = re.fullmatch(r'heading (\d)', name)
+        if match:
+            return {'1': 'title', '2': 'heading'}.get(match.group(1), 'entry')
+        if name in ('intense quote', 'subtitle'):
+            return 'entry'
+        if 'list' in name:
+            return 'bullet'
+        if based_on in styles and depth < 8:
+            return kind(based_on, depth + 1)
+        return 'text'
+
+    return {style_id: (kind(style_id), numbered) for style_id, (_, _, numbered) in styles.items()}
+
+
+def _is_on(element) -> bool:
+    return element.get(f'{_W}val', 'true').lower() not in ('0', 'false', 'off', 'none')
+
+
+def iter_docx_blocks(source: Union[str, bytes, BinaryIO]) -> Iterator[Block]:
+    """
+    Yields the paragraphs of a DOCX file as Blocks, parsing document.xml incrementally.
+    """
+    try:
+        package = zipfile.ZipFile(BytesIO(source) if isinstance(source, bytes) else source)
+    except NotImplementedError as exc: # A garbled version field, see _Part
+        raise zipfile.BadZipFile(f"Damaged package: {exc}") from exc
+    with package:
+        styles = _docx_styles(package)
+        stack: List[str] = []
+        paragraphs: List[dict] = []
+        run: Optional[list] = None
+        body = None
+        with _Part(package, _DOCUMENT_PART) as document:
+            for event, element in ElementTree.iterparse(document, events=('start', 'end')):
+                tag = element.tag[len(_W):] if element.tag.startswith(_W) else ''
+                if event == 'start':
+                    stack.append(tag)
+                    if tag == 'p':
+                        paragraphs.append({'style': None, 'numbered': False, 'runs': []})
+                    elif tag == 'r' and paragraphs:
+                        run = ['', False]
+                    elif tag == 'body':
+                        body = element
+                    continue
+                stack.pop()
+                parent = stack[-1] if stack else ''
+                if not paragraphs:
+                    continue
+                paragraph = paragraphs[-1]
+                if tag == 't' and run is not None:
+                    run[0] += element.text or ''
+                elif tag in ('tab', 'br', 'cr') and run is not None and parent == 'r':
+                    run[0] += '\t' if tag == 'tab' else '\n'
+                elif tag == 'noBreakHyphen' and run is not None:
+                    run[0] += '-'
+                elif tag == 'b' and parent == 'rPr' and len(stack) > 1 and stack[-2] == 'r' and run is not None:
+                    run[1] = _is_on(element)
+                elif tag == 'r' and run is not None:
+                    if run[0]:
+                        runs = paragraph['runs']
+                        if runs and runs[-1][1] == run[1]:
+                            runs[-1][0] += run[0]
+                        else:
+                            runs.append(run)
+                    run = None
+                elif tag == 'pStyle' and parent == 'pPr':
+                    paragraph['style'] = element.get(f'{_W}val')
+                elif tag == 'numId' and parent == 'numPr':
+                    paragraph['numbered'] = element.get(f'{_W}val') != '0'
+                elif tag == 'p':
+                    paragraphs.pop()
+                    yield from _docx_paragraph_blocks(paragraph, styles)
+                    element.clear()
+                    if body is not None and parent == 'body':
+                        del body[:] # Drop finished paragraphs so memory stays flat
+                elif tag == 'tbl' and body is not None and parent == 'body':
+                    del body[:]
+
+
+def _docx_paragraph_blocks(paragraph: dict, styles: Dict[str, Tuple[str, bool]]) -> Iterator[Block]:
+    kind, style_numbered = styles.get(paragraph['style'], ('text', False))
+    if kind == 'text' and (paragraph['numbered'] or style_numbered):
+        kind = 'bullet'
+    # Line breaks inside a paragraph separate blocks (e.g. contact details on several lines)
+    lines: List[List[Run]] = [[]]
+    for text, bold in paragraph['runs']:
+        for index, part in enumerate(text.replace('\t', ' ').split('\n')):
+            if index:
+                lines.append([])
+            if part:
+                lines[-1].append(Run(part, bold))
+    for runs in lines:
+        if "".join(run.text for run in runs).strip():
+            yield Block(kind, tuple(runs))
+
+
+# PDF
+
+def iter_pdf_blocks(data: bytes) -> Iterator[Block]:
+    """
+    Yields the paragraphs of a PDF's text layer as Blocks.
+    """
+    from pdf_text import extract_lines
+
+    lines = extract_lines(data)
+    if not lines:
+        raise ValueError("it has no text layer (a scanned document?)")
+    sizes: Dict[float, int] = {}
+    for line in lines:
+        sizes[line.size] = sizes.get(line.size, 0) + len(line.text)
+    body_size = max(sizes, key=sizes.get)
+    largest = max(line.size for line in lines[:5])
+
+    paragraphs: List[list] = [] # [first line, runs, last line]
+    for line in lines:
+        if paragraphs:
+            first, runs, last = paragraphs[-1]
+            same_style = (abs(line.size - last.size) < 0.1 and not line.bullet
+                          and line.runs[0].bold == last.runs[-1].bold)
+            next_line = line.page == last.page and 0 < last.y - line.y <= 1.45 * line.size
+            continued = line.page == last.page + 1 and abs(line.x - last.x) < 1 # Paragraph split across pages
+            if same_style and (next_line or continued) and not (first.page == 0 and first.size == largest):
+                runs.extend((Run(' ', runs[-1].bold),) + line.runs)
+                paragraphs[-1][2] = line
+                continue
+        paragraphs.append([line, list(line.runs), line])
+
+    title_seen = False
+    for first, runs, _ in paragraphs:
+        runs = _merge_runs(runs)
+        text = "".join(run.text for run in runs).strip()
+        all_bold = all(run.bold for run in runs if run.text.strip())
+        if not title_seen and first.page == 0 and first.size == largest and first.size > body_size * 1.3:
+            kind = 'title'
+            title_seen = True
+        elif first.bullet:
+            kind = 'bullet'
+        elif section_key(text) and (all_bold or first.size > body_size or text.isupper()):
+            kind = 'heading'
+        elif runs[0].bold and first.size > body_size:
+            kind = 'entry'
+        elif all_bold and not text.endswith(':'):
+            kind = 'entry'
+        else:
+            kind = 'text'
+        yield Block(kind, tuple(runs))
+
+
+def _merge_runs(runs: Sequence[Run]) -> List[Run]:
+    merged: List[Run] = []
+    for run in runs:
+        if merged and merged[-1].bold == run.bold:
+            merged[-1] = Run(merged[-1].text + run.text, run.bold)
+        else:
+            merged.append(run)
+    return merged
+
+
+# Heuristics shared by both formats
+
+@dataclass
+class _Entry:
+    heading: Tuple[Run, ...] = ()
+    place: Optional[str] = None
+    start_date: str = ""
+    end_date: str = ""
+    gpa: Optional[str] = None
+    bullets: Tuple[str, ...] = ()
+
+
+def _date_range(text: str) -> Optional[Tuple[str, str]]:
+    """
+    (start, end) when text is a date range such as "2020 - Present" or "Jan 2019 to Mar 2021".
+    """
+    text = text.strip()
+    if text in ('-', '–', '—'):
+        return "", "" # An entry exported without dates
+    match = _DATE_RANGE.match(text)
+    if not match:
+        return None
+    start, end = match.group('start').strip(), match.group('end').strip()
+    if not (start or end) or any(part and not _DATE_WORD.search(part) for part in (start, end)):
+        return None
+    return start, end
+
+
+def _split_heading(entry: _Entry, separators: Sequence[str]) -> Tuple[str, str]:
+    """
+    Splits an entry heading into (bold part, rest): the bold first run when there is one,
+    otherwise the text around the first separator.
+    """
+    runs = [run for run in entry.heading if run.text]
+    text = "".join(run.text for run in runs)
+    if len(runs) > 1 and runs[0].bold and not all(run.bold for run in runs):
+        return runs[0].text.strip(), "".join(run.text for run in runs[1:])
+    for separator in separators:
+        if separator in text:
+            first, rest = text.split(separator, 1)
+            return first.strip(), separator + rest
+    return text.strip(), ""
+
+
+def _strip_prefix(text: str, prefixes: Sequence[str]) -> str:
+    stripped = text.strip()
+    for prefix in prefixes:
+        if stripped.lower().startswith(prefix.strip().lower() + ' ') or stripped.lower() == prefix.strip().lower():
+            return stripped[len(prefix.strip()):].strip()
+        if prefix.strip() in (',', '|', '-', '–', '—') and stripped.startswith(prefix.strip()):
+            return stripped[1:].strip()
+    return stripped
+
+
+def _split_place(text: str) -> Tuple[str, str]:
+    first, _, rest = text.partition(', ')
+    return first.strip(' ,'), rest.strip(' ,')
+
+
+def _extract_dates(entry: _Entry) -> None:
+    """
+    Moves a trailing date range in the heading ("Engineer at ACME (2019 - 2021)") to the dates.
+    """
+    if entry.start_date or entry.end_date or not entry.heading:
+        return
+    text = "".join(run.text for run in entry.heading)
+    match = re.search(r'[\s,|(]+([^,|()]+?)\)?\s*$', text)
+    if match and _date_range(match.group(1)):
+        entry.start_date, entry.end_date = _date_range(match.group(1))
+        cut = len(text) - len(match.group(0))
+        runs, kept = [], 0
+        for run in entry.heading:
+            if kept + len(run.text) <= cut:
+                runs.append(run)
+            elif kept < cut:
+                runs.append(Run(run.text[:cut - kept], run.bold))
+            kept += len(run.text)
+        entry.heading = tuple(runs)
+
+
+def _experience(entry: _Entry) -> Experience:
+    _extract_dates(entry)
+    title, rest = _split_heading(entry, (' at ', ' @ ', ' | ', ' — ', ' – ', ', '))
+    rest = _strip_prefix(rest, (' at', '@', '|', '—', '–', ','))
+    company, location = _split_place(rest)
+    if entry.place: # A separate location line (PDF export, most templates)
+        location = entry.place
+    return Experience(title=title, company=company, location=location, start_date=entry.start_date,
+                      end_date=entry.end_date, description="\n".join(entry.bullets))
+
+
+def _education(entry: _Entry) -> Education:
+    _extract_dates(entry)
+    degree, rest = _split_heading(entry, (' in ', ' of ', ', ', ' | '))
+    major = _strip_prefix(rest, (' in', ' of', ',', '|'))
+    institution, location = _split_place(entry.place or "")
+    return Education(degree=degree, major=major, institution=institution, location=location,
+                     start_date=entry.start_date, end_date=entry.end_date, gpa=entry.gpa)
+
+
+def _skill_category(label: str, default: str) -> str:
+    label = label.lower()
+    if 'soft' in label or 'interpersonal' in label or 'personal' in label:
+        return 'soft'
+    if 'language' in label and 'programming' not in label:
+        return 'languages'
+    if label:
+        return 'technical'
+    return default
+
+
+def _add_contact(personal_info: PersonalInformation, text: str) -> bool:
+    """
+    Fills the contact field text belongs to; returns False if it is not a contact detail.
+    """
+    value = re.sub(r'^(?:e-?mail|phone|tel|mobile|linkedin|github)\s*:\s*', '', text.strip(), flags=re.IGNORECASE)
+    lowered = value.lower()
+    if 'linkedin.' in lowered and not personal_info.linkedin:
+        personal_info.linkedin = value
+    elif 'github.' in lowered and not personal_info.github:
+        personal_info.github = value
+    elif _EMAIL.fullmatch(value) and not personal_info.email:
+        personal_info.email = value
+    elif _PHONE.match(value) and len(re.sub(r'\D', '', value)) >= 7 and not personal_info.phone:
+        personal_info.phone = value
+    else:
+        return False
+    return True
+
+
+def assemble(blocks: Iterable[Block]) -> CVData:
+    """
+    Builds CVData from a document's blocks.
+    """
+    personal_info = PersonalInformation()
+    header_text: List[str] = []
+    summary: List[str] = []
+    entries: Dict[str, List[_Entry]] = {'education': [], 'experience': []}
+    skills: Dict[str, List[str]] = {'technical': [], 'soft': [], 'languages': []}
+    section: Optional[str] = None
+    skill_default = 'technical'
+    in_header = True
+
+    for block in blocks:
+        text = block.text
+        if not text:
+            continue
+        key = section_key(text) if block.kind in ('heading', 'title', 'text', 'entry') and len(text.split()) <= 4 else None
+        if key and (block.kind != 'title' or personal_info.name):
+            section, in_header = key, False
+            skill_default = _skill_category(text, 'technical') if key == 'skills' and 'skills' != text.strip(' :').lower() else 'technical'
+            continue
+        if block.kind in ('heading',) or (block.kind == 'title' and personal_info.name):
+            section, in_header = None, False # A section we do not import (projects, awards, ...)
+            continue
+
+        if in_header:
+            if not personal_info.name:
+                personal_info.name = text
+                continue
+            parts = [part for part in re.split(r'\s*[|\u2022\u00b7\t]\s*|\s{3,}', text) if part.strip()]
+            unknown = [part for part in parts if not _add_contact(personal_info, part)]
+            if unknown and len(text.split()) >= 12:
+                header_text.append(text) # An untitled profile paragraph
+            continue
+
+        if section == 'summary':
+            summary.append(_BULLET_PREFIX.sub('', text))
+        elif section in entries:
+            current = entries[section][-1] if entries[section] else None
+            if block.kind == 'entry' or current is None:
+                if block.kind == 'bullet' and current is None:
+                    current = _Entry()
+                    entries[section].append(current)
+                else:
+                    entries[section].append(_Entry(heading=block.runs))
+                    continue
+            if block.kind == 'bullet':
+                current.bullets += (_BULLET_PREFIX.sub('', text),)
+                continue
+            parts = [part.strip() for part in text.split(' | ')]
+            dates = _date_range(parts[0])
+            gpa = next((match.group('gpa') for match in map(_GPA.match, parts) if match), None)
+            if dates is not None or gpa is not None:
+                if dates is not None:
+                    current.start_date, current.end_date = dates
+                if gpa is not None:
+                    current.gpa = gpa
+            elif current.place is None and not current.bullets and not current.start_date and not current.end_date:
+                current.place = text
+            elif current.bullets or current.place is not None:
+                entries[section].append(_Entry(heading=block.runs)) # Untitled template: a new entry
+            else:
+                current.bullets += (text,)
+        elif section == 'skills':
+            label, separator, values = text.partition(':')
+            if separator and len(label.split()) <= 4:
+                category = _skill_category(label, skill_default)
+            else:
+                category, values = skill_default, text
+            for value in _SKILL_SEPARATORS.split(_BULLET_PREFIX.sub('', values.strip())):
+                if value and value not in skills[category]:
+                    skills[category].append(value)
+
+    personal_info.summary = "\n".join(summary or header_text)
+    return CVData(personal_info=personal_info,
+                  education=[_education(entry) for entry in entries['education']],
+                  experience=[_experience(entry) for entry in entries['experience']],
+                  skills=Skills(**skills))
+
+
+# What the parsers raise for damaged files (pdf_text.PdfError is a ValueError); anything
+# else is a bug and propagates
+_PARSE_ERRORS = (ValueError, KeyError, zipfile.BadZipFile, ElementTree.ParseError)
+
+
+def _format(data: bytes, filename: Optional[str]) -> str:
+    if data[:4] == b'PK\x03\x04':
+        return 'docx'
+    if data.lstrip()[:5] == b'%PDF-':
+        return 'pdf'
+    extension = os.path.splitext(filename or '')[1].lower()
+    raise ValueError(f"Unsupported file{f' type {extension}' if extension else ''}: expected a DOCX or PDF document")
+
+
+def import_cv(source: Union[str, bytes, BinaryIO], filename: Optional[str] = None) -> CVData:
+    """
+    Parses a DOCX or PDF CV (a path, the file's bytes or a binary file object) into CVData.
+    The format is detected from the content. Raises ValueError for other files and for
+    damaged ones.
+    """
+    if isinstance(source, str):
+        filename = filename or source
+        with open(source, 'rb') as f:
+            data = f.read()
+    elif isinstance(source, bytes):
+        data = source
+    else:
+        data = source.read()
+    fmt = _format(data, filename)
+    try:
+        if fmt == 'docx':
+            return assemble(iter_docx_blocks(data))
+        return assemble(iter_pdf_blocks(data))
+    except _PARSE_ERRORS as exc:
+        # Damaged or truncated files fail deep inside the parsers with all kinds of errors
+        detail = exc if type(exc) is ValueError else f"{type(exc).__name__}: {exc}"
+        raise ValueError(f"Not a readable {fmt.upper()} document: {detail}") from exc
+
+
+@dataclass
+class ImportResult:
+    path: str
+    cv_data: Optional[CVData] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+def import_file(path: str) -> ImportResult:
+    start = time.perf_counter()
+    try:
+        return ImportResult(path, cv_data=import_cv(path), seconds=time.perf_counter() - start)
+    except Exception as exc:
+        return ImportResult(path, error=f"{type(exc).__name__}: {exc}", seconds=time.perf_counter() - start)
+
+
+def iter_import_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Expands directories (recursively) into the DOCX and PDF files they contain, in name order.
+    """
+    for path in inputs:
+        if os.path.isdir(path):
+            for directory, subdirectories, files in os.walk(path):
+                subdirectories.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(IMPORT_EXTENSIONS) and not name.startswith('~$'):
+                        yield os.path.join(directory, name)
+        else:
+            yield path
+
+
+def _import_chunk(paths: List[str]) -> List[ImportResult]:
+    return [import_file(path) for path in paths]
+
+
+def _chunks(paths: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_files(paths: Iterable[str], workers: Optional[int] = None, chunksize: int = 16) -> Iterator[ImportResult]:
+    """
+    Imports many files, yielding one ImportResult per path in input order. workers=1
+    imports in the current process; otherwise chunks of paths go to a process pool, with
+    at most two chunks per worker in flight so a long list of paths is walked as the
+    imports progress rather than all at once.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(import_file, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for chunk in _chunks(paths, chunksize):
+            pending.append(executor.submit(_import_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import DOCX and PDF CVs into CVData JSONL records.")
+    parser.add_argument("inputs", nargs='+', help="DOCX/PDF files or directories to search for them.")
+    parser.add_argument("-o", "--output", default='-', help="JSONL output file (default: standard output).")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunksize", type=int, default=16, help="Files sent to a worker per task.")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    imported = failed = 0
+    start = time.perf_counter()
+    try:
+        for result in import_files(iter_import_paths(args.inputs), workers=args.workers, chunksize=args.chunksize):
+            if result.error:
+                failed += 1
+                print(f"{result.path}: {result.error}", file=sys.stderr)
+                continue
+            output.write(serialization.to_json(result.cv_data) + "\n")
+            imported += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    print(f"Imported {imported} CV(s), {failed} failed, in {elapsed:.2f} s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
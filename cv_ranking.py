@@ -0,0 +1,241 @@
+"""
+Ranks a corpus of CVs against job descriptions.
+
+CVIndex keeps an inverted index over the CVs' keyword terms (ats_score.cv_terms): for
+every term, the set of CVs that contain it. Ranking a job description only visits the
+postings of the job's own terms, adding each term's weight to the CVs that have it, so
+the cost grows with the number of matching (term, CV) pairs rather than with the corpus
+times the number of jobs. CVs can be added, replaced or removed at any time; only their
+own postings change.
+
+Two weightings are available:
+- 'keywords' (default): the job term weights of ats_score, so a CV's score equals
+  ats_score.score_cv for the same job description.
+- 'tfidf': each job term weight is also multiplied by its inverse document frequency
+  over the indexed CVs, 1 + ln((N + 1) / (df + 1)), so terms most CVs share count less.
+
+Scores are percentages of the job's total term weight in both cases.
+
+    index = CVIndex()
+    index.add_many(enumerate(cv_records))
+    index.top_k(job_description, k=20)
+
+Command line (CVs as in batch_render.py, jobs as text files or directories of .txt files):
+
+    python cv_ranking.py cvs.jsonl jobs/ -k 20 -o ranking.jsonl
+"""
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+from ats_score import KeywordScore, JobVector, cv_terms, job_vector, score_terms
+from models import CVData
+
+WEIGHTINGS = ('keywords', 'tfidf')
+
+
+class Match(NamedTuple):
+    key: Hashable
+    score: float
+
+
+class CVIndex:
+    """
+    Inverted keyword index over a CV corpus. CVs are identified by any hashable key
+    (record number, database id, file name). Not thread-safe for concurrent updates.
+    """
+
+    def __init__(self, weighting: str = 'keywords'):
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting '{weighting}'. Available weightings: {', '.join(WEIGHTINGS)}")
+        self.weighting = weighting
+        self._postings: Dict[str, Set[int]] = {} # term -> document numbers
+        self._terms: List[Optional[FrozenSet[str]]] = [] # document number -> terms (None once removed)
+        self._keys: List[Hashable] = [] # document number -> key
+        self._numbers: Dict[Hashable, int] = {} # key -> document number
+        self._free: List[int] = [] # Numbers of removed documents, reused by add
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._numbers
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self._numbers)
+
+    def add(self, key: Hashable, cv_data: CVData) -> None:
+        """
+        Indexes cv_data under key, replacing the CV previously stored under it.
+        """
+        self._add_terms(key, cv_terms(cv_data))
+
+    def add_many(self, items: Iterable[Tuple[Hashable, CVData]]) -> None:
+        for key, cv_data in items:
+            self.add(key, cv_data)
+
+    def _add_terms(self, key: Hashable, found: FrozenSet[str]) -> None:
+        number = self._numbers.get(key)
+        if number is not None:
+            previous = self._terms[number]
+            if previous == found:
+                return # Edited outside the scored fields
+            for term in previous - found:
+                postings = self._postings[term]
+                postings.discard(number)
+                if not postings:
+                    del self._postings[term]
+            added = found - previous
+        else:
+            if self._free:
+                number = self._free.pop()
+                self._keys[number] = key
+            else:
+                number = len(self._keys)
+                self._keys.append(key)
+                self._terms.append(None)
+            self._numbers[key] = number
+            added = found
+        self._terms[number] = found
+        for term in added:
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = {number}
+            else:
+                postings.add(number)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes the CV stored under key. Raises KeyError if there is none.
+        """
+        number = self._numbers.pop(key)
+        for term in self._terms[number]:
+            postings = self._postings[term]
+            postings.discard(number)
+            if not postings:
+                del self._postings[term]
+        self._terms[number] = None
+        self._keys[number] = None
+        self._free.append(number)
+
+    def document_frequency(self, term: str) -> int:
+        return len(self._postings.get(term, ()))
+
+    def _weights(self, job: JobVector) -> Tuple[Dict[str, float], float]:
+        if self.weighting == 'keywords':
+            return job.weights, job.total
+        documents = len(self._numbers)
+        weights = {term: weight * (1 + math.log((documents + 1) / (self.document_frequency(term) + 1)))
+                   for term, weight in job.weights.items()}
+        return weights, math.fsum(weights.values())
+
+    def scores(self, job_description: str) -> Dict[Hashable, float]:
+        """
+        Returns the score of every CV that matches at least one term of the job description.
+        """
+        total, accumulator = self._accumulate(job_vector(job_description))
+        keys = self._keys
+        return {keys[number]: round(100 * value / total, 1) for number, value in enumerate(accumulator) if value}
+
+    def _accumulate(self, job: JobVector) -> Tuple[float, List[float]]:
+        # Term-at-a-time: each job term adds its weight to the CVs in its postings
+        weights, total = self._weights(job)
+        accumulator = [0.0] * len(self._keys)
+        postings = self._postings
+        for term, weight in weights.items():
+            for number in postings.get(term, ()):
+                accumulator[number] += weight
+        return total, accumulator
+
+    def top_k(self, job_description: str, k: int = 10) -> List[Match]:
+        """
+        Returns the k best-matching CVs for the job description, best first. CVs that
+        match none of its terms are left out; ties are ordered by index position.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        job = job_vector(job_description)
+        if not job.weights:
+            return []
+        total, accumulator = self._accumulate(job)
+        best = heapq.nlargest(k, (number for number, value in enumerate(accumulator) if value),
+                              key=accumulator.__getitem__)
+        return [Match(self._keys[number], round(100 * accumulator[number] / total, 1)) for number in best]
+
+    def rank_jobs(self, job_descriptions: Mapping[Hashable, str], k: int = 10) -> Dict[Hashable, List[Match]]:
+        """
+        Returns top_k for every job description, keyed like job_descriptions.
+        """
+        return {job_key: self.top_k(text, k) for job_key, text in job_descriptions.items()}
+
+    def explain(self, key: Hashable, job_description: str) -> KeywordScore:
+        """
+        Matched and missing keywords of one indexed CV for the job description, with its
+        ats_score keyword score (always the 'keywords' weighting).
+        """
+        return score_terms(self._terms[self._numbers[key]], job_vector(job_description))
+
+
+def iter_job_files(inputs: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (name, text) for job description files; directories are searched for .txt
+    files. The name is the file name without its extension.
+    """
+    for path in inputs:
+        paths = [path]
+        if os.path.isdir(path):
+            paths = [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.lower().endswith('.txt')]
+        for job_path in paths:
+            with open(job_path, encoding='utf-8') as f:
+                yield os.path.splitext(os.path.basename(job_path))[0], f.read()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from batch_render import iter_records, parse_record
+
+    parser = argparse.ArgumentParser(description="Rank CVData records against job descriptions.")
+    parser.add_argument("cvs", help="JSONL file, JSON array of records or binary CV stream.")
+    parser.add_argument("jobs", nargs='+', help="Job description text files, or directories of .txt files.")
+    parser.add_argument("-k", "--top", type=int, default=10, help="CVs to list per job (default: 10).")
+    parser.add_argument("-o", "--output", default='-', help="JSONL output file (default: standard output).")
+    parser.add_argument("--weighting", choices=WEIGHTINGS, default='keywords')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = CVIndex(args.weighting)
+    names: Dict[int, str] = {}
+    failed = 0
+    for number, record in iter_records(args.cvs):
+        try:
+            cv_data = parse_record(record)
+        except Exception as exc:
+            failed += 1
+            print(f"Record {number}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            continue
+        index.add(number, cv_data)
+        names[number] = cv_data.personal_info.name
+    indexed = time.perf_counter()
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    jobs = 0
+    try:
+        for job_name, text in iter_job_files(args.jobs):
+            matches = [{"record": key, "name": names[key], "score": score} for key, score in index.top_k(text, args.top)]
+            output.write(json.dumps({"job": job_name, "matches": matches}, ensure_ascii=False) + "\n")
+            jobs += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    ranked = time.perf_counter()
+    print(f"Indexed {len(index)} CV(s) in {indexed - start:.2f} s ({failed} failed), "
+          f"ranked {jobs} job(s) in {ranked - indexed:.2f} s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Size optimization for DOCX packages, used by export_to_docx(..., optimize_size=True).
+
+The default python-docx template carries far more than a CV needs: ~165 styles plus
+their latent-style table (styles.xml is ~350 KB before compression), a duplicate
+stylesWithEffects.xml, a theme, web settings, customXml, a thumbnail, a font table and
+Word's revision bookkeeping in settings.xml. compact_docx rewrites a package keeping
+only what the document body uses:
+
+- styles.xml: the styles referenced by the body, what they are based on or linked to,
+  and the per-type defaults; latent styles are dropped and theme fonts are replaced by
+  the theme's actual typefaces, so the text looks the same without the theme part
+- numbering.xml: the numbering definitions those styles and paragraphs reference
+- settings.xml: tab stop, spacing and compatibility settings only
+- the parts listed in _DROPPED_RELATIONSHIPS, with their relationships and content types
+
+Everything except word/document.xml is identical for every export from the same
+template, so the rewritten parts are cached by the CRCs of the original parts and the
+set of styles and numbering ids the document uses.
+"""
+import re
+import threading
+import zipfile
+from io import BytesIO
+from typing import Dict, FrozenSet, Tuple
+
+_DOCUMENT_PART = 'word/document.xml'
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+_CT = 'http://schemas.openxmlformats.org/package/2006/content-types'
+
+# Relationship types whose target parts are removed
+_DROPPED_RELATIONSHIPS = {
+    'http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/webSettings',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/fontTable',
+    'http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties',
+}
+_KEPT_SETTINGS = {'defaultTabStop', 'characterSpacingControl', 'compat', 'decimalSymbol', 'listSeparator'}
+_THEME_FONT_ATTRIBUTES = {'asciiTheme': 'ascii', 'hAnsiTheme': 'hAnsi', 'eastAsiaTheme': 'eastAsia', 'cstheme': 'cs'}
+
+_CACHE_SIZE = 32
+_parts_cache: Dict[tuple, Tuple[Tuple[str, bytes], ...]] = {}
+_parts_cache_lock = threading.Lock()
+
+_STYLE_REFERENCE = re.compile(rb'<w:(?:pStyle|rStyle|tblStyle) w:val="([^"]+)"')
+_NUM_REFERENCE = re.compile(rb'<w:numId w:val="(\d+)"')
+
+
+def _w(name: str) -> str:
+    return f'{{{_W}}}{name}'
+
+
+def _relationship_targets(rels_xml: bytes, base: str) -> Tuple[bytes, set]:
+    """
+    Removes the dropped relationships. Returns the new XML and the removed part names.
+    """
+    from lxml import etree
+
+    root = etree.fromstring(rels_xml)
+    removed = set()
+    for rel in list(root):
+        if rel.get('Type') in _DROPPED_RELATIONSHIPS:
+            target = rel.get('Target')
+            parts = (base + target).split('/')
+            normalized = []
+            for part in parts:
+                if part == '..':
+                    normalized.pop()
+                elif part:
+                    normalized.append(part)
+            removed.add('/'.join(normalized))
+            root.remove(rel)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True), removed
+
+
+def _theme_fonts(theme_xml: bytes) -> Dict[str, str]:
+    """
+    Maps theme font names (minorHAnsi, majorBidi, ...) to typefaces.
+    """
+    from lxml import etree
+
+    root = etree.fromstring(theme_xml)
+    fonts = {}
+    for kind in ('major', 'minor'):
+        font = root.find(f'.//{{{_A}}}{kind}Font')
+        if font is None:
+            continue
+        latin, east_asian, complex_script = (font.find(f'{{{_A}}}{script}') for script in ('latin', 'ea', 'cs'))
+        for suffix, element in (('HAnsi', latin), ('Ascii', latin), ('EastAsia', east_asian), ('Bidi', complex_script)):
+            if element is not None and element.get('typeface'):
+                fonts[f'{kind}{suffix}'] = element.get('typeface')
+    return fonts
+
+
+def _compact_styles(styles_xml: bytes, used: FrozenSet[str], theme_fonts: Dict[str, str]) -> Tuple[bytes, FrozenSet[str]]:
+    """
+    Returns the pruned styles.xml and the numbering ids the kept styles reference.
+    """
+    from lxml import etree
+
+    root = etree.fromstring(styles_xml)
+    styles = {style.get(_w('styleId')): style for style in root.iter(_w('style'))}
+    keep = set()
+    pending = [style_id for style_id, style in styles.items() if style_id in used or style.get(_w('default')) == '1']
+    while pending:
+        style_id = pending.pop()
+        if style_id in keep or style_id not in styles:
+            continue
+        keep.add(style_id)
+        for reference in ('basedOn', 'link'):
+            element = styles[style_id].find(_w(reference))
+            if element is not None:
+                pending.append(element.get(_w('val')))
+
+    for child in list(root):
+        if child.tag == _w('latentStyles') or (child.tag == _w('style') and child.get(_w('styleId')) not in keep):
+            root.remove(child)
+    for style in root.iter(_w('style')):
+        for reference in ('next', 'link'):
+            element = style.find(_w(reference))
+            if element is not None and element.get(_w('val')) not in keep:
+                style.remove(element)
+        for element in style.findall(_w('rsid')): # The revision table in settings.xml is dropped
+            style.remove(element)
+    # Without the theme part, theme fonts would fall back to the application default
+    for fonts in root.iter(_w('rFonts')):
+        _inline_theme_fonts(fonts, theme_fonts)
+
+    num_ids = frozenset(element.get(_w('val')) for element in root.iter(_w('numId')))
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True), num_ids
+
+
+def _inline_theme_fonts(fonts, theme_fonts: Dict[str, str]) -> None:
+    for theme_attribute, attribute in _THEME_FONT_ATTRIBUTES.items():
+        theme_font = fonts.get(_w(theme_attribute))
+        if theme_font is None:
+            continue
+        del fonts.attrib[_w(theme_attribute)]
+        if theme_font in theme_fonts and fonts.get(_w(attribute)) is None:
+            fonts.set(_w(attribute), theme_fonts[theme_font])
+
+
+def _compact_numbering(numbering_xml: bytes, num_ids: FrozenSet[str]) -> bytes:
+    from lxml import etree
+
+    root = etree.fromstring(numbering_xml)
+    abstract_ids = set()
+    for num in root.findall(_w('num')):
+        if num.get(_w('numId')) in num_ids:
+            abstract_ids.add(num.find(_w('abstractNumId')).get(_w('val')))
+        else:
+            root.remove(num)
+    for abstract in root.findall(_w('abstractNum')):
+        if abstract.get(_w('abstractNumId')) not in abstract_ids:
+            root.remove(abstract)
+    for element in root.findall(_w('numIdMacAtCleanup')):
+        root.remove(element)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _compact_settings(settings_xml: bytes) -> bytes:
+    from lxml import etree
+
+    root = etree.fromstring(settings_xml)
+    for child in list(root):
+        if etree.QName(child).localname not in _KEPT_SETTINGS or etree.QName(child).namespace != _W:
+            root.remove(child)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _compact_content_types(content_types_xml: bytes, removed: set) -> bytes:
+    from lxml import etree
+
+    root = etree.fromstring(content_types_xml)
+    for override in root.findall(f'{{{_CT}}}Override'):
+        if override.get('PartName').lstrip('/') in removed:
+            root.remove(override)
+    for default in root.findall(f'{{{_CT}}}Default'):
+        if default.get('Extension') not in ('rels', 'xml'): # e.g. jpeg for the thumbnail
+            root.remove(default)
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _compact_parts(package: zipfile.ZipFile, used_styles: FrozenSet[str],
+                   used_num_ids: FrozenSet[str]) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    Rewritten non-document parts of package, in package order. Cached by the names and
+    CRCs of the original parts and the styles and numbering ids the document uses.
+    """
+    template = tuple((info.filename, info.CRC) for info in package.infolist() if info.filename != _DOCUMENT_PART)
+    key = (template, used_styles, used_num_ids)
+    parts = _parts_cache.get(key)
+    if parts is None:
+        parts = _rewrite_parts({name: package.read(name) for name, _ in template}, used_styles, used_num_ids)
+        with _parts_cache_lock:
+            if len(_parts_cache) >= _CACHE_SIZE:
+                _parts_cache.pop(next(iter(_parts_cache)))
+            _parts_cache[key] = parts
+    return parts
+
+
+def _rewrite_parts(parts: Dict[str, bytes], used_styles: FrozenSet[str],
+                   used_num_ids: FrozenSet[str]) -> Tuple[Tuple[str, bytes], ...]:
+
+    removed = set()
+    for rels_name, base in (('_rels/.rels', ''), ('word/_rels/document.xml.rels', 'word/')):
+        if rels_name in parts:
+            parts[rels_name], dropped = _relationship_targets(parts[rels_name], base)
+            removed |= dropped
+    if any(name.startswith('customXml/') for name in removed):
+        # customXml items come with their own relationships and properties parts
+        removed |= {name for name in parts if name.startswith('customXml/')}
+    theme_fonts = {}
+    for name in removed:
+        if name.startswith('word/theme/') and name in parts:
+            theme_fonts = _theme_fonts(parts[name])
+
+    num_ids = used_num_ids
+    if 'word/styles.xml' in parts:
+        parts['word/styles.xml'], style_num_ids = _compact_styles(parts['word/styles.xml'], used_styles, theme_fonts)
+        num_ids |= style_num_ids
+    if 'word/numbering.xml' in parts:
+        parts['word/numbering.xml'] = _compact_numbering(parts['word/numbering.xml'], num_ids)
+    if 'word/settings.xml' in parts:
+        parts['word/settings.xml'] = _compact_settings(parts['word/settings.xml'])
+    parts['[Content_Types].xml'] = _compact_content_types(parts['[Content_Types].xml'], removed)
+    return tuple((name, data) for name, data in parts.items() if name not in removed)
+
+
+def compact_docx(data: bytes) -> bytes:
+    """
+    Returns a smaller DOCX package with the same document body and formatting.
+    """
+    with zipfile.ZipFile(BytesIO(data)) as package:
+        document_xml = package.read(_DOCUMENT_PART)
+        used_styles = frozenset(match.decode('utf-8') for match in _STYLE_REFERENCE.findall(document_xml))
+        used_num_ids = frozenset(match.decode('utf-8') for match in _NUM_REFERENCE.findall(document_xml))
+        parts = _compact_parts(package, used_styles, used_num_ids)
+
+    output = BytesIO()
+    with zipfile.ZipFile(output, 'w') as package:
+        # [Content_Types].xml first, as Office writes it
+        for name, part in sorted(parts + ((_DOCUMENT_PART, document_xml),), key=lambda item: item[0] != '[Content_Types].xml'):
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            package.writestr(info, part, compresslevel=9)
+    return output.getvalue()
@@ -0,0 +1,165 @@
+"""
+Streaming DOCX engine for the CV template.
+
+The python-docx engine in export_utils loads the default template and builds an lxml
+tree paragraph by paragraph on every call. This engine prepares the package once per
+process: every part except word/document.xml (styles, numbering, theme, settings, ...)
+is taken from an empty python-docx document with the template's Normal font applied,
+and kept compressed. Each export then appends word/document.xml to a copy of that
+skeleton, streaming WordprocessingML for the CV straight into the zip entry. The
+paragraph styles (Heading1, Heading2, IntenseQuote, ListBullet) are the ones the
+python-docx engine uses, so both engines produce the same document.
+"""
+import re
+import threading
+import zipfile
+from io import BytesIO
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+from cv_document import CVDocument, Run, as_document
+from models import CVData
+
+_DOCUMENT_PART = 'word/document.xml'
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0) # Fixed timestamp keeps the output deterministic
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_RUN_SPECIAL_CHARS = re.compile('[\t\r\n]')
+
+_skeleton: Optional[Tuple[bytes, str, str]] = None
+_skeleton_lock = threading.Lock()
+
+
+def _build_skeleton() -> Tuple[bytes, str, str]:
+    """
+    Returns (zip bytes without the document part, document.xml head, document.xml tail).
+    """
+    from docx import Document
+    from docx.shared import Pt
+
+    document = Document()
+    font = document.styles['Normal'].font
+    font.name = 'Calibri'
+    font.size = Pt(12)
+    template = BytesIO()
+    document.save(template)
+
+    skeleton = BytesIO()
+    with zipfile.ZipFile(template) as source, zipfile.ZipFile(skeleton, 'w', zipfile.ZIP_DEFLATED) as target:
+        for name in source.namelist():
+            if name == _DOCUMENT_PART:
+                document_xml = source.read(name).decode('utf-8')
+                continue
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(info, source.read(name))
+
+    head, _, rest = document_xml.partition('<w:body>')
+    section_properties = rest[rest.index('<w:sectPr'):]
+    return skeleton.getvalue(), head + '<w:body>', section_properties
+
+
+def _get_skeleton() -> Tuple[bytes, str, str]:
+    global _skeleton
+    if _skeleton is None:
+        with _skeleton_lock:
+            if _skeleton is None:
+                _skeleton = _build_skeleton()
+    return _skeleton
+
+
+def _run(text: str, bold: bool = False, size: Optional[int] = None) -> str:
+    """
+    WordprocessingML for one run, translating tabs and line breaks like python-docx.
+    """
+    properties = ''
+    if bold or size:
+        properties = '<w:rPr>' + ('<w:b/>' if bold else '') + (f'<w:sz w:val="{size}"/>' if size else '') + '</w:rPr>'
+    content = []
+    position = 0
+    text = _INVALID_XML_CHARS.sub('', text)
+    for match in _RUN_SPECIAL_CHARS.finditer(text):
+        content.append(_text(text[position:match.start()]))
+        content.append('<w:tab/>' if match.group() == '\t' else '<w:br/>')
+        position = match.end()
+    content.append(_text(text[position:]))
+    return f'<w:r>{properties}{"".join(content)}</w:r>'
+
+
+def _text(text: str) -> str:
+    if not text:
+        return ''
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+
+def _paragraph(*runs: str, style: Optional[str] = None, centered: bool = False) -> str:
+    properties = ''
+    if style or centered:
+        properties = ('<w:pPr>' + (f'<w:pStyle w:val="{style}"/>' if style else '')
+                      + ('<w:jc w:val="center"/>' if centered else '') + '</w:pPr>')
+    if not properties and not runs:
+        return '<w:p/>'
+    return f'<w:p>{properties}{"".join(runs)}</w:p>'
+
+
+def _runs(runs: Sequence[Run]) -> List[str]:
+    return [_run(run.text, bold=run.bold) for run in runs]
+
+
+def iter_document_body(cv_data: Union[CVData, CVDocument]) -> Iterator[str]:
+    """
+    Yields the body paragraphs of word/document.xml, one section at a time.
+    """
+    cv = as_document(cv_data)
+    if cv.name:
+        parts = [_paragraph(_run(cv.name, size=48), style='Heading1', centered=True)]
+        if cv.contacts:
+            parts.append(_paragraph(_run(" | ".join(contact.labelled for contact in cv.contacts)), centered=True))
+        parts.append(_paragraph())
+        yield ''.join(parts)
+
+    for section in cv.sections:
+        parts = [_paragraph(_run(section.title), style='Heading2')]
+        for paragraph in section.paragraphs:
+            parts.append(_paragraph(*_runs(paragraph)))
+        if section.paragraphs:
+            parts.append(_paragraph())
+        yield ''.join(parts)
+
+        for entry in section.entries:
+            heading = _runs(entry.heading)
+            if section.key == 'experience':
+                parts = [_paragraph(*heading, _run(f", {entry.place}"), style='IntenseQuote')]
+            else:
+                parts = [_paragraph(*heading, style='IntenseQuote'), _paragraph(_run(entry.place))]
+            parts.append(_paragraph(_run(f"{entry.start_date} - {entry.end_date}")))
+            if entry.gpa:
+                parts.append(_paragraph(_run(f"GPA: {entry.gpa}")))
+            for bullet in entry.bullets:
+                parts.append(_paragraph(_run(bullet), style='ListBullet'))
+            parts.append(_paragraph())
+            yield ''.join(parts)
+
+
+def write_docx_stream(cv_data: Union[CVData, CVDocument], fileobj: BinaryIO) -> None:
+    """
+    Writes the CV as a DOCX package to a seekable binary file opened for writing.
+    """
+    skeleton, head, tail = _get_skeleton()
+    fileobj.write(skeleton)
+    with zipfile.ZipFile(fileobj, 'a', zipfile.ZIP_DEFLATED) as package:
+        info = zipfile.ZipInfo(_DOCUMENT_PART, date_time=_ZIP_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with package.open(info, 'w') as document:
+            document.write(head.encode('utf-8'))
+            for chunk in iter_document_body(cv_data):
+                document.write(chunk.encode('utf-8'))
+            document.write(tail.encode('utf-8'))
+
+
+def render_docx_stream(cv_data: Union[CVData, CVDocument]) -> BytesIO:
+    buffer = BytesIO()
+    write_docx_stream(cv_data, buffer)
+    buffer.seek(0)
+    return buffer
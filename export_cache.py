@@ -0,0 +1,230 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from cv_document import CVDocument
+from models import CVData
+
+
+def fingerprint(obj) -> str:
+    """
+    Returns a stable content hash for a CVData object (or any of its parts).
+    Two objects holding the same values always produce the same fingerprint.
+    """
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExportCache:
+    """
+    Bounded LRU cache for rendered CV documents, keyed by the CV fingerprint
+    and the export format. Safe to share between Streamlit sessions.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, fmt: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get((key, fmt))
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((key, fmt))
+            self.hits += 1
+            return data
+
+    def put(self, key: str, fmt: str, data: bytes) -> None:
+        with self._lock:
+            self._entries[(key, fmt)] = data
+            self._entries.move_to_end((key, fmt))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, cv_data: CVData, fmt: str, render: Callable[[CVData], bytes]) -> bytes:
+        """
+        Returns the cached bytes for (cv_data, fmt), calling render(cv_data) only on a miss.
+        """
+        key = fingerprint(cv_data)
+        data = self.get(key, fmt)
+        if data is None:
+            data = render(cv_data)
+            self.put(key, fmt, data)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                "max_entries": self.max_entries}
+
+
+class DiskExportCache:
+    """
+    Size-bounded cache of rendered CV documents in a directory, with the same interface as
+    ExportCache. Entries survive restarts and are shared by every process that opens the
+    same directory.
+
+    Files are written to a temporary name and renamed into place, so readers never see a
+    partial entry. A hit refreshes the file's mtime; when the cache grows past max_bytes,
+    the least recently used files are deleted until it is below 90% of the limit. Each
+    process tracks the size of its own writes and rescans the directory before evicting
+    and every RESCAN_EVERY writes, so the limit holds approximately across processes.
+    """
+
+    RESCAN_EVERY = 64
+    _TMP_PREFIX = ".tmp-"
+    _STALE_TMP_SECONDS = 3600 # Temporary files left behind by a crashed writer
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._size = sum(size for _, _, size in self._scan())
+
+    def _path(self, key: str, fmt: str) -> str:
+        name = hashlib.sha256(f"{key}\0{fmt}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name[:2], name)
+
+    def _scan(self):
+        """
+        Yields (path, mtime, size) for every entry, removing stale temporary files.
+        """
+        now = time.time()
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError: # Evicted by another process
+                    continue
+                if entry.name.startswith(self._TMP_PREFIX):
+                    if now - stat.st_mtime > self._STALE_TMP_SECONDS:
+                        self._remove(entry.path)
+                    continue
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._scan())
+
+    def get(self, key: str, fmt: str) -> Optional[bytes]:
+        path = self._path(key, fmt)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path) # Mark as recently used
+        except FileNotFoundError: # Evicted by another process since the read
+            pass
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, fmt: str, data: bytes) -> None:
+        path = self._path(key, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=self._TMP_PREFIX, dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        with self._lock:
+            self._size += len(data)
+            self._writes += 1
+            if self._writes % self.RESCAN_EVERY == 0 or self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._scan(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+        if size > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for path, _, entry_size in entries:
+                if size <= target:
+                    break
+                self._remove(path)
+                size -= entry_size
+        self._size = size
+
+    def get_or_render(self, cv_data: CVData, fmt: str, render: Callable[[CVData], bytes]) -> bytes:
+        key = fingerprint(cv_data)
+        data = self.get(key, fmt)
+        if data is None:
+            data = render(cv_data)
+            self.put(key, fmt, data)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _, _ in list(self._scan()):
+                self._remove(path)
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._size, "max_bytes": self.max_bytes}
+
+
+class DeferredExport:
+    """
+    Zero-argument callable that renders one export format on demand.
+
+    The CV is snapshotted when the object is created (an immutable CVDocument is used as
+    is), so the document matches what the user saw even if the session state changes
+    before the download is requested.
+    Rendering goes through the shared ExportCache, so the bytes are kept until the CV changes.
+    """
+
+    def __init__(self, cache: ExportCache, cv_data: Union[CVData, CVDocument], fmt: str,
+                 render: Callable[[Union[CVData, CVDocument]], bytes]):
+        self.cache = cache
+        self.cv_data = cv_data if isinstance(cv_data, CVDocument) else copy.deepcopy(cv_data)
+        self.fmt = fmt
+        self.render = render
+
+    def __call__(self) -> bytes:
+        return self.cache.get_or_render(self.cv_data, self.fmt, self.render)
@@ -0,0 +1,152 @@
+"""
+Opt-in stage timing for the export pipeline.
+
+export_to_pdf and export_to_docx split each export into named stages (style setup,
+story construction, layout, save, ...). While at least one observer is registered, every
+export records the duration and the net change in allocated memory blocks of each stage
+and passes the resulting ExportProfile to the observers. With no observers the stages
+are shared no-op context managers, so instrumented exports cost a few attribute lookups.
+
+    with observe_exports(profiles.append):
+        export_to_pdf(cv_data, "cv.pdf")
+
+observe_exports only sees exports made in the same thread or asyncio context, so
+concurrent Streamlit sessions do not receive each other's profiles; add_export_observer
+registers a process-wide observer instead (e.g. for logging).
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Tuple
+
+@dataclass(frozen=True)
+class StageTiming:
+    name: str
+    seconds: float
+    allocated_blocks: int # Net change in allocated memory blocks (sys.getallocatedblocks)
+
+@dataclass
+class ExportProfile:
+    """
+    Stage timings of one export, in the order the stages ran, and the size of its output.
+    """
+    fmt: str
+    engine: str
+    stages: List[StageTiming] = field(default_factory=list)
+    output_bytes: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stage.seconds for stage in self.stages)
+
+    def as_rows(self) -> List[dict]:
+        """
+        One dict per stage, ready for a table widget.
+        """
+        return [{"stage": stage.name, "ms": round(stage.seconds * 1000, 3),
+                 "allocated blocks": stage.allocated_blocks} for stage in self.stages]
+
+ExportObserver = Callable[[ExportProfile], None]
+
+_GLOBAL_OBSERVERS: Tuple[ExportObserver, ...] = ()
+_GLOBAL_LOCK = threading.Lock()
+_CONTEXT_OBSERVERS: ContextVar[Tuple[ExportObserver, ...]] = ContextVar("export_observers", default=())
+
+def add_export_observer(observer: ExportObserver) -> None:
+    """
+    Registers a process-wide observer, called with the ExportProfile of every export.
+    """
+    global _GLOBAL_OBSERVERS
+    with _GLOBAL_LOCK:
+        _GLOBAL_OBSERVERS = _GLOBAL_OBSERVERS + (observer,)
+
+def remove_export_observer(observer: ExportObserver) -> None:
+    global _GLOBAL_OBSERVERS
+    with _GLOBAL_LOCK:
+        _GLOBAL_OBSERVERS = tuple(registered for registered in _GLOBAL_OBSERVERS if registered != observer)
+
+@contextmanager
+def observe_exports(observer: ExportObserver) -> Iterator[None]:
+    """
+    Calls observer with the ExportProfile of every export made in the current context
+    until the block exits.
+    """
+    token = _CONTEXT_OBSERVERS.set(_CONTEXT_OBSERVERS.get() + (observer,))
+    try:
+        yield
+    finally:
+        _CONTEXT_OBSERVERS.reset(token)
+
+
+class _Stage:
+    __slots__ = ("_profile", "_name", "_start", "_blocks")
+
+    def __init__(self, profile: ExportProfile, name: str):
+        self._profile = profile
+        self._name = name
+
+    def __enter__(self):
+        self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        self._profile.stages.append(StageTiming(self._name, elapsed, sys.getallocatedblocks() - self._blocks))
+        return False
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class ExportRecorder:
+    """
+    Collects the stages of one export and hands the profile to the observers on finish().
+    """
+    __slots__ = ("profile", "_observers")
+
+    def __init__(self, fmt: str, engine: str, observers: Tuple[ExportObserver, ...]):
+        self.profile = ExportProfile(fmt, engine)
+        self._observers = observers
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self.profile, name)
+
+    def finish(self, output_bytes: int = 0) -> None:
+        self.profile.output_bytes = output_bytes
+        for observer in self._observers:
+            observer(self.profile)
+
+
+class _DisabledRecorder:
+    __slots__ = ()
+    _STAGE = _NoStage()
+
+    def stage(self, name: str) -> _NoStage:
+        return self._STAGE
+
+    def finish(self, output_bytes: int = 0) -> None:
+        pass
+
+
+_DISABLED = _DisabledRecorder()
+
+def start_export(fmt: str, engine: str):
+    """
+    Returns a recorder for one export: an ExportRecorder when anyone is observing, or a
+    shared no-op recorder otherwise.
+    """
+    observers = _GLOBAL_OBSERVERS + _CONTEXT_OBSERVERS.get()
+    if not observers:
+        return _DISABLED
+    return ExportRecorder(fmt, engine, observers)
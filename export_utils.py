@@ -1,279 +1,512 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from io import BytesIO
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem, PageBreak, HRFlowable
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, mm
-from reportlab.lib.pagesizes import A4 # Using A4 as per metric preference
-from reportlab.platypus import HRFlowable, KeepTogether
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.lib.colors import black
-
-from models import CVData, PersonalInformation, Education, Experience, Skills # Import CVData and its components
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+from models import CVData
+from cv_document import CVDocument, Run, as_document
+from docx_stream import render_docx_stream
+from docx_compact import compact_docx
+from export_timing import start_export
+from export_cache import fingerprint
+
+# ReportLab and python-docx take a large share of startup time, so they (and pdf_canvas,
+# which needs ReportLab) are imported on first export; warm_up_exports loads them early.
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
 
 # Helper function for drawing a line
 def draw_line(canvas, doc):
     canvas.line(doc.leftMargin, doc.y, doc.width + doc.leftMargin, doc.y)
 
-def export_to_pdf(cv_data: CVData, filename: str) -> BytesIO:
-    buffer = BytesIO()
-    
-    # Use A4 and define margins in mm
-    doc = SimpleDocTemplate(buffer, pagesize=A4,
-                            rightMargin=20*mm, leftMargin=20*mm,
-                            topMargin=20*mm, bottomMargin=20*mm)
-    
-    styles = getSampleStyleSheet()
-    
+def _pdf_markup(runs: Sequence[Run]) -> str:
+    """
+    Paragraph markup for styled runs; user text is escaped so it is never parsed as markup.
+    """
+    return "".join(f"<b>{escape(run.text)}</b>" if run.bold else escape(run.text) for run in runs)
+
+def _add_docx_runs(paragraph, runs: Sequence[Run]):
+    for run in runs:
+        if run.bold:
+            paragraph.add_run(run.text).bold = True
+        else:
+            paragraph.add_run(run.text)
+    return paragraph
+
+@dataclass(frozen=True)
+class PdfTheme:
+    """
+    Typography settings for the PDF template. Sizes are in points, spacing in mm.
+    """
+    name: str
+    font_name: str = 'Helvetica'
+    bold_font_name: str = 'Helvetica-Bold'
+    name_size: float = 28
+    section_size: float = 16
+    subheading_size: float = 12
+    body_size: float = 10
+    spacing: float = 1.0 # Multiplier applied to all vertical spacing
+
+# Built-in themes; "classic" is the original professional template
+_PDF_THEMES: Dict[str, PdfTheme] = {}
+# Stylesheets by (theme, scale, base14); scaled variants are evicted oldest first
+_PDF_STYLESHEETS: Dict[Tuple[str, float, bool], Mapping[str, 'ParagraphStyle']] = {}
+_PDF_THEME_LOCK = threading.Lock()
+_MAX_SCALED_STYLESHEETS = 64
+
+def register_pdf_theme(theme: PdfTheme) -> None:
+    """
+    Adds (or replaces) a named PDF theme. Its stylesheet is built on first use.
+    """
+    with _PDF_THEME_LOCK:
+        _PDF_THEMES[theme.name] = theme
+        for key in [key for key in _PDF_STYLESHEETS if key[0] == theme.name]:
+            del _PDF_STYLESHEETS[key]
+
+def pdf_theme_names() -> List[str]:
+    return list(_PDF_THEMES)
+
+def get_pdf_styles(theme: str = 'classic', scale: float = 1.0, base14: bool = False) -> Mapping[str, 'ParagraphStyle']:
+    """
+    Returns the read-only stylesheet for a theme, building it once per process. scale
+    multiplies every font size and spacing (see scale_pdf_theme); base14=True replaces any
+    font that is not one of the 14 standard PDF fonts by Helvetica (or Helvetica-Bold), so
+    no font has to be embedded.
+    """
+    key = (theme, scale, base14)
+    styles = _PDF_STYLESHEETS.get(key)
+    if styles is None:
+        with _PDF_THEME_LOCK:
+            if theme not in _PDF_THEMES:
+                raise ValueError(f"Unknown PDF theme '{theme}'. Available themes: {', '.join(_PDF_THEMES)}")
+            styles = _PDF_STYLESHEETS.get(key)
+            if styles is None:
+                styles = _variant_styles(_PDF_THEMES[theme], scale, base14)
+                if scale != 1.0:
+                    scaled = [cached for cached in _PDF_STYLESHEETS if cached[1] != 1.0]
+                    if len(scaled) >= _MAX_SCALED_STYLESHEETS:
+                        del _PDF_STYLESHEETS[scaled[0]]
+                _PDF_STYLESHEETS[key] = styles
+    return styles
+
+def get_pdf_base14_styles(theme: str = 'classic') -> Mapping[str, 'ParagraphStyle']:
+    return get_pdf_styles(theme, base14=True)
+
+def scale_pdf_theme(theme: PdfTheme, scale: float) -> PdfTheme:
+    """
+    Returns theme with all font sizes and vertical spacing multiplied by scale.
+    """
+    return replace(theme, name_size=theme.name_size*scale, section_size=theme.section_size*scale,
+                   subheading_size=theme.subheading_size*scale, body_size=theme.body_size*scale,
+                   spacing=theme.spacing*scale)
+
+def _variant_styles(theme: PdfTheme, scale: float, base14: bool) -> Mapping[str, 'ParagraphStyle']:
+    """
+    Builds a stylesheet variant, reusing the theme's plain stylesheet when the variant
+    changes nothing. Called with _PDF_THEME_LOCK held.
+    """
+    settings = theme
+    if base14:
+        from reportlab.pdfbase.pdfmetrics import standardFonts
+        settings = replace(settings,
+                           font_name=settings.font_name if settings.font_name in standardFonts else 'Helvetica',
+                           bold_font_name=settings.bold_font_name if settings.bold_font_name in standardFonts else 'Helvetica-Bold')
+    if scale != 1.0:
+        settings = scale_pdf_theme(settings, scale)
+    if settings == theme:
+        plain = _PDF_STYLESHEETS.get((theme.name, 1.0, False))
+        if plain is None:
+            plain = _PDF_STYLESHEETS[(theme.name, 1.0, False)] = _build_pdf_styles(theme)
+        return plain
+    return _build_pdf_styles(settings)
+
+def _build_pdf_styles(theme: PdfTheme) -> Mapping[str, 'ParagraphStyle']:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER
+    from reportlab.lib.colors import black
+
+    space = theme.spacing * mm
+    styles = {}
+
     # Custom styles based on a professional template (using metric units for sizes)
-    styles.add(ParagraphStyle(name='NameStyle',
-                             fontName='Helvetica-Bold',
-                             fontSize=28,
-                             leading=32,
+    styles['NameStyle'] = ParagraphStyle(name='NameStyle',
+                             fontName=theme.bold_font_name,
+                             fontSize=theme.name_size,
+                             leading=theme.name_size + 4,
                              alignment=TA_CENTER,
-                             spaceAfter=2*mm))
+                             spaceAfter=2*space)
 
-    styles.add(ParagraphStyle(name='ContactInfoStyle',
-                             fontName='Helvetica',
-                             fontSize=10,
-                             leading=12,
+    styles['ContactInfoStyle'] = ParagraphStyle(name='ContactInfoStyle',
+                             fontName=theme.font_name,
+                             fontSize=theme.body_size,
+                             leading=theme.body_size + 2,
                              alignment=TA_CENTER,
-                             spaceAfter=8*mm, # Increased space for separation
-                             textColor=black))
+                             spaceAfter=8*space, # Increased space for separation
+                             textColor=black)
 
-    styles.add(ParagraphStyle(name='SectionTitleStyle',
-                             fontName='Helvetica-Bold',
-                             fontSize=16,
-                             leading=18,
+    styles['SectionTitleStyle'] = ParagraphStyle(name='SectionTitleStyle',
+                             fontName=theme.bold_font_name,
+                             fontSize=theme.section_size,
+                             leading=theme.section_size + 2,
                              alignment=TA_LEFT,
-                             spaceBefore=10*mm, # Space before section title
-                             spaceAfter=4*mm,
-                             textColor=black))
-    
-    styles.add(ParagraphStyle(name='SubHeadingStyleBold',
-                             fontName='Helvetica-Bold',
-                             fontSize=12,
-                             leading=14,
+                             spaceBefore=10*space, # Space before section title
+                             spaceAfter=4*space,
+                             textColor=black)
+
+    styles['SubHeadingStyleBold'] = ParagraphStyle(name='SubHeadingStyleBold',
+                             fontName=theme.bold_font_name,
+                             fontSize=theme.subheading_size,
+                             leading=theme.subheading_size + 2,
                              alignment=TA_LEFT,
-                             spaceAfter=1*mm,
-                             textColor=black))
-    
-    styles.add(ParagraphStyle(name='SubHeadingStyleNormal',
-                             fontName='Helvetica',
-                             fontSize=12,
-                             leading=14,
+                             spaceAfter=1*space,
+                             textColor=black)
+
+    styles['SubHeadingStyleNormal'] = ParagraphStyle(name='SubHeadingStyleNormal',
+                             fontName=theme.font_name,
+                             fontSize=theme.subheading_size,
+                             leading=theme.subheading_size + 2,
                              alignment=TA_LEFT,
-                             spaceAfter=1*mm,
-                             textColor=black))
+                             spaceAfter=1*space,
+                             textColor=black)
 
-    styles.add(ParagraphStyle(name='DateLocationStyle',
-                             fontName='Helvetica',
-                             fontSize=10,
-                             leading=12,
+    styles['DateLocationStyle'] = ParagraphStyle(name='DateLocationStyle',
+                             fontName=theme.font_name,
+                             fontSize=theme.body_size,
+                             leading=theme.body_size + 2,
                              alignment=TA_LEFT, # Changed to left for now, will adjust based on template
-                             spaceAfter=4*mm,
-                             textColor=black))
+                             spaceAfter=4*space,
+                             textColor=black)
 
-    styles.add(ParagraphStyle(name='NormalTextStyle',
-                             fontName='Helvetica',
-                             fontSize=10,
-                             leading=12,
+    styles['NormalTextStyle'] = ParagraphStyle(name='NormalTextStyle',
+                             fontName=theme.font_name,
+                             fontSize=theme.body_size,
+                             leading=theme.body_size + 2,
                              alignment=TA_LEFT,
-                             spaceAfter=4*mm,
-                             textColor=black))
-    
-    styles.add(ParagraphStyle(name='BulletPointStyle',
-                             fontName='Helvetica',
-                             fontSize=10,
-                             leading=12,
+                             spaceAfter=4*space,
+                             textColor=black)
+
+    styles['BulletPointStyle'] = ParagraphStyle(name='BulletPointStyle',
+                             fontName=theme.font_name,
+                             fontSize=theme.body_size,
+                             leading=theme.body_size + 2,
                              alignment=TA_LEFT,
                              leftIndent=5*mm,
                              bulletIndent=2*mm,
                              bulletText='•', # Unicode for a standard bullet point
-                             spaceBefore=0.5*mm,
-                             spaceAfter=0.5*mm,
-                             textColor=black))
+                             spaceBefore=0.5*space,
+                             spaceAfter=0.5*space,
+                             textColor=black)
+
+    return MappingProxyType(styles)
+
+register_pdf_theme(PdfTheme(name='classic'))
+register_pdf_theme(PdfTheme(name='compact', name_size=22, section_size=13, subheading_size=11,
+                            body_size=9, spacing=0.6))
+register_pdf_theme(PdfTheme(name='serif', font_name='Times-Roman', bold_font_name='Times-Bold',
+                            name_size=26, section_size=15, subheading_size=12, body_size=11))
+
+# Bump when a change to the templates alters the rendered output, so cached renders
+# made by older code are not served
+TEMPLATE_VERSION = 2 # 2: canvas engine no longer gives empty paragraphs a blank line
+
+# Optional render cache (an export_cache.ExportCache or DiskExportCache) consulted by every export
+_RENDER_CACHE = None
+
+def set_render_cache(cache) -> None:
+    """
+    Makes export_to_pdf/export_to_docx look up and store their output in cache (None to
+    turn caching off). Entries are keyed by the CV fingerprint, format, engine, theme
+    settings and TEMPLATE_VERSION.
+    """
+    global _RENDER_CACHE
+    _RENDER_CACHE = cache
+
+def get_render_cache():
+    return _RENDER_CACHE
+
+def _export_cache(cache):
+    """
+    The cache an export uses: the render cache for None, no cache for False, otherwise cache.
+    """
+    if cache is None:
+        return _RENDER_CACHE
+    return None if cache is False else cache
+
+def _cached_render(recorder, cache, cv: CVDocument, variant: str, render) -> BytesIO:
+    """
+    Returns render() or, with a cache, the bytes cached for (cv, variant).
+    """
+    if cache is None:
+        return render()
+    with recorder.stage('cache lookup'):
+        key = fingerprint(cv)
+        variant = f"{variant}/v{TEMPLATE_VERSION}"
+        data = cache.get(key, variant)
+    if data is not None:
+        return BytesIO(data)
+    buffer = render()
+    with recorder.stage('cache store'):
+        cache.put(key, variant, buffer.getvalue())
+    return buffer
+
+PDF_ENGINES = ('platypus', 'canvas')
+
+# ReportLab reads the process-wide rl_config.useA85 while it writes streams, and compact
+# renders turn it off (binary streams are ~20% smaller than ASCII85 text). PDF renders
+# therefore take turns by stream mode: any number with the same mode run at once, and the
+# setting only changes while no render is running.
+_STREAM_MODE = threading.Condition()
+_stream_mode_renders = 0
+_stream_mode_binary = False
+_stream_mode_waiting = {False: 0, True: 0}
+_saved_use_a85 = 1
+
+@contextmanager
+def _pdf_stream_mode(binary: bool) -> Iterator[None]:
+    global _stream_mode_renders, _stream_mode_binary, _saved_use_a85
+    from reportlab import rl_config
+    with _STREAM_MODE:
+        _stream_mode_waiting[binary] += 1
+        # Renders of the other mode wait for the running ones; new renders of the running
+        # mode also wait while the other mode is queued, so neither starves
+        while _stream_mode_renders and (_stream_mode_binary != binary or _stream_mode_waiting[not binary]):
+            _STREAM_MODE.wait()
+        _stream_mode_waiting[binary] -= 1
+        if _stream_mode_renders == 0:
+            _stream_mode_binary = binary
+            if binary:
+                _saved_use_a85 = rl_config.useA85
+                rl_config.useA85 = 0
+        _stream_mode_renders += 1
+    try:
+        yield
+    finally:
+        with _STREAM_MODE:
+            _stream_mode_renders -= 1
+            if _stream_mode_renders == 0:
+                if _stream_mode_binary:
+                    rl_config.useA85 = _saved_use_a85
+                _STREAM_MODE.notify_all()
+
+def export_to_pdf(cv_data: Union[CVData, CVDocument], filename: str, theme: str = 'classic', engine: str = 'platypus',
+                  optimize_size: bool = False, scale: float = 1.0, cache=None) -> BytesIO:
+    """
+    Renders the CV (CVData or a prebuilt CVDocument) as an A4 PDF. engine='canvas' uses the
+    direct canvas renderer in pdf_canvas, which draws the same template without the platypus
+    layout pipeline. optimize_size=True writes compressed binary streams, reproducible
+    output and only the 14 standard PDF fonts. scale shrinks or enlarges all text and
+    spacing (page_fit.fit_to_pages picks one that fits a page budget). Stage timings and the output size are
+    reported to export_timing observers, if any. Output is looked up in and stored to cache
+    (an export_cache.ExportCache or DiskExportCache), by default the render cache set with
+    set_render_cache, if any; cache=False always renders.
+    """
+    if engine not in PDF_ENGINES:
+        raise ValueError(f"Unknown PDF engine '{engine}'. Available engines: {', '.join(PDF_ENGINES)}")
+    recorder = start_export('pdf', engine)
+    with recorder.stage('styles'):
+        styles = get_pdf_styles(theme, scale, base14=optimize_size)
+    with recorder.stage('document'):
+        cv = as_document(cv_data)
+    cache = _export_cache(cache)
+    variant = ''
+    if cache is not None:
+        variant = f"pdf/{engine}/{theme}/{fingerprint(_PDF_THEMES[theme])}" + ('/small' if optimize_size else '')
+        if scale != 1.0:
+            variant += f"/x{scale!r}"
+    buffer = _cached_render(recorder, cache, cv, variant, lambda: _render_pdf(recorder, cv, styles, engine, optimize_size))
+    recorder.finish(buffer.getbuffer().nbytes)
+    return buffer
+
+def _render_pdf(recorder, cv: CVDocument, styles: Mapping[str, 'ParagraphStyle'], engine: str,
+                optimize_size: bool = False) -> BytesIO:
+    with _pdf_stream_mode(binary=optimize_size):
+        return _render_pdf_streams(recorder, cv, styles, engine, compact=optimize_size)
+
+def _render_pdf_streams(recorder, cv: CVDocument, styles: Mapping[str, 'ParagraphStyle'], engine: str,
+                        compact: bool) -> BytesIO:
+    if engine == 'canvas':
+        from pdf_canvas import render_pdf_canvas
+        with recorder.stage('render'):
+            return render_pdf_canvas(cv, styles, compact=compact)
+
+    with recorder.stage('story'):
+        story = _pdf_story(cv, styles)
+
+    with recorder.stage('layout'):
+        from reportlab.platypus import SimpleDocTemplate
+        from reportlab.lib.units import mm
+        from reportlab.lib.pagesizes import A4 # Using A4 as per metric preference
+        buffer = BytesIO()
+        compression = {'pageCompression': 1, 'invariant': 1} if compact else {}
+        # Use A4 and define margins in mm
+        doc = SimpleDocTemplate(buffer, pagesize=A4,
+                                rightMargin=20*mm, leftMargin=20*mm,
+                                topMargin=20*mm, bottomMargin=20*mm, **compression)
+        doc.build(story)
+        buffer.seek(0)
+    return buffer
+
+def _pdf_story(cv: CVDocument, styles: Mapping[str, 'ParagraphStyle']) -> list:
+    from reportlab.platypus import Paragraph, Spacer, ListFlowable, ListItem, HRFlowable, KeepTogether
+    from reportlab.lib.units import mm
+    from reportlab.lib.colors import black
 
     story = []
 
     # --- Personal Information ---
-    if cv_data.personal_info.name:
-        story.append(Paragraph(cv_data.personal_info.name, styles['NameStyle']))
-        
-        contact_details = []
-        if cv_data.personal_info.email:
-            contact_details.append(cv_data.personal_info.email)
-        if cv_data.personal_info.phone:
-            contact_details.append(cv_data.personal_info.phone)
-        if cv_data.personal_info.linkedin:
-            contact_details.append(cv_data.personal_info.linkedin) # Just the URL, not "LinkedIn: "
-        if cv_data.personal_info.github:
-            contact_details.append(cv_data.personal_info.github) # Just the URL, not "GitHub: "
-        
-        if contact_details:
-            story.append(Paragraph(" | ".join(contact_details), styles['ContactInfoStyle']))
-        
-    # --- Summary ---
-    if cv_data.personal_info.summary:
-        story.append(Paragraph("SUMMARY", styles['SectionTitleStyle']))
-        story.append(HRFlowable(width="100%", thickness=1, color=black)) # Horizontal line separator
-        story.append(Spacer(1, 2*mm))
-        story.append(Paragraph(cv_data.personal_info.summary, styles['NormalTextStyle']))
-        story.append(Spacer(1, 4*mm)) # Space after summary
+    if cv.name:
+        story.append(Paragraph(escape(cv.name), styles['NameStyle']))
+        if cv.contacts:
+            # Just the URLs, not "LinkedIn: "
+            story.append(Paragraph(escape(" | ".join(contact.value for contact in cv.contacts)), styles['ContactInfoStyle']))
 
-    # --- Education ---
-    if cv_data.education:
-        story.append(Paragraph("EDUCATION", styles['SectionTitleStyle']))
+    # --- Summary, Education, Experience, Skills ---
+    for section in cv.sections:
+        story.append(Paragraph(section.title.upper(), styles['SectionTitleStyle']))
         story.append(HRFlowable(width="100%", thickness=1, color=black)) # Horizontal line separator
         story.append(Spacer(1, 2*mm))
-        for edu in cv_data.education:
-            edu_details = []
-            edu_details.append(Paragraph(f"<b>{edu.degree}</b> in {edu.major}", styles['SubHeadingStyleBold']))
-            edu_details.append(Paragraph(f"{edu.institution}, {edu.location}", styles['SubHeadingStyleNormal']))
+        for paragraph in section.paragraphs:
+            story.append(Paragraph(_pdf_markup(paragraph), styles['NormalTextStyle']))
+        if section.paragraphs:
+            story.append(Spacer(1, 4*mm))
+
+        for entry in section.entries:
+            entry_details = []
+            entry_details.append(Paragraph(_pdf_markup(entry.heading), styles['SubHeadingStyleBold']))
+            entry_details.append(Paragraph(escape(entry.place), styles['SubHeadingStyleNormal']))
             
             date_gpa_info = []
-            if edu.start_date and edu.end_date:
-                date_gpa_info.append(f"{edu.start_date} - {edu.end_date}")
-            if edu.gpa:
-                date_gpa_info.append(f"GPA: {edu.gpa}")
+            if entry.start_date and entry.end_date:
+                date_gpa_info.append(f"{entry.start_date} - {entry.end_date}")
+            if entry.gpa:
+                date_gpa_info.append(f"GPA: {entry.gpa}")
             
             if date_gpa_info:
-                edu_details.append(Paragraph(" | ".join(date_gpa_info), styles['DateLocationStyle']))
+                entry_details.append(Paragraph(escape(" | ".join(date_gpa_info)), styles['DateLocationStyle']))
             
-            story.append(KeepTogether(edu_details)) # Keep education details together
-            story.append(Spacer(1, 4*mm)) # Space after each education entry
+            story.append(KeepTogether(entry_details)) # Keep the entry header together
 
-    # --- Experience ---
-    if cv_data.experience:
-        story.append(Paragraph("EXPERIENCE", styles['SectionTitleStyle']))
-        story.append(HRFlowable(width="100%", thickness=1, color=black)) # Horizontal line separator
-        story.append(Spacer(1, 2*mm))
-        for exp in cv_data.experience:
-            exp_details = []
-            exp_details.append(Paragraph(f"<b>{exp.title}</b> at {exp.company}", styles['SubHeadingStyleBold']))
-            exp_details.append(Paragraph(f"{exp.location}", styles['SubHeadingStyleNormal']))
-            
-            if exp.start_date and exp.end_date:
-                exp_details.append(Paragraph(f"{exp.start_date} - {exp.end_date}", styles['DateLocationStyle']))
-            
-            story.append(KeepTogether(exp_details)) # Keep experience header together
-
-            if exp.description:
+            if entry.bullets:
                 # Using ListFlowable for proper bullet indentation
-                bullet_list_items = [ListItem(Paragraph(line.strip(), styles['BulletPointStyle'])) for line in exp.description.split('\n') if line.strip()]
-                if bullet_list_items:
-                    story.append(ListFlowable(bullet_list_items,
-                                              bulletType='bullet',
-                                              start='bullet',
-                                              indent=5*mm, # Indent the whole list
-                                              bulletAnchor='start',
-                                              spaceBefore=1*mm,
-                                              spaceAfter=2*mm))
-            story.append(Spacer(1, 4*mm)) # Space after each experience entry
-
-    # --- Skills ---
-    if cv_data.skills.technical or cv_data.skills.soft or cv_data.skills.languages:
-        story.append(Paragraph("SKILLS", styles['SectionTitleStyle']))
-        story.append(HRFlowable(width="100%", thickness=1, color=black)) # Horizontal line separator
-        story.append(Spacer(1, 2*mm))
-        
-        # Using a list for skills to handle multiple types
-        skill_items = []
-        if cv_data.skills.technical:
-            skill_items.append(Paragraph(f"<b>Technical Skills:</b> {', '.join(cv_data.skills.technical)}", styles['NormalTextStyle']))
-        if cv_data.skills.soft:
-            skill_items.append(Paragraph(f"<b>Soft Skills:</b> {', '.join(cv_data.skills.soft)}", styles['NormalTextStyle']))
-        if cv_data.skills.languages:
-            skill_items.append(Paragraph(f"<b>Languages:</b> {', '.join(cv_data.skills.languages)}", styles['NormalTextStyle']))
-        
-        for item in skill_items:
-            story.append(item)
-        story.append(Spacer(1, 4*mm))
-
-
-    doc.build(story)
-    buffer.seek(0)
+                bullet_list_items = [ListItem(Paragraph(escape(bullet), styles['BulletPointStyle'])) for bullet in entry.bullets]
+                story.append(ListFlowable(bullet_list_items,
+                                          bulletType='bullet',
+                                          start='', # The bullet itself comes from BulletPointStyle
+                                          indent=5*mm, # Indent the whole list
+                                          bulletAnchor='start',
+                                          spaceBefore=1*mm,
+                                          spaceAfter=2*mm))
+            story.append(Spacer(1, 4*mm)) # Space after each entry
+    return story
+
+DOCX_ENGINES = ('python-docx', 'stream')
+
+def export_to_docx(cv_data: Union[CVData, CVDocument], filename: str, engine: str = 'python-docx',
+                   optimize_size: bool = False, cache=None) -> BytesIO:
+    """
+    Renders the CV (CVData or a prebuilt CVDocument) as a DOCX document. engine='stream' uses the streaming writer in
+    docx_stream, which writes the same paragraphs without the python-docx object model.
+    optimize_size=True strips unused styles, numbering, the theme and other template parts
+    (see docx_compact). Stage timings and the output size are reported to export_timing
+    observers, if any. cache works as in export_to_pdf.
+    """
+    if engine not in DOCX_ENGINES:
+        raise ValueError(f"Unknown DOCX engine '{engine}'. Available engines: {', '.join(DOCX_ENGINES)}")
+    recorder = start_export('docx', engine)
+    with recorder.stage('document'):
+        cv = as_document(cv_data)
+    cache = _export_cache(cache)
+    variant = f"docx/{engine}" + ('/small' if optimize_size else '')
+    buffer = _cached_render(recorder, cache, cv, variant, lambda: _render_docx(recorder, cv, engine, optimize_size))
+    recorder.finish(buffer.getbuffer().nbytes)
+    return buffer
+
+def _render_docx(recorder, cv: CVDocument, engine: str, optimize_size: bool = False) -> BytesIO:
+    buffer = _render_docx_package(recorder, cv, engine)
+    if optimize_size:
+        with recorder.stage('compact'):
+            buffer = BytesIO(compact_docx(buffer.getvalue()))
     return buffer
 
-def export_to_docx(cv_data: CVData, filename: str) -> BytesIO:
-    document = Document()
-    
-    # Set up basic styles
-    style = document.styles['Normal']
-    font = style.font
-    font.name = 'Calibri'
-    font.size = Pt(12)
+def _render_docx_package(recorder, cv: CVDocument, engine: str) -> BytesIO:
+    if engine == 'stream':
+        with recorder.stage('render'):
+            return render_docx_stream(cv)
+
+    with recorder.stage('template'):
+        from docx import Document
+        from docx.shared import Pt
+        document = Document()
+        # Set up basic styles
+        style = document.styles['Normal']
+        font = style.font
+        font.name = 'Calibri'
+        font.size = Pt(12)
+
+    with recorder.stage('paragraphs'):
+        _add_docx_content(document, cv)
+
+    with recorder.stage('save'):
+        buffer = BytesIO()
+        document.save(buffer)
+        buffer.seek(0)
+    return buffer
+
+def _add_docx_content(document, cv: CVDocument) -> None:
+    from docx.shared import Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
 
     # Personal Information
-    if cv_data.personal_info.name:
+    if cv.name:
         heading = document.add_heading(level=1)
-        runner = heading.add_run(cv_data.personal_info.name)
+        runner = heading.add_run(cv.name)
         runner.font.size = Pt(24)
         heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-        contact_details = []
-        if cv_data.personal_info.email:
-            contact_details.append(cv_data.personal_info.email)
-        if cv_data.personal_info.phone:
-            contact_details.append(cv_data.personal_info.phone)
-        if cv_data.personal_info.linkedin:
-            contact_details.append(f"LinkedIn: {cv_data.personal_info.linkedin}")
-        if cv_data.personal_info.github:
-            contact_details.append(f"GitHub: {cv_data.personal_info.github}")
-        
-        if contact_details:
-            contact_para = document.add_paragraph(" | ".join(contact_details))
+        if cv.contacts:
+            contact_para = document.add_paragraph(" | ".join(contact.labelled for contact in cv.contacts))
             contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         document.add_paragraph() # Add some space
 
-
-    if cv_data.personal_info.summary:
-        document.add_heading("Summary", level=2)
-        document.add_paragraph(cv_data.personal_info.summary)
-        document.add_paragraph() # Add space
-
-    # Education
-    if cv_data.education:
-        document.add_heading("Education", level=2)
-        for edu in cv_data.education:
-            document.add_paragraph(f"<b>{edu.degree}</b> in {edu.major}", style='Intense Quote').runs[0].bold = True # Using Intense Quote for distinct style
-            document.add_paragraph(f"{edu.institution}, {edu.location}")
-            document.add_paragraph(f"{edu.start_date} - {edu.end_date}")
-            if edu.gpa:
-                document.add_paragraph(f"GPA: {edu.gpa}")
+    for section in cv.sections:
+        document.add_heading(section.title, level=2)
+        for paragraph in section.paragraphs:
+            _add_docx_runs(document.add_paragraph(), paragraph)
+        if section.paragraphs:
             document.add_paragraph() # Add space
 
-    # Experience
-    if cv_data.experience:
-        document.add_heading("Experience", level=2)
-        for exp in cv_data.experience:
-            document.add_paragraph(f"<b>{exp.title}</b> at {exp.company}, {exp.location}", style='Intense Quote').runs[0].bold = True
-            document.add_paragraph(f"{exp.start_date} - {exp.end_date}")
-            if exp.description:
-                for line in exp.description.split('\n'):
-                    if line.strip():
-                        document.add_paragraph(line.strip(), style='List Bullet')
+        for entry in section.entries:
+            heading = _add_docx_runs(document.add_paragraph(style='Intense Quote'), entry.heading) # Using Intense Quote for distinct style
+            if section.key == 'experience':
+                heading.add_run(f", {entry.place}")
+            else:
+                document.add_paragraph(entry.place)
+            document.add_paragraph(f"{entry.start_date} - {entry.end_date}")
+            if entry.gpa:
+                document.add_paragraph(f"GPA: {entry.gpa}")
+            for bullet in entry.bullets:
+                document.add_paragraph(bullet, style='List Bullet')
             document.add_paragraph() # Add space
 
-    # Skills
-    if cv_data.skills.technical or cv_data.skills.soft or cv_data.skills.languages:
-        document.add_heading("Skills", level=2)
-        if cv_data.skills.technical:
-            tech_para = document.add_paragraph()
-            tech_para.add_run("Technical Skills: ").bold = True
-            tech_para.add_run(', '.join(cv_data.skills.technical))
-        if cv_data.skills.soft:
-            soft_para = document.add_paragraph()
-            soft_para.add_run("Soft Skills: ").bold = True
-            soft_para.add_run(', '.join(cv_data.skills.soft))
-        if cv_data.skills.languages:
-            lang_para = document.add_paragraph()
-            lang_para.add_run("Languages: ").bold = True
-            lang_para.add_run(', '.join(cv_data.skills.languages))
-        document.add_paragraph() # Add space
-
-    buffer = BytesIO()
-    document.save(buffer)
-    buffer.seek(0)
-    return buffer
\ No newline at end of file
+def warm_up_exports(themes: Sequence[str] = ('classic',)) -> None:
+    """
+    Imports the PDF and DOCX backends and builds the given theme stylesheets, so the
+    first export does not pay for them.
+    """
+    import docx
+    import reportlab.platypus
+    import pdf_canvas
+    for theme in themes:
+        get_pdf_styles(theme)
+
+def start_warm_up(themes: Sequence[str] = ('classic',)) -> threading.Thread:
+    """
+    Runs warm_up_exports in a daemon thread and returns the thread.
+    """
+    thread = threading.Thread(target=warm_up_exports, args=(tuple(themes),), name='export-warm-up', daemon=True)
+    thread.start()
+    return thread
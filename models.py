@@ -1,7 +1,17 @@
-from typing import List, Optional
-from dataclasses import dataclass, field
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 
-@dataclass
+# Slotted classes drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _intern(value):
+    """
+    Interns strings so that repeated dropdown values (degrees, job titles, skills) share one object.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+@dataclass(**_SLOTS)
 class PersonalInformation:
     name: str = ""
     email: str = ""
@@ -10,7 +20,7 @@ class PersonalInformation:
     github: str = ""
     summary: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class Education:
     degree: str = ""
     major: str = ""
@@ -20,7 +30,11 @@ class Education:
     end_date: str = ""
     gpa: Optional[str] = None
 
-@dataclass
+    def __post_init__(self):
+        self.degree = _intern(self.degree)
+        self.major = _intern(self.major)
+
+@dataclass(**_SLOTS)
 class Experience:
     title: str = ""
     company: str = ""
@@ -29,15 +43,113 @@ class Experience:
     end_date: str = ""
     description: str = "" # This will be a multi-line string
 
-@dataclass
+    def __post_init__(self):
+        self.title = _intern(self.title)
+
+@dataclass(**_SLOTS)
 class Skills:
     technical: List[str] = field(default_factory=list)
     soft: List[str] = field(default_factory=list)
     languages: List[str] = field(default_factory=list)
 
-@dataclass
+    def __post_init__(self):
+        for name in ('technical', 'soft', 'languages'):
+            values = getattr(self, name)
+            if isinstance(values, list):
+                setattr(self, name, list(map(_intern, values))) # A new list, so the caller's is left alone
+
+@dataclass(**_SLOTS)
 class CVData:
     personal_info: PersonalInformation = field(default_factory=PersonalInformation)
     education: List[Education] = field(default_factory=list)
     experience: List[Experience] = field(default_factory=list)
     skills: Skills = field(default_factory=Skills)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], strict: bool = True) -> "CVData":
+        """
+        Builds CVData from plain dicts/lists, e.g. a record parsed from JSON (the inverse of dataclasses.asdict).
+        Unknown fields raise TypeError unless strict=False. Same decoder as serialization.from_dict.
+        """
+        from serialization import from_dict # serialization imports this module
+        return from_dict(data, strict=strict)
+
+    def freeze(self) -> "FrozenCVData":
+        """
+        Returns an immutable, hashable copy, e.g. for use as a dict key or a long-lived snapshot.
+        """
+        return FrozenCVData(
+            personal_info=FrozenPersonalInformation(*(getattr(self.personal_info, f.name) for f in fields(PersonalInformation))),
+            education=tuple(FrozenEducation(*(getattr(edu, f.name) for f in fields(Education))) for edu in self.education),
+            experience=tuple(FrozenExperience(*(getattr(exp, f.name) for f in fields(Experience))) for exp in self.experience),
+            skills=FrozenSkills(self.skills.technical, self.skills.soft, self.skills.languages),
+        )
+
+# Immutable variants with the same fields; lists become tuples so instances are hashable
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenPersonalInformation:
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+    github: str = ""
+    summary: str = ""
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenEducation:
+    degree: str = ""
+    major: str = ""
+    institution: str = ""
+    location: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    gpa: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'degree', _intern(self.degree))
+        object.__setattr__(self, 'major', _intern(self.major))
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenExperience:
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    description: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, 'title', _intern(self.title))
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenSkills:
+    technical: Tuple[str, ...] = ()
+    soft: Tuple[str, ...] = ()
+    languages: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        for name in ('technical', 'soft', 'languages'):
+            object.__setattr__(self, name, tuple(map(_intern, getattr(self, name))))
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenCVData:
+    personal_info: FrozenPersonalInformation = field(default_factory=FrozenPersonalInformation)
+    education: Tuple[FrozenEducation, ...] = ()
+    experience: Tuple[FrozenExperience, ...] = ()
+    skills: FrozenSkills = field(default_factory=FrozenSkills)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'education', tuple(self.education))
+        object.__setattr__(self, 'experience', tuple(self.experience))
+
+    def thaw(self) -> CVData:
+        """
+        Returns a mutable CVData copy.
+        """
+        return CVData(
+            personal_info=PersonalInformation(*(getattr(self.personal_info, f.name) for f in fields(PersonalInformation))),
+            education=[Education(*(getattr(edu, f.name) for f in fields(Education))) for edu in self.education],
+            experience=[Experience(*(getattr(exp, f.name) for f in fields(Experience))) for exp in self.experience],
+            skills=Skills(list(self.skills.technical), list(self.skills.soft), list(self.skills.languages)),
+        )
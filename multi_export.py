@@ -0,0 +1,114 @@
+"""
+Renders one CV to several formats at once.
+
+export_all submits one task per format to a shared, bounded thread pool (or an executor
+you pass in) and returns the futures, so callers can use each result as soon as it is
+ready; iter_completed yields them in completion order. export_zip writes every format
+into a single ZIP archive, adding each file as soon as its render finishes.
+
+    futures = export_all(cv_data, formats=('pdf', 'docx'))
+    pdf_bytes = futures['pdf'].result()
+
+The CV is converted to a CVDocument once and shared by every format. Exports submitted to
+a thread pool run in a copy of the caller's context, so export_timing.observe_exports
+still sees them.
+"""
+import contextvars
+import os
+import threading
+import zipfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from models import CVData
+from cv_document import CVDocument, as_document
+from cv_builder import generate_cv_content
+from export_utils import export_to_pdf, export_to_docx
+
+FORMATS = ('md', 'pdf', 'docx')
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_export_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide export thread pool (MAX_WORKERS threads), creating it on first use.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='export')
+    return _EXECUTOR
+
+
+def render_format(fmt: str, cv: CVDocument, theme: str = 'classic', pdf_engine: str = 'platypus',
+                  docx_engine: str = 'python-docx', optimize_size: bool = False) -> bytes:
+    """
+    Renders cv to one format and returns the bytes (UTF-8 for markdown).
+    """
+    if fmt == 'pdf':
+        return export_to_pdf(cv, "cv.pdf", theme=theme, engine=pdf_engine, optimize_size=optimize_size).getvalue()
+    if fmt == 'docx':
+        return export_to_docx(cv, "cv.docx", engine=docx_engine, optimize_size=optimize_size).getvalue()
+    return generate_cv_content(cv).encode('utf-8')
+
+
+def export_all(cv_data: Union[CVData, CVDocument], formats: Sequence[str] = FORMATS, theme: str = 'classic',
+               pdf_engine: str = 'platypus', docx_engine: str = 'python-docx', optimize_size: bool = False,
+               executor: Optional[Executor] = None) -> Dict[str, 'Future[bytes]']:
+    """
+    Starts rendering cv_data to every format in formats and returns a future per format,
+    in the order requested. Uses the shared export pool unless executor is given.
+    """
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown export format '{unknown[0]}'. Available formats: {', '.join(FORMATS)}")
+    cv = as_document(cv_data)
+    executor = executor or get_export_executor()
+    futures = {}
+    for fmt in dict.fromkeys(formats):
+        args = (fmt, cv, theme, pdf_engine, docx_engine, optimize_size)
+        if isinstance(executor, ProcessPoolExecutor): # Contexts cannot be sent to another process
+            futures[fmt] = executor.submit(render_format, *args)
+        else:
+            futures[fmt] = executor.submit(contextvars.copy_context().run, render_format, *args)
+    return futures
+
+
+def iter_completed(futures: Dict[str, 'Future[bytes]'], timeout: Optional[float] = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yields (format, bytes) as each render finishes. A failed render raises its exception.
+    """
+    formats = {future: fmt for fmt, future in futures.items()}
+    for future in as_completed(formats, timeout=timeout):
+        yield formats[future], future.result()
+
+
+def export_zip(cv_data: Union[CVData, CVDocument], formats: Sequence[str] = FORMATS,
+               file_stem: Optional[str] = None, fileobj: Optional[BinaryIO] = None, **options) -> BinaryIO:
+    """
+    Renders the formats concurrently (see export_all, which takes the same options) and
+    writes them to a ZIP archive as they finish, to fileobj or a new BytesIO. Files are
+    named <file_stem>.<format>, by default after the CV's name. Returns the file object,
+    rewound when it is a BytesIO.
+    """
+    cv = as_document(cv_data)
+    file_stem = file_stem or f"{cv.name.replace(' ', '_') or 'CV'}_CV"
+    output = fileobj if fileobj is not None else BytesIO()
+    futures = export_all(cv, formats, **options)
+    try:
+        with zipfile.ZipFile(output, 'w') as archive:
+            for fmt, data in iter_completed(futures):
+                # PDF and DOCX are already compressed
+                compression = zipfile.ZIP_DEFLATED if fmt == 'md' else zipfile.ZIP_STORED
+                archive.writestr(f"{file_stem}.{fmt}", data, compress_type=compression)
+    finally:
+        for future in futures.values():
+            future.cancel()
+    if isinstance(output, BytesIO):
+        output.seek(0)
+    return output
@@ -0,0 +1,94 @@
+"""
+Page-count estimates and fit-to-N-pages scaling for the PDF template.
+
+estimate_pages lays the CV out with pdf_canvas.CanvasLayout without a canvas: the same
+line breaking and page breaking as both PDF engines, driven by the memoized text widths
+in pdf_canvas.text_width, but nothing is drawn or written. For a typical CV this takes
+about a millisecond once the widths are cached, so it can run on every preview rerun.
+
+fit_to_pages searches the style scale (all font sizes and spacing, see
+export_utils.scale_pdf_theme) with estimates only, then builds the PDF once at the
+largest scale that is estimated to fit. Should the real page count differ, the scale is
+lowered one step and the PDF rebuilt, up to max_builds times.
+"""
+import re
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Union
+
+from models import CVData
+from cv_document import CVDocument, as_document
+from export_utils import export_to_pdf, get_pdf_styles
+
+MIN_SCALE = 0.7
+SCALE_STEP = 0.01
+
+
+@dataclass
+class FitResult:
+    scale: float
+    pages: int # Pages in the built PDF
+    fits: bool # False when even MIN_SCALE needs more than the requested pages
+    builds: int # Real PDF builds made
+    pdf: BytesIO
+
+
+def count_pdf_pages(data: bytes) -> int:
+    """
+    Number of page objects in a PDF written by ReportLab.
+    """
+    return len(re.findall(rb"/Type /Page(?!s)", data))
+
+
+def estimate_pages(cv_data: Union[CVData, CVDocument], theme: str = 'classic', scale: float = 1.0,
+                   optimize_size: bool = False) -> int:
+    """
+    Returns the number of pages export_to_pdf would produce, without building the PDF.
+    """
+    from pdf_canvas import CanvasLayout, build_blocks
+
+    layout = CanvasLayout()
+    for block in build_blocks(cv_data, get_pdf_styles(theme, scale, base14=optimize_size)):
+        layout.add(block)
+    return layout.pages
+
+
+def fit_scale(cv_data: Union[CVData, CVDocument], pages: int, theme: str = 'classic',
+              min_scale: float = MIN_SCALE, optimize_size: bool = False) -> float:
+    """
+    Largest scale in [min_scale, 1] (in SCALE_STEP steps) estimated to fit in pages
+    pages, or min_scale when none does. Bisects on estimates only.
+    """
+    if pages < 1:
+        raise ValueError("pages must be at least 1")
+    cv = as_document(cv_data)
+    if estimate_pages(cv, theme, 1.0, optimize_size) <= pages:
+        return 1.0
+    low, high = round(min_scale / SCALE_STEP), round(1.0 / SCALE_STEP) # high does not fit
+    if estimate_pages(cv, theme, low * SCALE_STEP, optimize_size) > pages:
+        return round(low * SCALE_STEP, 2)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if estimate_pages(cv, theme, middle * SCALE_STEP, optimize_size) <= pages:
+            low = middle
+        else:
+            high = middle
+    return round(low * SCALE_STEP, 2)
+
+
+def fit_to_pages(cv_data: Union[CVData, CVDocument], pages: int = 1, theme: str = 'classic', engine: str = 'platypus',
+                 min_scale: float = MIN_SCALE, optimize_size: bool = False, max_builds: int = 3) -> FitResult:
+    """
+    Builds the PDF at the largest scale (at most 1) that fits in pages pages, usually
+    with a single build.
+    """
+    cv = as_document(cv_data)
+    scale = fit_scale(cv, pages, theme, min_scale, optimize_size)
+    builds = 0
+    while True:
+        pdf = export_to_pdf(cv, "cv.pdf", theme=theme, engine=engine, optimize_size=optimize_size, scale=scale)
+        builds += 1
+        actual = count_pdf_pages(pdf.getvalue())
+        if actual <= pages or builds >= max_builds or scale - SCALE_STEP < min_scale - 1e-9:
+            return FitResult(scale, actual, actual <= pages, builds, pdf)
+        scale = round(scale - SCALE_STEP, 2)
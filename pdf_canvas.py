@@ -0,0 +1,434 @@
+"""
+Fast-path PDF engine for the fixed CV template.
+
+Instead of building a platypus story and running SimpleDocTemplate's layout pass, this
+module positions text directly on a reportlab canvas. It reproduces the geometry of the
+platypus engine in export_utils (frame padding, collapsing space before/after, list
+indents, keep-together entry headers, paragraph splitting across pages) so both engines
+produce visually equivalent documents.
+"""
+from functools import lru_cache
+from io import BytesIO
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.rl_config import spaceShrinkage
+
+from cv_document import CVDocument, Run, as_document
+from models import CVData
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 20*mm
+FRAME_PADDING = 6 # SimpleDocTemplate frames are padded by 6pt on every side
+FRAME_LEFT = MARGIN + FRAME_PADDING
+FRAME_WIDTH = PAGE_WIDTH - 2*(MARGIN + FRAME_PADDING)
+FRAME_TOP = MARGIN + FRAME_PADDING # Distances are measured from the top of the page
+FRAME_BOTTOM = PAGE_HEIGHT - MARGIN - FRAME_PADDING
+LIST_INDENT = 18 # ListFlowable's default left indent
+RULE_THICKNESS = 1
+
+class _Para:
+    __slots__ = ('style', 'runs', 'indent', 'bullet', 'space_before', 'space_after')
+
+    def __init__(self, style: ParagraphStyle, runs: Sequence[Run], indent: float = 0, bullet: bool = False):
+        self.style = style
+        self.runs = runs
+        self.indent = indent
+        self.bullet = bullet
+        self.space_before = style.spaceBefore
+        self.space_after = style.spaceAfter
+
+
+class _Rule:
+    __slots__ = ()
+    space_before = 1
+    space_after = 1
+
+
+class _Space:
+    __slots__ = ('height',)
+    space_before = 0
+    space_after = 0
+
+    def __init__(self, height: float):
+        self.height = height
+
+
+class _KeepTogether:
+    __slots__ = ('blocks',)
+
+    def __init__(self, blocks: List[_Para]):
+        self.blocks = blocks
+
+    @property
+    def space_before(self):
+        return self.blocks[0].space_before
+
+
+@lru_cache(maxsize=65536)
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    """
+    Memoized stringWidth; CV text repeats the same words across lines and exports.
+    """
+    return stringWidth(text, font_name, font_size)
+
+
+def _bold_font(font_name: str) -> str:
+    family, _, italic = ps2tt(font_name)
+    return tt2ps(family, 1, italic)
+
+
+def _words(runs: Sequence[Run], style: ParagraphStyle) -> List[List[Tuple[str, str]]]:
+    """
+    Splits styled runs into words; a word is a list of (text, font) fragments so that
+    a bold/normal boundary without whitespace stays on one line.
+    """
+    bold_font = _bold_font(style.fontName)
+    words = []
+    current = []
+    for text, bold in runs:
+        font = bold_font if bold else style.fontName
+        if text[:1].isspace() and current:
+            words.append(current)
+            current = []
+        pieces = text.split()
+        for i, piece in enumerate(pieces):
+            if i and current:
+                words.append(current)
+                current = []
+            current.append((piece, font))
+        if text[-1:].isspace() and current:
+            words.append(current)
+            current = []
+    if current:
+        words.append(current)
+    return words
+
+
+class _Piece(list):
+    """
+    Part of a word that was too wide for a line; `last` marks the part that ends it.
+    """
+    __slots__ = ('last',)
+
+    def __init__(self, fragments=(), last: bool = False):
+        super().__init__(fragments)
+        self.last = last
+
+
+def _split_word(word, size: float, used: float, first_width: float, width: float) -> List[Tuple[float, _Piece]]:
+    """
+    Breaks a word wider than the line by character, as platypus does with splitLongWords:
+    the first piece fills what is left of the current line (`used` of first_width is
+    taken), the others fill whole lines. Returns (width, piece) per piece.
+    """
+    pieces = []
+    piece, piece_width = _Piece(), 0.0
+    line_width, available = used, first_width
+    for text, font in word:
+        for char in text:
+            char_width = text_width(char, font, size)
+            if line_width + char_width > available and (piece or char_width <= width):
+                pieces.append((piece_width, piece))
+                piece, piece_width = _Piece(), 0.0
+                line_width, available = 0.0, width
+            if piece and piece[-1][1] == font:
+                piece[-1] = (piece[-1][0] + char, font)
+            else:
+                piece.append((char, font))
+            piece_width += char_width
+            line_width += char_width
+    piece.last = True
+    pieces.append((piece_width, piece))
+    return pieces
+
+
+def _rejoin(words) -> list:
+    """
+    Words with the pieces of each split word joined up again, for re-wrapping.
+    """
+    joined = []
+    pending = None
+    for word in words:
+        if isinstance(word, _Piece):
+            pending = word if pending is None else pending + word
+            if not word.last:
+                continue
+            word, pending = list(pending), None
+        joined.append(word)
+    if pending is not None:
+        joined.append(list(pending))
+    return joined
+
+
+def _wrap(words, style: ParagraphStyle, first_width: float, width: float) -> List[Tuple[float, float, list]]:
+    """
+    Greedy line breaking. Returns (line width, available width, words) per line.
+    """
+    size = style.fontSize
+    space = text_width(' ', style.fontName, size)
+    shrink = spaceShrinkage * space # Platypus lets each inter-word space shrink slightly
+    lines = []
+    line: List[List[Tuple[str, str]]] = []
+    line_width = 0.0
+    available = first_width
+    for word in words:
+        word_width = text_width(word[0][0], word[0][1], size) if len(word) == 1 else \
+            sum(text_width(text, font, size) for text, font in word)
+        if word_width > available:
+            # Wider than the line: every piece but the last ends a line of its own
+            *full, (word_width, word) = _split_word(word, size, line_width + space if line else 0, available, width)
+            for piece_width, piece in full:
+                if piece:
+                    line_width = line_width + space + piece_width if line else piece_width
+                    line.append(piece)
+                lines.append((line_width, available, line))
+                line, line_width, available = [], 0.0, width
+        needed = word_width if not line else line_width + space + word_width
+        if line and needed > available + shrink*len(line):
+            lines.append((line_width, available, line))
+            line, line_width, available = [word], word_width, width
+        else:
+            line.append(word)
+            line_width = needed
+    if line:
+        lines.append((line_width, available, line))
+    return lines
+
+
+def _fragments(words) -> List[Tuple[str, str]]:
+    """
+    Joins the words of a line, merging adjacent fragments that share a font.
+    """
+    fragments = []
+    for i, word in enumerate(words):
+        for j, (text, font) in enumerate(word):
+            if i and not j:
+                text = ' ' + text
+            if fragments and fragments[-1][1] == font:
+                fragments[-1] = (fragments[-1][0] + text, font)
+            else:
+                fragments.append((text, font))
+    return fragments
+
+
+class CanvasLayout:
+    """
+    Lays out template blocks page by page. When a canvas is given the blocks are drawn,
+    otherwise only the geometry is computed (useful for page-count estimates).
+    """
+
+    def __init__(self, canvas: Optional[Canvas] = None):
+        self.canvas = canvas
+        self.pages = 1
+        self.y = FRAME_TOP
+        self.at_top = True
+        self.prev_space_after = 0
+
+    def _new_page(self):
+        if self.canvas is not None:
+            self.canvas.showPage()
+        self.pages += 1
+        self.y = FRAME_TOP
+        self.at_top = True
+        self.prev_space_after = 0
+
+    def _gap(self, space_before: float) -> float:
+        if self.at_top:
+            return 0
+        return max(space_before - self.prev_space_after, 0)
+
+    def add(self, block):
+        if isinstance(block, _Para):
+            self._add_para(block)
+        elif isinstance(block, _Rule):
+            self._add_rule()
+        elif isinstance(block, _Space):
+            self._add_space(block.height)
+        else:
+            self._add_keep_together(block)
+
+    def _add_space(self, height: float):
+        if self.y + height > FRAME_BOTTOM and not self.at_top:
+            # Like a platypus Spacer, the space is carried over to the top of the next page
+            self._new_page()
+        self.y += height
+        self.at_top = False
+        self.prev_space_after = 0
+
+    def _add_rule(self):
+        gap = self._gap(_Rule.space_before)
+        if self.y + gap + RULE_THICKNESS > FRAME_BOTTOM:
+            self._new_page()
+            gap = 0
+        self.y += gap + RULE_THICKNESS
+        if self.canvas is not None:
+            self.canvas.setLineWidth(RULE_THICKNESS)
+            self.canvas.setLineCap(1)
+            y = PAGE_HEIGHT - self.y
+            self.canvas.line(FRAME_LEFT, y, FRAME_LEFT + FRAME_WIDTH, y)
+        self.y += _Rule.space_after
+        self.at_top = False
+        self.prev_space_after = _Rule.space_after
+
+    def _para_geometry(self, para: _Para):
+        style = para.style
+        left = para.indent + style.leftIndent
+        width = FRAME_WIDTH - left - style.rightIndent
+        first_offset = 0
+        if para.bullet and style.bulletText:
+            bullet_len = (style.bulletIndent + text_width(style.bulletText, style.bulletFontName, style.bulletFontSize)
+                          + 0.6*style.bulletFontSize)
+            if bullet_len > style.leftIndent + style.firstLineIndent:
+                first_offset = bullet_len - style.leftIndent
+        return left, width, first_offset
+
+    def _para_height(self, para: _Para) -> float:
+        _, width, first_offset = self._para_geometry(para)
+        return len(_wrap(_words(para.runs, para.style), para.style, width - first_offset, width)) * para.style.leading
+
+    def _add_para(self, para: _Para):
+        style = para.style
+        leading = style.leading
+        left, width, first_offset = self._para_geometry(para)
+        lines = _wrap(_words(para.runs, style), style, width - first_offset, width) # Empty text has no lines, as in platypus
+        gap = self._gap(para.space_before)
+        fits = int((FRAME_BOTTOM - self.y - gap) // leading)
+        orphaned = fits == 1 and len(lines) > 1 and not style.allowOrphans
+        widowed = para.bullet and fits == len(lines) - 1 # List items never leave one line behind
+        if fits < len(lines) and (fits < 1 or orphaned or widowed) and not self.at_top:
+            # Move the whole paragraph rather than leave nothing or a single orphan line behind
+            self._new_page()
+            gap = 0
+        self.y += gap
+        space_after = para.space_after
+        while True:
+            fits = max(int((FRAME_BOTTOM - self.y) // leading), 1)
+            self._draw_lines(para, left, first_offset, lines[:fits])
+            self.y += leading * min(fits, len(lines))
+            self.at_top = False
+            if fits >= len(lines):
+                break
+            # Platypus re-wraps the rest as a new paragraph that repeats the bullet, and the
+            # split parts only keep the spacing of the paragraph style
+            self._new_page()
+            remaining = _rejoin([word for _, _, words in lines[fits:] for word in words])
+            lines = _wrap(remaining, style, width - first_offset, width)
+            space_after = style.spaceAfter
+        self.y += space_after
+        self.prev_space_after = space_after
+
+    def _draw_lines(self, para, left, first_offset, lines):
+        canvas = self.canvas
+        if canvas is None:
+            return
+        style = para.style
+        size = style.fontSize
+        baseline = PAGE_HEIGHT - self.y - size
+        if para.bullet and style.bulletText:
+            canvas.setFont(style.bulletFontName, style.bulletFontSize)
+            canvas.drawString(FRAME_LEFT + para.indent + style.bulletIndent, baseline, style.bulletText)
+        text = canvas.beginText()
+        font = None
+        word_space = 0
+        for index, (line_width, available, words) in enumerate(lines):
+            offset = first_offset if index == 0 else 0
+            x = FRAME_LEFT + left + offset
+            if style.alignment == TA_CENTER:
+                x += (available - line_width) / 2
+            text.setTextOrigin(x, baseline - index*style.leading)
+            spacing = 0
+            if line_width > available and len(words) > 1:
+                # Overfull line: shrink the word spaces the way platypus does
+                spacing = (available - line_width) / (len(words) - 1)
+            if spacing != word_space:
+                text.setWordSpace(spacing)
+                word_space = spacing
+            for fragment, fragment_font in _fragments(words):
+                if fragment_font != font:
+                    text.setFont(fragment_font, size)
+                    font = fragment_font
+                text.textOut(fragment)
+        canvas.drawText(text)
+
+    def _add_keep_together(self, group: _KeepTogether):
+        if not self.at_top:
+            height = 0
+            prev_after = self.prev_space_after
+            for i, para in enumerate(group.blocks):
+                height += max(para.space_before - prev_after, 0) + self._para_height(para)
+                if i < len(group.blocks) - 1:
+                    height += para.space_after
+                prev_after = para.space_after
+            if self.y + height > FRAME_BOTTOM and height <= FRAME_BOTTOM - FRAME_TOP:
+                self._new_page()
+        for para in group.blocks:
+            self._add_para(para)
+
+
+def build_blocks(cv_data: Union[CVData, CVDocument], styles: Mapping[str, ParagraphStyle]) -> list:
+    """
+    Translates the CV into the same sequence of blocks the platypus engine uses.
+    """
+    cv = as_document(cv_data)
+    blocks = []
+    if cv.name:
+        blocks.append(_Para(styles['NameStyle'], [Run(cv.name)]))
+        if cv.contacts:
+            blocks.append(_Para(styles['ContactInfoStyle'], [Run(" | ".join(contact.value for contact in cv.contacts))]))
+
+    for section in cv.sections:
+        blocks.append(_Para(styles['SectionTitleStyle'], [Run(section.title.upper())]))
+        blocks.append(_Rule())
+        blocks.append(_Space(2*mm))
+        for paragraph in section.paragraphs:
+            blocks.append(_Para(styles['NormalTextStyle'], paragraph))
+        if section.paragraphs:
+            blocks.append(_Space(4*mm))
+
+        for entry in section.entries:
+            entry_details = [
+                _Para(styles['SubHeadingStyleBold'], entry.heading),
+                _Para(styles['SubHeadingStyleNormal'], [Run(entry.place)]),
+            ]
+            date_gpa_info = []
+            if entry.start_date and entry.end_date:
+                date_gpa_info.append(f"{entry.start_date} - {entry.end_date}")
+            if entry.gpa:
+                date_gpa_info.append(f"GPA: {entry.gpa}")
+            if date_gpa_info:
+                entry_details.append(_Para(styles['DateLocationStyle'], [Run(" | ".join(date_gpa_info))]))
+            blocks.append(_KeepTogether(entry_details))
+
+            bullets = [_Para(styles['BulletPointStyle'], [Run(bullet)], indent=LIST_INDENT, bullet=True)
+                       for bullet in entry.bullets]
+            if bullets:
+                # The list's own spacing collapses with that of its first and last items
+                bullets[0].space_before = max(bullets[0].space_before, 1*mm)
+                bullets[-1].space_after = max(bullets[-1].space_after, 2*mm)
+                blocks.extend(bullets)
+            blocks.append(_Space(4*mm))
+
+    return blocks
+
+
+def render_pdf_canvas(cv_data: Union[CVData, CVDocument], styles: Mapping[str, ParagraphStyle],
+                      compact: bool = False) -> BytesIO:
+    """
+    compact=True forces page compression and invariant (reproducible) output.
+    """
+    buffer = BytesIO()
+    canvas = Canvas(buffer, pagesize=A4, pageCompression=1, invariant=1) if compact else Canvas(buffer, pagesize=A4)
+    layout = CanvasLayout(canvas)
+    for block in build_blocks(cv_data, styles):
+        layout.add(block)
+    canvas.showPage()
+    canvas.save()
+    buffer.seek(0)
+    return buffer
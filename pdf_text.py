@@ -0,0 +1,689 @@
+"""
+Text-layer extraction for PDF files, used by cv_import.
+
+A small, dependency-free reader for the text of born-digital PDFs (ReportLab output,
+"Save as PDF" from word processors): objects and object streams are located by scanning
+the file, page content streams are interpreted for their text operators only, and the
+positioned fragments are reassembled into lines that keep the font size and boldness
+of each run. Simple fonts are decoded through their encoding (standard encodings plus
+Differences) and Type0 fonts through their ToUnicode CMap. Scanned PDFs have no text
+layer and yield no lines; encrypted PDFs are rejected.
+
+ReportLab supplies the encoding vectors, glyph names and base-14 font widths.
+"""
+import base64
+import math
+import re
+import zlib
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from cv_document import Run
+
+_WHITESPACE = b' \t\r\n\f\x00'
+_DELIMITERS = b'()<>[]{}/%'
+_OBJECT_HEADER = re.compile(rb'(?<![0-9])(\d+)\s+(\d+)\s+obj\b')
+_NUMBER = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f',
+            ord('('): b'(', ord(')'): b')', ord('\\'): b'\\'}
+_MAX_FORM_DEPTH = 8
+_BOLD_NAMES = ('bold', 'black', 'heavy', 'semibold', 'demibold')
+
+
+class PdfError(ValueError):
+    """
+    The data is not a readable PDF: not a PDF at all, encrypted or damaged.
+    """
+
+
+class Name(str):
+    """
+    A PDF name (/Type), kept apart from strings.
+    """
+
+
+class Ref(NamedTuple):
+    number: int
+
+
+class TextLine(NamedTuple):
+    page: int
+    x: float # Left edge of the text, after any bullet glyph
+    y: float # Baseline, from the bottom of the page
+    size: float # Font size of most of the line's text
+    runs: Tuple[Run, ...] # Bold and regular runs, in reading order
+    bullet: bool # The line starts with a bullet glyph (which is not part of runs)
+
+    @property
+    def text(self) -> str:
+        return "".join(run.text for run in self.runs)
+
+
+class _Lexer:
+    """
+    Parses PDF objects and content-stream operands from a byte buffer.
+    """
+
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def _skip(self) -> None:
+        data, pos = self.data, self.pos
+        while pos < len(data):
+            if data[pos] in _WHITESPACE:
+                pos += 1
+            elif data[pos] == 37: # % comment
+                while pos < len(data) and data[pos] not in b'\r\n':
+                    pos += 1
+            else:
+                break
+        self.pos = pos
+
+    def token(self):
+        """
+        Returns the next object, or ('op', keyword) for an operator / keyword, or None at the end.
+        """
+        self._skip()
+        data, pos = self.data, self.pos
+        if pos >= len(data):
+            return None
+        char = data[pos]
+        if char == 47: # /Name
+            end = pos + 1
+            while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+                end += 1
+            self.pos = end
+            return Name(re.sub(rb'#([0-9a-fA-F]{2})', lambda m: bytes([int(m.group(1), 16)]),
+                               data[pos + 1:end]).decode('latin-1'))
+        if char == 40: # (literal string)
+            return self._literal_string()
+        if char == 60: # <<dict>> or <hex string>
+            if data[pos + 1:pos + 2] == b'<':
+                self.pos = pos + 2
+                return self._dictionary()
+            end = data.find(b'>', pos)
+            end = len(data) if end < 0 else end
+            digits = re.sub(rb'[^0-9a-fA-F]', b'', data[pos + 1:end])
+            self.pos = end + 1
+            return bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode('ascii'))
+        if char == 91: # [array]
+            self.pos = pos + 1
+            items = []
+            while True:
+                item = self.token()
+                if item is None or item == ('op', ']'):
+                    return items
+                items.append(item)
+        if char in b']>}{)':
+            self.pos = pos + (2 if data[pos:pos + 2] == b'>>' else 1)
+            return ('op', data[pos:self.pos].decode('latin-1'))
+        number = _NUMBER.match(data, pos)
+        if number and (number.end() >= len(data) or data[number.end()] in _WHITESPACE or data[number.end()] in _DELIMITERS):
+            self.pos = number.end()
+            text = number.group()
+            if b'.' in text:
+                return float(text)
+            value = int(text)
+            reference = re.compile(rb'\s+(\d+)\s+R(?![A-Za-z])').match(data, self.pos)
+            if reference:
+                self.pos = reference.end()
+                return Ref(value)
+            return value
+        end = pos + 1
+        while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+            end += 1
+        self.pos = end
+        keyword = data[pos:end].decode('latin-1')
+        if keyword == 'true':
+            return True
+        if keyword == 'false':
+            return False
+        if keyword == 'null':
+            return None
+        return ('op', keyword)
+
+    def _literal_string(self) -> bytes:
+        data, pos = self.data, self.pos + 1
+        out = bytearray()
+        depth = 1
+        while pos < len(data):
+            char = data[pos]
+            if char == 92: # backslash
+                pos += 1
+                if pos >= len(data):
+                    break
+                escaped = data[pos]
+                if escaped in _ESCAPES:
+                    out += _ESCAPES[escaped]
+                    pos += 1
+                elif 48 <= escaped <= 55: # \ddd octal
+                    end = pos
+                    while end < min(pos + 3, len(data)) and 48 <= data[end] <= 55:
+                        end += 1
+                    out.append(int(data[pos:end], 8) & 0xFF)
+                    pos = end
+                elif escaped in b'\r\n': # Line continuation
+                    pos += 2 if data[pos:pos + 2] == b'\r\n' else 1
+                else:
+                    out.append(escaped)
+                    pos += 1
+                continue
+            if char == 40:
+                depth += 1
+            elif char == 41:
+                depth -= 1
+                if depth == 0:
+                    pos += 1
+                    break
+            out.append(char)
+            pos += 1
+        self.pos = pos
+        return bytes(out)
+
+    def _dictionary(self) -> dict:
+        result = {}
+        while True:
+            key = self.token()
+            if key is None or key == ('op', '>>'):
+                return result
+            value = self.token()
+            if isinstance(key, Name):
+                result[str(key)] = value
+
+
+def _ascii85(data: bytes) -> bytes:
+    data = re.sub(rb'\s', b'', data)
+    if data.startswith(b'<~'):
+        data = data[2:]
+    end = data.find(b'~>')
+    return base64.a85decode(data[:end] if end >= 0 else data)
+
+
+def _flate(data: bytes) -> bytes:
+    try:
+        return zlib.decompress(data)
+    except zlib.error: # Truncated or missing checksum: keep what inflates
+        try:
+            return zlib.decompressobj().decompress(data)
+        except zlib.error as exc:
+            raise PdfError(f"Damaged compressed stream: {exc}") from exc
+
+
+_FILTERS: Dict[str, Callable[[bytes], bytes]] = {
+    'FlateDecode': _flate, 'Fl': _flate,
+    'ASCII85Decode': _ascii85, 'A85': _ascii85,
+    'ASCIIHexDecode': lambda data: bytes.fromhex(re.sub(rb'[^0-9a-fA-F]', b'', data.split(b'>')[0]).decode('ascii')),
+}
+
+
+class PdfDocument:
+    """
+    The objects of a PDF file, found by scanning for "n g obj" headers (so damaged
+    cross-reference tables do not matter) plus those packed in object streams.
+    """
+
+    def __init__(self, data: bytes):
+        if not data.lstrip()[:5] == b'%PDF-':
+            raise PdfError("Not a PDF file")
+        self.data = data
+        self.objects: Dict[int, object] = {}
+        self.streams: Dict[int, bytes] = {}
+        self.trailer: dict = {}
+        for match in _OBJECT_HEADER.finditer(data):
+            self._read_object(int(match.group(1)), match.end())
+        for match in re.finditer(rb'trailer\s*<<', data):
+            self.trailer.update(_Lexer(data, match.end() - 2).token())
+        for number, value in list(self.objects.items()):
+            if isinstance(value, dict):
+                if value.get('Type') == 'ObjStm':
+                    self._read_object_stream(number, value)
+                elif value.get('Type') == 'XRef':
+                    self.trailer.update({key: value[key] for key in ('Root', 'Encrypt', 'Info') if key in value})
+        if 'Encrypt' in self.trailer:
+            raise PdfError("Encrypted PDFs are not supported")
+
+    def _read_object(self, number: int, pos: int) -> None:
+        lexer = _Lexer(self.data, pos)
+        try:
+            value = lexer.token()
+        except (ValueError, IndexError):
+            return
+        self.objects[number] = value # Later definitions (incremental updates) win
+        self.streams.pop(number, None)
+        if isinstance(value, dict):
+            stream = re.compile(rb'\s*stream\r?\n').match(self.data, lexer.pos)
+            if stream:
+                length = value.get('Length')
+                if isinstance(length, Ref):
+                    length = self.objects.get(length.number)
+                start = stream.end()
+                if isinstance(length, int) and self.data[start + length:start + length + 20].lstrip().startswith(b'endstream'):
+                    self.streams[number] = self.data[start:start + length]
+                else:
+                    end = self.data.find(b'endstream', start)
+                    self.streams[number] = self.data[start:end if end >= 0 else len(self.data)].rstrip(b'\r\n')
+
+    def _read_object_stream(self, number: int, header: dict) -> None:
+        data = self.stream(number)
+        lexer = _Lexer(data)
+        pairs = [(lexer.token(), lexer.token()) for _ in range(int(header.get('N', 0)))]
+        first = int(header.get('First', 0))
+        for object_number, offset in pairs:
+            if isinstance(object_number, int) and isinstance(offset, int) and object_number not in self.objects:
+                self.objects[object_number] = _Lexer(data, first + offset).token()
+
+    def resolve(self, value):
+        seen = 0
+        while isinstance(value, Ref) and seen < 32:
+            value = self.objects.get(value.number)
+            seen += 1
+        return value
+
+    def resolve_dict(self, value) -> dict:
+        """
+        Resolves value, giving an empty dictionary for anything but a dictionary (in damaged
+        files any object can turn up where one is expected).
+        """
+        value = self.resolve(value)
+        return value if isinstance(value, dict) else {}
+
+    def stream(self, ref) -> bytes:
+        number = ref.number if isinstance(ref, Ref) else ref
+        data = self.streams.get(number, b'')
+        header = self.resolve_dict(self.objects.get(number))
+        filters = self.resolve(header.get('Filter', []))
+        for name in (filters if isinstance(filters, list) else [filters]):
+            name = self.resolve(name)
+            if name not in _FILTERS:
+                return b'' # Images and other binary data; never text
+            data = _FILTERS[name](data)
+        return data
+
+    def pages(self) -> Iterator[Tuple[dict, dict]]:
+        """
+        Yields (page dictionary, inherited resources) in document order.
+        """
+        root = self.resolve(self.trailer.get('Root')) or next(
+            (value for value in self.objects.values() if isinstance(value, dict) and value.get('Type') == 'Catalog'), {})
+        if not isinstance(root, dict):
+            raise PdfError("The document catalog is damaged")
+        seen = set()
+
+        def walk(node_ref, resources):
+            node = self.resolve(node_ref)
+            key = node_ref.number if isinstance(node_ref, Ref) else id(node)
+            if not isinstance(node, dict) or key in seen:
+                return
+            seen.add(key)
+            resources = self.resolve_dict(node.get('Resources')) or resources
+            if node.get('Type') == 'Page' or 'Kids' not in node:
+                yield node, resources
+            else:
+                for kid in self.resolve(node.get('Kids')) or []:
+                    yield from walk(kid, resources)
+
+        yield from walk(root.get('Pages'), {})
+
+
+class _Font:
+    """
+    Decodes the bytes of a shown string into (text, width in 1/1000 em) per character code.
+    """
+
+    def __init__(self, document: PdfDocument, font: dict):
+        from reportlab.pdfbase.pdfmetrics import standardFonts
+
+        base_font = str(document.resolve(font.get('BaseFont')) or '')
+        base_font = base_font.split('+', 1)[-1] # Drop the subset prefix (ABCDEF+Name)
+        descriptor = document.resolve(font.get('FontDescriptor')) or {}
+        weight = document.resolve(descriptor.get('FontWeight')) or 0
+        self.bold = any(name in base_font.lower() for name in _BOLD_NAMES) or weight >= 600
+        self.base14 = base_font if base_font in standardFonts else None
+        self.type0 = font.get('Subtype') == 'Type0'
+        self.code_bytes = 2 if self.type0 else 1
+        self.to_unicode: Dict[int, str] = {}
+        cmap = font.get('ToUnicode')
+        if isinstance(cmap, Ref):
+            self.to_unicode = self._parse_cmap(document.stream(cmap))
+        self.widths: Dict[int, float] = {}
+        self.default_width = 500.0
+        if self.type0:
+            descendant = document.resolve((document.resolve(font.get('DescendantFonts')) or [{}])[0]) or {}
+            self.default_width = float(document.resolve(descendant.get('DW', 1000)))
+            self._read_cid_widths(document.resolve(descendant.get('W')) or [], document)
+            self.encoding: Dict[int, str] = {}
+        else:
+            first = document.resolve(font.get('FirstChar', 0)) or 0
+            for offset, width in enumerate(document.resolve(font.get('Widths')) or []):
+                self.widths[first + offset] = float(document.resolve(width))
+            self.encoding = self._simple_encoding(document, document.resolve(font.get('Encoding')), base_font)
+
+    def _parse_cmap(self, data: bytes) -> Dict[int, str]:
+        mapping = {}
+        ranges = re.findall(rb'begincodespacerange(.*?)endcodespacerange', data, re.S)
+        if ranges:
+            low = re.search(rb'<([0-9a-fA-F]+)>', ranges[0])
+            if low:
+                self.code_bytes = max(1, len(low.group(1)) // 2)
+
+        def text(hex_digits: bytes) -> str:
+            return bytes.fromhex(hex_digits.decode('ascii')).decode('utf-16-be', errors='replace')
+
+        for block in re.findall(rb'beginbfchar(.*?)endbfchar', data, re.S):
+            for source, target in re.findall(rb'<([0-9a-fA-F]+)>\s*<([0-9a-fA-F]*)>', block):
+                mapping[int(source, 16)] = text(target)
+        for block in re.findall(rb'beginbfrange(.*?)endbfrange', data, re.S):
+            for low, high, target in re.findall(rb'<([0-9a-fA-F]+)>\s*<([0-9a-fA-F]+)>\s*(<[0-9a-fA-F]*>|\[[^\]]*\])', block):
+                low, high = int(low, 16), int(high, 16)
+                if target.startswith(b'['):
+                    for offset, item in enumerate(re.findall(rb'<([0-9a-fA-F]*)>', target)):
+                        mapping[low + offset] = text(item)
+                else:
+                    start = int(target[1:-1] or b'0', 16)
+                    width = max(len(target) - 2, 4)
+                    for code in range(low, min(high, low + 0xFFFF) + 1):
+                        mapping[code] = text(f'{start + code - low:0{width}x}'.encode('ascii'))
+        return mapping
+
+    def _read_cid_widths(self, items: list, document: PdfDocument) -> None:
+        index = 0
+        while index + 1 < len(items):
+            first = document.resolve(items[index])
+            following = document.resolve(items[index + 1])
+            if isinstance(following, list):
+                for offset, width in enumerate(following):
+                    self.widths[first + offset] = float(document.resolve(width))
+                index += 2
+            elif index + 2 < len(items):
+                for code in range(first, following + 1):
+                    self.widths[code] = float(document.resolve(items[index + 2]))
+                index += 3
+            else:
+                break
+
+    @staticmethod
+    def _simple_encoding(document: PdfDocument, encoding, base_font: str) -> Dict[int, str]:
+        from reportlab.pdfbase.pdfmetrics import getEncoding
+        from reportlab.pdfbase._glyphlist import _glyphname2unicode
+
+        base = 'WinAnsiEncoding'
+        differences = []
+        if isinstance(encoding, dict):
+            base = document.resolve(encoding.get('BaseEncoding')) or base
+            differences = document.resolve(encoding.get('Differences')) or []
+        elif isinstance(encoding, str):
+            base = encoding
+        if base_font in ('Symbol', 'ZapfDingbats'):
+            base = base_font + 'Encoding'
+        try:
+            vector = list(getEncoding(base).vector)
+        except KeyError:
+            vector = list(getEncoding('WinAnsiEncoding').vector)
+        code = 0
+        for item in differences:
+            item = document.resolve(item)
+            if isinstance(item, int):
+                code = item
+            elif isinstance(item, Name) and code < 256:
+                vector[code] = str(item)
+                code += 1
+
+        def glyph_text(glyph: Optional[str]) -> str:
+            if not glyph:
+                return ''
+            if glyph in _glyphname2unicode:
+                return chr(_glyphname2unicode[glyph])
+            match = re.fullmatch(r'uni([0-9A-Fa-f]{4,6})|u([0-9A-Fa-f]{4,6})', glyph)
+            if match:
+                return chr(int(match.group(1) or match.group(2), 16))
+            return ''
+
+        return {code: glyph_text(glyph) for code, glyph in enumerate(vector)}
+
+    def decode(self, data: bytes) -> List[Tuple[str, float, bool]]:
+        """
+        (text, width, is_space) for each character code in data.
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        chars = []
+        step = self.code_bytes
+        for index in range(0, len(data) - step + 1, step):
+            code = int.from_bytes(data[index:index + step], 'big')
+            text = self.to_unicode.get(code)
+            if text is None:
+                text = self.encoding.get(code, chr(code) if not self.type0 else '')
+            width = self.widths.get(code)
+            if width is None:
+                width = stringWidth(text, self.base14, 1000) if self.base14 and text else self.default_width
+            chars.append((text, width, step == 1 and code == 32))
+        return chars
+
+
+class _Fragment(NamedTuple):
+    x: float
+    y: float
+    end: float
+    size: float
+    text: str
+    bold: bool
+
+
+def _multiply(m, n):
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a*A + b*C, a*B + b*D, c*A + d*C, c*B + d*D, e*A + f*C + E, e*B + f*D + F)
+
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+class _TextState:
+    __slots__ = ('font', 'size', 'char_spacing', 'word_spacing', 'scale', 'leading', 'rise')
+
+    def __init__(self):
+        self.font: Optional[_Font] = None
+        self.size = 0.0
+        self.char_spacing = 0.0
+        self.word_spacing = 0.0
+        self.scale = 1.0
+        self.leading = 0.0
+        self.rise = 0.0
+
+    def copy(self) -> '_TextState':
+        clone = _TextState()
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+
+class _PageReader:
+    """
+    Interprets the text operators of a page's content streams.
+    """
+
+    def __init__(self, document: PdfDocument):
+        self.document = document
+        self.fonts: Dict[int, _Font] = {}
+        self.fragments: List[_Fragment] = []
+
+    def _font(self, resources: dict, name) -> Optional[_Font]:
+        fonts = self.document.resolve_dict(resources.get('Font'))
+        ref = fonts.get(str(name))
+        font = self.document.resolve(ref)
+        if not isinstance(font, dict):
+            return None
+        key = ref.number if isinstance(ref, Ref) else id(font)
+        if key not in self.fonts:
+            self.fonts[key] = _Font(self.document, font)
+        return self.fonts[key]
+
+    def run(self, content: bytes, resources: dict, ctm=_IDENTITY, depth: int = 0) -> None:
+        document = self.document
+        lexer = _Lexer(content)
+        operands = []
+        stack = []
+        state = _TextState()
+        tm = tlm = _IDENTITY
+        while True:
+            token = lexer.token()
+            if token is None:
+                break
+            if not (isinstance(token, tuple) and not isinstance(token, Ref) and len(token) == 2 and token[0] == 'op'):
+                operands.append(token)
+                continue
+            op = token[1]
+            try:
+                if op == 'q':
+                    stack.append((ctm, state.copy()))
+                elif op == 'Q':
+                    if stack:
+                        ctm, state = stack.pop()
+                elif op == 'cm' and len(operands) == 6:
+                    ctm = _multiply(tuple(map(float, operands)), ctm)
+                elif op == 'BT':
+                    tm = tlm = _IDENTITY
+                elif op == 'Tf' and len(operands) == 2:
+                    state.font = self._font(resources, operands[0])
+                    state.size = float(operands[1])
+                elif op == 'Tc' and operands:
+                    state.char_spacing = float(operands[0])
+                elif op == 'Tw' and operands:
+                    state.word_spacing = float(operands[0])
+                elif op == 'Tz' and operands:
+                    state.scale = float(operands[0]) / 100
+                elif op == 'TL' and operands:
+                    state.leading = float(operands[0])
+                elif op == 'Ts' and operands:
+                    state.rise = float(operands[0])
+                elif op in ('Td', 'TD') and len(operands) == 2:
+                    tx, ty = float(operands[0]), float(operands[1])
+                    if op == 'TD':
+                        state.leading = -ty
+                    tm = tlm = _multiply((1, 0, 0, 1, tx, ty), tlm)
+                elif op == 'Tm' and len(operands) == 6:
+                    tm = tlm = tuple(map(float, operands))
+                elif op == 'T*':
+                    tm = tlm = _multiply((1, 0, 0, 1, 0, -state.leading), tlm)
+                elif op in ('Tj', "'", '"', 'TJ') and operands:
+                    if op in ("'", '"'):
+                        if op == '"' and len(operands) == 3:
+                            state.word_spacing, state.char_spacing = float(operands[0]), float(operands[1])
+                        tm = tlm = _multiply((1, 0, 0, 1, 0, -state.leading), tlm)
+                    items = operands[-1] if op == 'TJ' else [operands[-1]]
+                    tm = self._show(items if isinstance(items, list) else [items], state, tm, ctm)
+                elif op == 'Do' and operands and depth < _MAX_FORM_DEPTH:
+                    xobjects = document.resolve_dict(resources.get('XObject'))
+                    ref = xobjects.get(str(operands[0]))
+                    form = document.resolve(ref)
+                    if isinstance(form, dict) and form.get('Subtype') == 'Form' and isinstance(ref, Ref):
+                        matrix = tuple(map(float, document.resolve(form.get('Matrix')) or _IDENTITY))
+                        self.run(document.stream(ref), document.resolve_dict(form.get('Resources')) or resources,
+                                 _multiply(matrix, ctm), depth + 1)
+                elif op == 'BI': # Inline image: skip its binary data
+                    end = content.find(b'EI', lexer.pos)
+                    while end >= 0 and not (content[end - 1:end] in b' \t\r\n' and content[end + 2:end + 3] in b' \t\r\n'):
+                        end = content.find(b'EI', end + 2)
+                    lexer.pos = len(content) if end < 0 else end + 2
+            except (TypeError, ValueError):
+                pass # Malformed operands; skip the operator
+            operands = []
+
+    def _show(self, items: list, state: _TextState, tm, ctm):
+        font = state.font
+        if font is None:
+            return tm
+        size = state.size
+        for item in items:
+            if isinstance(item, (int, float)):
+                tm = _multiply((1, 0, 0, 1, -item / 1000 * size * state.scale, 0), tm)
+                continue
+            if not isinstance(item, bytes):
+                continue
+            matrix = _multiply(tm, ctm)
+            start = _multiply((1, 0, 0, 1, 0, state.rise), matrix)
+            text = []
+            advance = 0.0
+            for char, width, is_space in font.decode(item):
+                text.append(char)
+                advance += (width / 1000 * size + state.char_spacing + (state.word_spacing if is_space else 0)) * state.scale
+            tm = _multiply((1, 0, 0, 1, advance, 0), tm)
+            end = _multiply(tm, ctm)
+            effective_size = size * math.hypot(matrix[2], matrix[3])
+            if text:
+                self.fragments.append(_Fragment(start[4], start[5], end[4], effective_size, "".join(text), font.bold))
+        return tm
+
+
+_BULLET_GLYPHS = ('\u2022', '\u25cf', '\u25aa', '\u25a0', '\u25e6', '\u2023', '\uf0b7', '\u007f') # U+F0B7: Word's Symbol bullet; 127: ReportLab's
+
+
+def _line(page: int, fragments: List[_Fragment]) -> TextLine:
+    fragments.sort(key=lambda fragment: fragment.x)
+    runs: List[List] = []
+    previous = None
+    bullet = False
+    x = fragments[0].x
+    sizes: Dict[float, int] = {}
+    for fragment in fragments:
+        text = fragment.text
+        if previous is None and not text.strip():
+            continue
+        if previous is None and text.strip() in _BULLET_GLYPHS:
+            bullet = True # Drawn on its own, like a list bullet
+            continue
+        if previous is not None and previous.text == text and abs(previous.x - fragment.x) < 0.5:
+            continue # Fake bold drawn twice
+        if previous is None:
+            x = fragment.x
+        elif fragment.x - previous.end > 0.15 * fragment.size and not text[:1].isspace() \
+                and not previous.text[-1:].isspace():
+            text = ' ' + text
+        sizes[round(fragment.size, 1)] = sizes.get(round(fragment.size, 1), 0) + len(fragment.text)
+        if runs and runs[-1][1] == fragment.bold:
+            runs[-1][0] += text
+        else:
+            runs.append([text, fragment.bold])
+        previous = fragment
+    if not bullet and runs and runs[0][0][:1] in _BULLET_GLYPHS:
+        bullet = True
+        runs[0][0] = runs[0][0][1:].lstrip()
+    size = max(sizes, key=sizes.get) if sizes else fragments[0].size
+    return TextLine(page, x, fragments[0].y, size,
+                    tuple(Run(text.replace('\u007f', '•'), bold) for text, bold in runs if text), bullet)
+
+
+def extract_lines(data: bytes) -> List[TextLine]:
+    """
+    Returns the text lines of every page, top to bottom.
+    """
+    document = PdfDocument(data)
+    lines = []
+    for page_number, (page, resources) in enumerate(document.pages()):
+        reader = _PageReader(document)
+        contents = document.resolve(page.get('Contents'))
+        refs = contents if isinstance(contents, list) else [page.get('Contents')]
+        content = b'\n'.join(document.stream(ref) for ref in refs if isinstance(ref, Ref))
+        reader.run(content, resources)
+        fragments = sorted((fragment for fragment in reader.fragments if fragment.text.strip() or fragment.text == ' '),
+                           key=lambda fragment: (-fragment.y, fragment.x))
+        current: List[_Fragment] = []
+        for fragment in fragments:
+            if current and abs(current[0].y - fragment.y) > 0.3 * max(fragment.size, current[0].size, 1):
+                line = _line(page_number, current)
+                if line.runs:
+                    lines.append(line)
+                current = []
+            current.append(fragment)
+        if current:
+            line = _line(page_number, current)
+            if line.runs:
+                lines.append(line)
+    return lines
+
+
+def extract_text(data: bytes) -> str:
+    """
+    The text layer as plain text, one line per line of the page.
+    """
+    return "\n".join(("• " if line.bullet else "") + line.text for line in extract_lines(data))
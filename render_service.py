@@ -0,0 +1,252 @@
+"""
+Standalone HTTP render service, so several app replicas can share render capacity.
+
+    python render_service.py --host 127.0.0.1 --port 8765 --workers 4
+
+Endpoints:
+
+    POST /render/pdf|docx|md   body: CVData as JSON (serialization.to_json or a plain
+                               asdict dump); optional query: theme, engine
+    GET  /health               status and metrics as JSON
+
+Renders run in a bounded process pool. Identical concurrent requests (same format,
+options and CV) are coalesced into one render, and requests beyond max_pending are
+rejected with 503 instead of queueing without limit. render_remote is the matching
+client used by app.py when RENDER_SERVICE_URL is set.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Deque, Dict, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import serialization
+from batch_render import percentile
+from cv_builder import generate_cv_content
+from cv_document import CVDocument, build_document
+from export_utils import export_to_pdf, export_to_docx, pdf_theme_names, PDF_ENGINES, DOCX_ENGINES
+from models import CVData
+
+CONTENT_TYPES = {
+    'pdf': "application/pdf",
+    'docx': "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    'md': "text/markdown; charset=utf-8",
+}
+ENGINES = {'pdf': PDF_ENGINES, 'docx': DOCX_ENGINES, 'md': ('markdown',)}
+MAX_BODY_BYTES = 1024 * 1024
+LATENCY_WINDOW = 1000 # Recent renders kept per format for the latency percentiles
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def render_record(fmt: str, record: bytes, theme: str, engine: str) -> bytes:
+    """
+    Renders one serialization record. Runs in the worker processes.
+    """
+    document = build_document(serialization.decode_record(record))
+    if fmt == 'pdf':
+        return export_to_pdf(document, "cv.pdf", theme=theme, engine=engine).getvalue()
+    if fmt == 'docx':
+        return export_to_docx(document, "cv.docx", engine=engine).getvalue()
+    return generate_cv_content(document).encode('utf-8')
+
+
+class RenderService:
+    """
+    Coalescing front end to a bounded executor, plus the HTTP handler that serves it.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: Optional[int] = None, executor: Optional[Executor] = None):
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers)
+        self.max_pending = max_pending or 4 * workers
+        self.started = time.time()
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.latencies: Dict[str, Deque[float]] = {fmt: deque(maxlen=LATENCY_WINDOW) for fmt in CONTENT_TYPES}
+        self._inflight: Dict[Tuple[str, str, str, str], asyncio.Future] = {}
+
+    async def render(self, fmt: str, cv_data: CVData, theme: str = 'classic', engine: Optional[str] = None) -> bytes:
+        """
+        Renders cv_data in the pool. A request identical to one already in flight waits for
+        that render instead of starting another. Raises HttpError(503) when the pool is full.
+        A cancelled request (a client that disconnected) stops waiting, but the render it
+        started stays in flight for the identical requests that come after it.
+        """
+        engine = engine or ENGINES[fmt][0]
+        record = serialization.encode_record(cv_data)
+        key = (fmt, theme, engine, hashlib.sha256(record).hexdigest())
+        future = self._inflight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(future)
+        if len(self._inflight) >= self.max_pending:
+            self.counters['rejected'] += 1
+            raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Render queue is full, retry later")
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        future = loop.run_in_executor(self.executor, render_record, fmt, record, theme, engine)
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._finished(key, fmt, start, done))
+        return await asyncio.shield(future)
+
+    def _finished(self, key: Tuple[str, str, str, str], fmt: str, start: float, future: asyncio.Future) -> None:
+        # Runs when the render itself ends, whether or not anyone is still waiting for it
+        del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self.latencies[fmt].append(time.perf_counter() - start)
+            self.counters['renders'] += 1
+
+    def metrics(self) -> Dict[str, object]:
+        latencies = {}
+        for fmt, samples in self.latencies.items():
+            ordered = sorted(samples)
+            latencies[fmt] = {"count": len(ordered), "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+                              "p95_ms": round(percentile(ordered, 95) * 1000, 2)}
+        return {
+            "status": "ok",
+            "uptime_s": round(time.time() - self.started, 1),
+            "in_flight": len(self._inflight),
+            "max_pending": self.max_pending,
+            "counters": dict(self.counters),
+            "latency": latencies,
+        }
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, str, bytes]:
+        url = urlsplit(target)
+        if url.path == '/health':
+            if method != 'GET':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+            return HTTPStatus.OK, "application/json", json.dumps(self.metrics()).encode('utf-8')
+
+        prefix, _, fmt = url.path.rpartition('/')
+        if prefix != '/render' or fmt not in CONTENT_TYPES:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown path {url.path}")
+        if method != 'POST':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        theme = query.get('theme', 'classic')
+        engine = query.get('engine', ENGINES[fmt][0])
+        if theme not in pdf_theme_names():
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown theme '{theme}'")
+        if engine not in ENGINES[fmt]:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown {fmt} engine '{engine}'")
+        try:
+            cv_data = serialization.from_json(body)
+        except ValueError as exc: # Includes json.JSONDecodeError and UnicodeDecodeError
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid CV data: {exc}") from exc
+        return HTTPStatus.OK, CONTENT_TYPES[fmt], await self.render(fmt, cv_data, theme, engine)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one request per connection.
+        """
+        try:
+            try:
+                method, target, body = await _read_request(reader)
+                self.counters['requests'] += 1
+                status, content_type, payload = await self._dispatch(method, target, body)
+            except HttpError as exc:
+                status, content_type = exc.status, "application/json"
+                payload = json.dumps({"error": str(exc)}).encode('utf-8')
+            except Exception as exc:
+                status, content_type = HTTPStatus.INTERNAL_SERVER_ERROR, "application/json"
+                payload = json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode('utf-8')
+            self.counters[f"status_{status.value}"] += 1
+            writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode('latin-1') + payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    request_line = (await reader.readline()).decode('latin-1').split()
+    if len(request_line) != 3:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    method, target, _ = request_line
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {MAX_BODY_BYTES} bytes")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Truncated body") from None
+    return method, target, body
+
+
+def render_remote(base_url: str, fmt: str, cv_data: Union[CVData, CVDocument], theme: str = 'classic',
+                  engine: Optional[str] = None, timeout: float = 30.0) -> bytes:
+    """
+    Renders through a running render service. Raises urllib.error.URLError (an OSError)
+    when the service is unreachable or answers with an error.
+    """
+    if isinstance(cv_data, CVDocument):
+        raise TypeError("render_remote needs the CVData, not a CVDocument")
+    query = {'theme': theme}
+    if engine:
+        query['engine'] = engine
+    request = urllib.request.Request(f"{base_url.rstrip('/')}/render/{fmt}?{urlencode(query)}",
+                                     data=serialization.to_json(cv_data).encode('utf-8'),
+                                     headers={"Content-Type": "application/json"}, method='POST')
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+async def serve(host: str, port: int, workers: int, max_pending: Optional[int]) -> None:
+    service = RenderService(workers=workers, max_pending=max_pending)
+    server = await service.start(host, port)
+    print(f"Render service listening on http://{host}:{server.sockets[0].getsockname()[1]} "
+          f"with {workers} workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve CV rendering (PDF, DOCX, markdown) over HTTP.")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-w", "--workers", type=int, default=2, help="Render worker processes.")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Distinct renders in flight before requests get 503 (default: 4 per worker).")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
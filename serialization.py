@@ -0,0 +1,283 @@
+"""
+Versioned serialization for CVData, in a compact binary form and a JSON form.
+
+Binary layout (all integers unsigned 32-bit little-endian):
+
+    stream  := MAGIC version:u8 record*          (dump_stream / iter_load_stream)
+    record  := size:u32 body                     (size of body in bytes)
+    body    := shape_len shape... n_strings length... utf-8 text
+    shape   := personal_info_fields n_education education_fields
+               n_experience experience_fields n_skill_lists skill_list_len...
+
+Strings are stored in field declaration order as one UTF-8 text joined by SEPARATOR, so
+the reader decodes and splits it in two calls. A table of their lengths in characters
+comes first; it validates the split and is used instead when a value contains
+SEPARATOR (the split then yields more strings than the table). A None field has length
+NONE. The shape records how many fields each struct had when it was written, which is
+what makes the format evolve: a reader fills fields missing from an older record (e.g.
+Education.gpa) with their defaults and skips fields it does not know from a newer one.
+The JSON form carries a "version" and is decoded just as leniently (unless strict).
+"""
+import json
+import sys
+from array import array
+from dataclasses import fields
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, TextIO, Union
+
+from models import CVData, FrozenCVData, PersonalInformation, Education, Experience, Skills
+
+FORMAT_VERSION = 1 # Bump when the layout changes; fields may be added without a bump
+MAGIC = b"CVD"
+NONE = 0xFFFFFFFF # Length marking a None value
+SEPARATOR = "\x00" # Joins the strings so the reader can split them in one call
+
+CV = Union[CVData, FrozenCVData]
+
+_PERSONAL_FIELDS = tuple(f.name for f in fields(PersonalInformation))
+_EDUCATION_FIELDS = tuple(f.name for f in fields(Education))
+_EXPERIENCE_FIELDS = tuple(f.name for f in fields(Experience))
+_SKILL_FIELDS = tuple(f.name for f in fields(Skills))
+_CV_FIELDS = {f.name for f in fields(CVData)} | {"version"}
+_SWAP = sys.byteorder == "big"
+
+
+def _u32(values: Iterable[int]) -> bytes:
+    numbers = array("I", values)
+    if _SWAP:
+        numbers.byteswap()
+    return numbers.tobytes()
+
+
+def _read_u32(data: bytes, offset: int, count: int) -> array:
+    numbers = array("I")
+    numbers.frombytes(data[offset:offset + 4*count])
+    if _SWAP:
+        numbers.byteswap()
+    return numbers
+
+
+# Field defaults used to complete records written before a field was added
+_DEFAULTS = {cls: tuple(f.default for f in fields(cls)) for cls in (PersonalInformation, Education, Experience)}
+
+
+# --- Binary form ---
+
+def encode_record(cv_data: CV) -> bytes:
+    """
+    Encodes one CV as a record body (without the stream header or size prefix).
+    """
+    skills = [getattr(cv_data.skills, name) for name in _SKILL_FIELDS]
+    shape = [len(_PERSONAL_FIELDS), len(cv_data.education), len(_EDUCATION_FIELDS),
+             len(cv_data.experience), len(_EXPERIENCE_FIELDS), len(skills), *map(len, skills)]
+
+    strings = [getattr(cv_data.personal_info, name) for name in _PERSONAL_FIELDS]
+    for edu in cv_data.education:
+        strings.extend(getattr(edu, name) for name in _EDUCATION_FIELDS)
+    for exp in cv_data.experience:
+        strings.extend(getattr(exp, name) for name in _EXPERIENCE_FIELDS)
+    for values in skills:
+        strings.extend(values)
+
+    lengths = [NONE if value is None else len(value) for value in strings]
+    text = SEPARATOR.join(["" if value is None else value for value in strings])
+    return _u32([len(shape), *shape, len(lengths), *lengths]) + text.encode("utf-8")
+
+
+def _split_by_lengths(text: str, lengths) -> list:
+    """
+    Slow path for records where a value itself contains SEPARATOR.
+    """
+    strings = []
+    position = 0
+    for length in lengths:
+        length = 0 if length == NONE else length
+        strings.append(text[position:position + length])
+        position += length + 1
+    return strings
+
+
+def _take(cls, strings: list, index: int, stored: int, count: int):
+    """
+    Builds count instances of cls from consecutive runs of `stored` strings starting at
+    index. Returns them with the index after the last one.
+    """
+    end = index + stored*count
+    if end > len(strings): # Checked before building anything, so a corrupted count fails fast
+        raise ValueError(f"record shape needs {end} strings but it holds {len(strings)}")
+    if stored == len(_DEFAULTS[cls]):
+        return [cls(*strings[i:i + stored]) for i in range(index, end, stored)], end
+    # Written by another schema version: fill in missing fields, drop unknown ones
+    known = len(_DEFAULTS[cls])
+    missing = list(_DEFAULTS[cls][stored:])
+    return [cls(*strings[i:i + min(stored, known)], *missing) for i in range(index, end, stored)], end
+
+
+def decode_record(data: bytes) -> CVData:
+    """
+    Decodes a record body written by encode_record (by this or any other schema version).
+    """
+    try:
+        (shape_len,) = _read_u32(data, 0, 1)
+        shape = _read_u32(data, 4, shape_len)
+        offset = 4 + 4*shape_len
+        (n_strings,) = _read_u32(data, offset, 1)
+        lengths = _read_u32(data, offset + 4, n_strings)
+        text = data[offset + 4 + 4*n_strings:].decode("utf-8")
+        n_none = lengths.count(NONE)
+        if len(lengths) != n_strings or sum(lengths) - NONE*n_none + max(n_strings - 1, 0) != len(text):
+            raise ValueError("record size does not match its length table")
+        strings = text.split(SEPARATOR)
+        if len(strings) != n_strings: # Some value contains SEPARATOR
+            strings = _split_by_lengths(text, lengths)
+        if n_none:
+            strings = [None if length == NONE else value for value, length in zip(strings, lengths)]
+
+        personal_fields, n_education, education_fields, n_experience, experience_fields, n_skill_lists = shape[:6]
+        (personal_info,), index = _take(PersonalInformation, strings, 0, personal_fields, 1)
+        education, index = _take(Education, strings, index, education_fields, n_education)
+        experience, index = _take(Experience, strings, index, experience_fields, n_experience)
+        skill_lists = []
+        for list_len in shape[6:6 + n_skill_lists]:
+            if index + list_len > n_strings:
+                raise ValueError("record shape does not match its strings")
+            skill_lists.append(strings[index:index + list_len])
+            index += list_len
+        if index != n_strings:
+            raise ValueError("record shape does not match its strings")
+        skill_lists = skill_lists[:len(_SKILL_FIELDS)]
+        skill_lists.extend([] for _ in range(len(_SKILL_FIELDS) - len(skill_lists)))
+        return CVData(personal_info, education, experience, Skills(*skill_lists))
+    except (ValueError, TypeError, IndexError) as exc:
+        raise ValueError(f"Malformed CV record: {exc}") from exc
+
+
+def _check_header(header: bytes) -> None:
+    if len(header) < len(MAGIC) + 1 or header[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a CV data stream")
+    if header[len(MAGIC)] > FORMAT_VERSION:
+        raise ValueError(f"Unsupported CV data format version {header[len(MAGIC)]} (newest known is {FORMAT_VERSION})")
+
+
+def to_bytes(cv_data: CV) -> bytes:
+    return MAGIC + bytes([FORMAT_VERSION]) + encode_record(cv_data)
+
+
+def from_bytes(data: bytes) -> CVData:
+    _check_header(data[:len(MAGIC) + 1])
+    return decode_record(data[len(MAGIC) + 1:])
+
+
+def dump_stream(records: Iterable[CV], fileobj: BinaryIO) -> int:
+    """
+    Writes a stream header and one size-prefixed record per CV. Returns the number of records.
+    """
+    fileobj.write(MAGIC + bytes([FORMAT_VERSION]))
+    count = 0
+    for cv_data in records:
+        body = encode_record(cv_data)
+        fileobj.write(_u32([len(body)]) + body)
+        count += 1
+    return count
+
+
+def iter_stream_records(fileobj: BinaryIO) -> Iterator[bytes]:
+    """
+    Yields the raw record bodies of a stream written by dump_stream, for callers that
+    decode them elsewhere (e.g. in worker processes) with decode_record.
+    """
+    _check_header(fileobj.read(len(MAGIC) + 1))
+    while True:
+        prefix = fileobj.read(4)
+        if not prefix:
+            return
+        if len(prefix) < 4:
+            raise ValueError("Truncated CV data stream")
+        (size,) = _read_u32(prefix, 0, 1)
+        body = fileobj.read(size)
+        if len(body) < size:
+            raise ValueError("Truncated CV data stream")
+        yield body
+
+
+def iter_load_stream(fileobj: BinaryIO) -> Iterator[CVData]:
+    """
+    Yields the CVs of a stream written by dump_stream, reading one record at a time.
+    """
+    for body in iter_stream_records(fileobj):
+        yield decode_record(body)
+
+
+# --- JSON form ---
+
+def to_dict(cv_data: CV) -> Dict[str, Any]:
+    """
+    Plain dict for the CV, tagged with the format version. Faster than dataclasses.asdict,
+    which deep-copies every value.
+    """
+    return {
+        "version": FORMAT_VERSION,
+        "personal_info": {name: getattr(cv_data.personal_info, name) for name in _PERSONAL_FIELDS},
+        "education": [{name: getattr(edu, name) for name in _EDUCATION_FIELDS} for edu in cv_data.education],
+        "experience": [{name: getattr(exp, name) for name in _EXPERIENCE_FIELDS} for exp in cv_data.experience],
+        "skills": {name: list(getattr(cv_data.skills, name)) for name in _SKILL_FIELDS},
+    }
+
+
+def _build(cls, data: Any, names, strict: bool):
+    try:
+        return cls(**data)
+    except TypeError:
+        # Not a dict, or it has fields this version does not know
+        if not isinstance(data, dict):
+            raise (TypeError if strict else ValueError)(f"Expected an object, not {type(data).__name__}") from None
+        if strict:
+            raise
+        return cls(**{name: data[name] for name in names if name in data})
+
+
+def from_dict(data: Dict[str, Any], strict: bool = False) -> CVData:
+    """
+    Inverse of to_dict. Missing fields take their defaults and unknown fields are ignored,
+    so dicts written by older or newer schema versions load. With strict=True, unknown
+    fields and values that are not objects raise TypeError instead.
+    """
+    if not isinstance(data, dict):
+        raise (TypeError if strict else ValueError)(f"CV record must be an object, not {type(data).__name__}")
+    if strict:
+        unknown = set(data) - _CV_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown CV field(s): {', '.join(sorted(unknown))}")
+    version = data.get("version", FORMAT_VERSION)
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported CV data format version {data['version']} (newest known is {FORMAT_VERSION})")
+    return CVData(
+        personal_info=_build(PersonalInformation, data.get("personal_info", {}), _PERSONAL_FIELDS, strict),
+        education=[_build(Education, item, _EDUCATION_FIELDS, strict) for item in data.get("education", [])],
+        experience=[_build(Experience, item, _EXPERIENCE_FIELDS, strict) for item in data.get("experience", [])],
+        skills=_build(Skills, data.get("skills", {}), _SKILL_FIELDS, strict),
+    )
+
+
+def to_json(cv_data: CV) -> str:
+    return json.dumps(to_dict(cv_data), ensure_ascii=False, separators=(",", ":"))
+
+
+def from_json(text: Union[str, bytes]) -> CVData:
+    return from_dict(json.loads(text))
+
+
+def dump_json_lines(records: Iterable[CV], fileobj: TextIO) -> int:
+    """
+    Writes one JSON object per line (JSONL, as read by batch_render). Returns the number of records.
+    """
+    count = 0
+    for cv_data in records:
+        fileobj.write(to_json(cv_data) + "\n")
+        count += 1
+    return count
+
+
+def iter_load_json_lines(fileobj: TextIO) -> Iterator[CVData]:
+    for line in fileobj:
+        if line.strip():
+            yield from_json(line)
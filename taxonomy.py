@@ -0,0 +1,427 @@
+"""
+Autocomplete and canonical names for large taxonomies (skills, degrees, job titles,
+institutions).
+
+A taxonomy is a list of canonical names, each with a popularity weight and optional
+aliases ("JavaScript" <- "js", "ecmascript"). It is compiled into one binary index file
+that Taxonomy opens with mmap, so a 100k-entry taxonomy is usable straight away and its
+pages are shared by every process on the host. Nothing is decoded up front.
+
+The index holds:
+- the normalized names, aliases and word suffixes ("learning" for "Machine Learning"),
+  sorted, so the keys starting with a prefix are one contiguous range found by binary
+  search;
+- a tournament tree over that array holding the heaviest key of every node, so the N
+  heaviest entries of any range are found in O(N log n) however large the range is;
+- a trigram index over names and aliases for typos ("pyhton"), used when no key starts
+  with the query.
+
+Source files are tab-separated: name, optional weight (default 1) and optional aliases
+separated by "|". Lines starting with "#" are comments.
+
+    python taxonomy.py build skills.tsv -o skills.idx
+    python taxonomy.py search skills.idx "mach"
+
+get_taxonomy(name) loads taxonomies lazily from TAXONOMY_DIR (default: the taxonomies
+directory next to this module), preferring a prebuilt <name>.idx over <name>.tsv.
+"""
+import argparse
+import bisect
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+MAGIC = b'CVTX'
+FORMAT_VERSION = 1
+TAXONOMY_DIR = os.environ.get('TAXONOMY_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taxonomies'))
+
+_SECTIONS = ('key_offsets', 'key_blob', 'key_entries', 'key_weights', 'tree', 'entry_offsets', 'entry_blob',
+             'gram_codes', 'gram_offsets', 'gram_postings')
+_HEADER = struct.Struct('<4sII')
+_SECTION = struct.Struct('<II') # Offset and length in bytes
+_SUFFIX = 0x80000000 # Set in key_entries for word-suffix keys, which canonical() ignores
+_NONE = 0xFFFFFFFF # Empty tournament tree leaf
+_FUZZY_BUDGET = 2048 # Trigram postings read per fuzzy lookup, rarest trigrams first
+_FUZZY_MIN_SCORE = 0.3
+
+_NOT_KEPT = re.compile(r"[^\w+#.]+")
+
+Entry = Tuple[str, int, Sequence[str]] # Name, weight, aliases
+
+
+def normalize(text: str) -> str:
+    """
+    Lookup form of a name: case-folded, accents removed, punctuation other than "+", "#"
+    and "." turned into spaces ("UI/UX" -> "ui ux", "C++" -> "c++", "Université" -> "universite").
+    """
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(word.strip('.') for word in _NOT_KEPT.sub(' ', text).split() if word.strip('.'))
+
+
+def _grams(key: str) -> Set[int]:
+    padded = f" {key} "
+    return {zlib.crc32(padded[i:i + 3].encode('utf-8')) for i in range(len(padded) - 2)}
+
+
+def read_entries(path: str) -> Iterator[Entry]:
+    """
+    Reads a tab-separated taxonomy source file.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            fields = line.rstrip('\n').split('\t')
+            weight = int(fields[1]) if len(fields) > 1 and fields[1].strip() else 1
+            aliases = [alias.strip() for alias in fields[2].split('|') if alias.strip()] if len(fields) > 2 else []
+            yield fields[0].strip(), weight, aliases
+
+
+def build_index(entries: Iterable[Entry]) -> bytes:
+    """
+    Compiles (name, weight, aliases) entries into the binary index format. Names that
+    normalize alike are merged (first spelling kept, highest weight, all aliases).
+    """
+    merged: Dict[str, list] = {}
+    for name, weight, aliases in entries:
+        key = normalize(name)
+        if not key:
+            continue
+        if key in merged:
+            merged[key][1] = max(merged[key][1], weight)
+            merged[key][2].extend(aliases)
+        else:
+            merged[key] = [name, weight, list(aliases)]
+    names = [value[0] for value in merged.values()]
+    weights = [min(max(value[1], 0), _NONE - 1) for value in merged.values()]
+
+    keys: Dict[Tuple[bytes, int], int] = {} # (key, entry) -> flag; an exact key beats a suffix key
+    for entry, (key, (_, _, aliases)) in enumerate(merged.items()):
+        for exact in (key, *map(normalize, aliases)):
+            if exact:
+                keys[(exact.encode('utf-8'), entry)] = 0
+        words = key.split(' ')
+        for start in range(1, len(words)):
+            keys.setdefault((" ".join(words[start:]).encode('utf-8'), entry), _SUFFIX)
+    ordered = sorted(keys.items(), key=lambda item: (item[0][0], item[1], -weights[item[0][1]], item[0][1]))
+
+    key_offsets, key_entries, key_weights, grams = [0], [], [], {}
+    blob = bytearray()
+    for index, ((key, entry), flag) in enumerate(ordered):
+        blob += key
+        key_offsets.append(len(blob))
+        key_entries.append(entry | flag)
+        key_weights.append(weights[entry])
+        if not flag:
+            for code in _grams(key.decode('utf-8')):
+                grams.setdefault(code, []).append(index)
+
+    size = 1
+    while size < len(ordered):
+        size *= 2
+    tree = [_NONE] * (2 * size)
+    tree[size:size + len(ordered)] = range(len(ordered))
+    for node in range(size - 1, 0, -1):
+        tree[node] = _heavier(key_weights, tree[2 * node], tree[2 * node + 1])
+
+    entry_offsets, entry_blob = [0], bytearray()
+    for name in names:
+        entry_blob += name.encode('utf-8')
+        entry_offsets.append(len(entry_blob))
+
+    codes = sorted(grams)
+    gram_offsets, postings = [0], []
+    for code in codes:
+        postings.extend(grams[code])
+        gram_offsets.append(len(postings))
+
+    sections = {
+        'key_offsets': _u32(key_offsets), 'key_blob': bytes(blob), 'key_entries': _u32(key_entries),
+        'key_weights': _u32(key_weights), 'tree': _u32(tree), 'entry_offsets': _u32(entry_offsets),
+        'entry_blob': bytes(entry_blob), 'gram_codes': _u32(codes), 'gram_offsets': _u32(gram_offsets),
+        'gram_postings': _u32(postings),
+    }
+    offset = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    table, body = [], bytearray()
+    for name in _SECTIONS:
+        data = sections[name]
+        table.append(_SECTION.pack(offset + len(body), len(data)))
+        body += data + b'\0' * (-len(data) % 4) # Keep every section 4-byte aligned
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(_SECTIONS)) + b''.join(table) + bytes(body)
+
+
+def _u32(values: Sequence[int]) -> bytes:
+    return struct.pack(f'<{len(values)}I', *values)
+
+
+def _heavier(weights, first: int, second: int) -> int:
+    # The heavier of two keys; the lower index (alphabetically first) wins ties
+    if first == _NONE:
+        return second
+    if second == _NONE:
+        return first
+    return second if weights[second] > weights[first] else first
+
+
+class _Keys:
+    # Sequence view of the sorted keys for bisect, decoding only the keys it touches
+    __slots__ = ('offsets', 'blob')
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]])
+
+
+class Taxonomy:
+    """
+    Read-only taxonomy index over a buffer produced by build_index (bytes or an mmap).
+    Lookups decode only the keys and names they touch. Safe to share between threads.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, count = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not a taxonomy index")
+        if version != FORMAT_VERSION or count != len(_SECTIONS):
+            raise ValueError(f"Unsupported taxonomy index version {version}")
+        sections = {}
+        for number, name in enumerate(_SECTIONS):
+            offset, length = _SECTION.unpack_from(view, _HEADER.size + number * _SECTION.size)
+            section = view[offset:offset + length]
+            if name.endswith('blob'):
+                sections[name] = section
+            elif sys.byteorder == 'little':
+                sections[name] = section.cast('I')
+            else: # The file is little-endian; big-endian hosts read a swapped copy
+                values = array('I', section.tobytes())
+                values.byteswap()
+                sections[name] = values
+        self._keys = _Keys(sections['key_offsets'], sections['key_blob'])
+        self._key_entries = sections['key_entries']
+        self._key_weights = sections['key_weights']
+        self._tree = sections['tree']
+        self._size = len(self._tree) // 2
+        self._entry_offsets = sections['entry_offsets']
+        self._entry_blob = sections['entry_blob']
+        self._gram_codes = sections['gram_codes']
+        self._gram_offsets = sections['gram_offsets']
+        self._gram_postings = sections['gram_postings']
+
+    @classmethod
+    def open(cls, path: str) -> 'Taxonomy':
+        """
+        Memory-maps a prebuilt index file.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Not a taxonomy index")
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Entry]) -> 'Taxonomy':
+        return cls(build_index(entries))
+
+    def __len__(self) -> int:
+        return len(self._entry_offsets) - 1
+
+    def name(self, entry: int) -> str:
+        return bytes(self._entry_blob[self._entry_offsets[entry]:self._entry_offsets[entry + 1]]).decode('utf-8')
+
+    def _exact(self, key: bytes) -> Optional[int]:
+        index = bisect.bisect_left(self._keys, key)
+        while index < len(self._keys) and self._keys[index] == key:
+            entry = self._key_entries[index]
+            if not entry & _SUFFIX:
+                return entry
+            index += 1
+        return None
+
+    def canonical(self, text: str) -> Optional[str]:
+        """
+        The canonical name text stands for (matching its name or an alias), or None.
+        """
+        key = normalize(text)
+        entry = self._exact(key.encode('utf-8')) if key else None
+        return None if entry is None else self.name(entry)
+
+    def _heaviest(self, low: int, high: int) -> int:
+        # Heaviest key in [low, high), or _NONE, from O(log n) tree nodes
+        tree, weights, best = self._tree, self._key_weights, _NONE
+        low += self._size
+        high += self._size
+        while low < high:
+            if low & 1:
+                best = _heavier(weights, best, tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                best = _heavier(weights, tree[high], best)
+            low >>= 1
+            high >>= 1
+        return best
+
+    def _top(self, low: int, high: int, limit: int, found: List[int]) -> None:
+        # Appends the heaviest entries of keys [low, high) to found until it holds limit entries
+        heap: List[Tuple[int, int, int, int]] = []
+
+        def push(start: int, stop: int) -> None:
+            if start < stop:
+                index = self._heaviest(start, stop)
+                heapq.heappush(heap, (-self._key_weights[index], index, start, stop))
+
+        push(low, high)
+        while heap and len(found) < limit:
+            _, index, start, stop = heapq.heappop(heap)
+            entry = self._key_entries[index] & ~_SUFFIX
+            if entry not in found:
+                found.append(entry)
+            push(start, index)
+            push(index + 1, stop)
+
+    def top(self, limit: int = 10) -> List[str]:
+        """
+        The limit heaviest entries.
+        """
+        found: List[int] = []
+        self._top(0, len(self._keys), limit, found)
+        return [self.name(entry) for entry in found]
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Up to limit suggestions for what has been typed so far: an exact match first, then
+        the heaviest entries whose name, alias or a later word starts with the query. When
+        nothing starts with the query, the closest spellings. An empty query gives the
+        heaviest entries.
+        """
+        key = normalize(query)
+        if not key:
+            return self.top(limit)
+        prefix = key.encode('utf-8')
+        found: List[int] = []
+        exact = self._exact(prefix)
+        if exact is not None:
+            found.append(exact)
+        low = bisect.bisect_left(self._keys, prefix)
+        high = bisect.bisect_left(self._keys, prefix + b'\xff', low) # No UTF-8 byte is 0xff
+        self._top(low, high, limit, found)
+        if not found and len(key) >= 3: # Nothing starts like this: probably a typo
+            found = self._fuzzy(key, limit)
+        return [self.name(entry) for entry in found]
+
+    def _fuzzy(self, key: str, limit: int) -> List[int]:
+        grams = _grams(key)
+        lists = []
+        for code in grams:
+            index = bisect.bisect_left(self._gram_codes, code)
+            if index < len(self._gram_codes) and self._gram_codes[index] == code:
+                lists.append(self._gram_postings[self._gram_offsets[index]:self._gram_offsets[index + 1]])
+        lists.sort(key=len)
+        used, budget = [], _FUZZY_BUDGET
+        for postings in lists:
+            # A close spelling shares most trigrams, so it is in at least one of the rarest half
+            if len(used) > len(grams) // 2 and len(postings) > budget:
+                break
+            used.append(postings)
+            budget -= len(postings)
+        counts = Counter(chain.from_iterable(used))
+        scored = {}
+        for index, shared in counts.most_common(limit * 8):
+            # Dice coefficient on trigrams; a key of n bytes has about n trigrams when padded
+            key_grams = self._keys.offsets[index + 1] - self._keys.offsets[index]
+            score = 2 * shared / (len(grams) + key_grams)
+            entry = self._key_entries[index] & ~_SUFFIX
+            if score >= _FUZZY_MIN_SCORE and score > scored.get(entry, (0,))[0]:
+                scored[entry] = (score, self._key_weights[index])
+        return sorted(scored, key=lambda entry: (-scored[entry][0], -scored[entry][1], entry))[:limit]
+
+
+_TAXONOMIES: Dict[str, Taxonomy] = {}
+_TAXONOMIES_LOCK = threading.Lock()
+
+
+def get_taxonomy(name: str) -> Taxonomy:
+    """
+    Returns the named taxonomy (e.g. 'skills'), loading it on first use from TAXONOMY_DIR:
+    <name>.idx is memory-mapped, otherwise <name>.tsv is compiled in memory. A taxonomy
+    with neither file is empty.
+    """
+    taxonomy = _TAXONOMIES.get(name)
+    if taxonomy is None:
+        with _TAXONOMIES_LOCK:
+            taxonomy = _TAXONOMIES.get(name)
+            if taxonomy is None:
+                index_path = os.path.join(TAXONOMY_DIR, f"{name}.idx")
+                source_path = os.path.join(TAXONOMY_DIR, f"{name}.tsv")
+                if os.path.exists(index_path):
+                    taxonomy = Taxonomy.open(index_path)
+                elif os.path.exists(source_path):
+                    taxonomy = Taxonomy.from_entries(read_entries(source_path))
+                else:
+                    taxonomy = Taxonomy.from_entries(())
+                _TAXONOMIES[name] = taxonomy
+    return taxonomy
+
+
+def canonical_name(taxonomy: str, text: str) -> str:
+    """
+    text in its canonical spelling if the taxonomy knows it, otherwise text with
+    surrounding whitespace removed.
+    """
+    return get_taxonomy(taxonomy).canonical(text) or text.strip()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or query taxonomy autocomplete indexes.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="Compile a tab-separated taxonomy into an index file.")
+    build.add_argument("source", help="Tab-separated file: name, weight, aliases separated by '|'.")
+    build.add_argument("-o", "--output", required=True, help="Index file to write.")
+    search = commands.add_parser('search', help="Print suggestions for a query.")
+    search.add_argument("index", help="Index file (.idx) or source file (.tsv).")
+    search.add_argument("query")
+    search.add_argument("-n", "--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        data = build_index(read_entries(args.source))
+        with open(args.output, 'wb') as f:
+            f.write(data)
+        taxonomy = Taxonomy(data)
+        print(f"Wrote {len(taxonomy)} entries ({len(data) / 1024 / 1024:.1f} MiB) to {args.output} "
+              f"in {time.perf_counter() - start:.2f} s", file=sys.stderr)
+        return 0
+    if args.index.endswith('.tsv'):
+        taxonomy = Taxonomy.from_entries(read_entries(args.index))
+    else:
+        taxonomy = Taxonomy.open(args.index)
+    start = time.perf_counter()
+    suggestions = taxonomy.search(args.query, args.limit)
+    elapsed = time.perf_counter() - start
+    print("\n".join(suggestions))
+    print(f"{len(suggestions)} suggestion(s) in {elapsed * 1e6:.0f} us", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import unittest
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from ats_score import KeywordScorer, job_vector, score_cv, tokenize, terms
+
+JOB_DESCRIPTION = """We are looking for a Software Engineer with 5+ years of experience in Python, Node.js and C++.
+Experience with machine learning, Kubernetes and Docker required. Strong knowledge of AWS and CI/CD pipelines.
+Machine learning experience is a plus. Excellent communication skills."""
+
+class TestAtsScore(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", summary="Backend engineer building REST APIs in Python and Node.js."),
+            education=[Education(degree="B.Sc.", major="Computer Science")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp",
+                                   description="- Built machine learning pipelines on AWS\n- Led a CI/CD migration")],
+            skills=Skills(technical=["Python", "Docker", "C++"], soft=["Teamwork"])
+        )
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Strong C++, C# and Node.js skills; 5+ years of REST APIs."),
+                         ['c++', 'c#', 'node.js', 'rest', 'api'])
+        self.assertEqual(list(terms("machine learning and data")), ['machine', 'learning', 'machine learning', 'data'])
+
+    def test_job_vector(self):
+        job = job_vector(JOB_DESCRIPTION)
+        self.assertIn('machine learning', job.weights) # Occurs twice
+        self.assertNotIn('kubernetes docker', job.weights) # Occurs once
+        self.assertGreater(job.weights['machine'], job.weights['python'])
+        for filler in ('experience', 'strong', 'years', '5+', 'required'):
+            self.assertNotIn(filler, job.weights)
+
+    def test_score(self):
+        result = score_cv(self.cv_data, JOB_DESCRIPTION)
+        self.assertEqual(result.missing, ('communication', 'kubernetes'))
+        self.assertIn('machine learning', result.matched)
+        self.assertIn('ci/cd', result.matched)
+        self.assertEqual(result.matched[:3], ('learning', 'machine', 'machine learning'))
+        self.assertTrue(80 < result.score < 100)
+        self.assertEqual(result.coverage, f"{len(result.matched)}/{len(result.matched) + 2}")
+
+        self.cv_data.skills.technical += ["Kubernetes"]
+        self.cv_data.skills.soft += ["Communication"]
+        self.assertEqual(score_cv(self.cv_data, JOB_DESCRIPTION).score, 100.0)
+
+    def test_empty_inputs(self):
+        self.assertEqual(score_cv(CVData(), JOB_DESCRIPTION).score, 0.0)
+        self.assertEqual(score_cv(self.cv_data, "").matched, ())
+
+    def test_cached_per_cv_version(self):
+        scorer = KeywordScorer(max_entries=2)
+        first = scorer.score(self.cv_data, JOB_DESCRIPTION)
+        self.assertEqual(scorer.stats(), {"hits": 0, "misses": 2, "cvs": 1, "jobs": 1})
+        self.assertEqual(scorer.score(self.cv_data, JOB_DESCRIPTION), first)
+        self.assertEqual(scorer.hits, 2)
+
+        self.cv_data.experience[0].description += "\n- Ran Kubernetes clusters"
+        second = scorer.score(self.cv_data, JOB_DESCRIPTION)
+        self.assertEqual(scorer.misses, 3)
+        self.assertNotIn('kubernetes', second.missing)
+        self.assertGreater(second.score, first.score)
+
+        for summary in ("one", "two", "three"):
+            self.cv_data.personal_info.summary = summary
+            scorer.score(self.cv_data, JOB_DESCRIPTION)
+        self.assertEqual(scorer.stats()["cvs"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import asdict
+from models import PersonalInformation, Experience, Skills, CVData
+from serialization import dump_stream, encode_record
+from batch_render import RenderOptions, iter_records, parse_record, render_batch, percentile, format_report, main, _disk_cache
+from export_cache import DiskExportCache
+from export_utils import get_render_cache
+
+class TestBatchRender(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.tmp.name, "out")
+        self.records = [
+            asdict(CVData(personal_info=PersonalInformation(name="John Doe", summary="Engineer."),
+                          experience=[Experience(title="Developer", company="Tech Corp", description="Built things")],
+                          skills=Skills(technical=["Python"]))),
+            asdict(CVData(personal_info=PersonalInformation(name="Jane / Doe"))),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_jsonl(self, lines):
+        path = os.path.join(self.tmp.name, "cvs.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def test_iter_records_json_array(self):
+        path = os.path.join(self.tmp.name, "cvs.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.records, f)
+        self.assertEqual(list(iter_records(path)), list(enumerate(self.records)))
+
+    def test_iter_records_json_array_is_read_incrementally(self):
+        path = os.path.join(self.tmp.name, "cvs.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(" [" + ", ".join(json.dumps(record) for record in self.records * 40) + ", {broken")
+        records = iter_records(path)
+        self.assertEqual(next(records), (0, self.records[0])) # Before the malformed tail is read
+        with self.assertRaises(ValueError):
+            list(records)
+
+    def test_iter_records_jsonl_with_bad_line(self):
+        path = self.write_jsonl([json.dumps(self.records[0]), "", "{not json", json.dumps(self.records[1])])
+        records = list(iter_records(path))
+        self.assertEqual([index for index, _ in records], [0, 1, 2])
+        self.assertIsInstance(records[1][1], ValueError)
+        self.assertEqual(records[2][1], self.records[1])
+
+    def test_parse_record(self):
+        cv_data = CVData.from_dict(self.records[0])
+        self.assertEqual(parse_record(self.records[0]), cv_data)
+        self.assertEqual(parse_record(encode_record(cv_data)), cv_data)
+        with self.assertRaises(ValueError):
+            parse_record(ValueError("bad line"))
+
+    def test_render_batch_isolates_failures(self):
+        records = [(0, self.records[0]), (1, {"education": ["not an object"]}), (2, ValueError("bad line")), (3, self.records[1])]
+        options = RenderOptions(output_dir=self.output_dir)
+        report = render_batch(records, options, workers=1, chunksize=3)
+        self.assertEqual([result.index for result in report.results], [0, 1, 2, 3])
+        self.assertEqual([result.index for result in report.failures], [1, 2])
+        self.assertIn("ValueError", report.failures[0].error)
+        self.assertEqual(sorted(os.listdir(self.output_dir)), [
+            "000000_John_Doe.docx", "000000_John_Doe.md", "000000_John_Doe.pdf",
+            "000003_Jane_Doe.docx", "000003_Jane_Doe.md", "000003_Jane_Doe.pdf",
+        ])
+        with open(os.path.join(self.output_dir, "000000_John_Doe.pdf"), "rb") as f:
+            self.assertTrue(f.read().startswith(b"%PDF"))
+        self.assertEqual(len(report.latencies("pdf")), 2)
+        self.assertIn("record 1: ValueError", format_report(report, options.formats))
+
+    def test_binary_stream_input(self):
+        path = os.path.join(self.tmp.name, "cvs.cvd")
+        with open(path, "wb") as f:
+            dump_stream([CVData.from_dict(record) for record in self.records], f)
+        records = list(iter_records(path))
+        self.assertEqual([index for index, _ in records], [0, 1])
+        self.assertIsInstance(records[0][1], bytes)
+        report = render_batch(records, RenderOptions(output_dir=self.output_dir, formats=("md",)), workers=1)
+        self.assertEqual(report.failures, [])
+        with open(os.path.join(self.output_dir, "000001_Jane_Doe.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# Jane / Doe\n")
+
+    def test_render_batch_with_process_pool(self):
+        records = list(enumerate(self.records * 3))
+        options = RenderOptions(output_dir=self.output_dir, formats=("md", "docx"), docx_engine="stream")
+        report = render_batch(records, options, workers=2, chunksize=2)
+        self.assertEqual([result.index for result in report.results], list(range(6)))
+        self.assertEqual(report.failures, [])
+        self.assertEqual(len(os.listdir(self.output_dir)), 12)
+
+    def test_repeated_batch_uses_disk_cache(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        options = RenderOptions(output_dir=self.output_dir, formats=("pdf", "docx"), docx_engine="stream", cache_dir=cache_dir)
+        first = render_batch(list(enumerate(self.records)), options, workers=2)
+        self.assertEqual(first.failures, [])
+        self.assertEqual(len(DiskExportCache(cache_dir)), 4)
+        render_batch(list(enumerate(self.records)), options, workers=1) # Renders in this process
+        self.assertEqual(_disk_cache(options).stats()["hits"], 4)
+        self.assertEqual(_disk_cache(options).stats()["misses"], 0)
+        self.assertIsNone(get_render_cache()) # The process-wide render cache is left alone
+        with open(os.path.join(self.output_dir, "000000_John_Doe.pdf"), "rb") as f:
+            self.assertTrue(f.read().startswith(b"%PDF"))
+
+    def test_unusable_cache_dir_fails_each_record(self):
+        cache_dir = os.path.join(self.tmp.name, "not_a_directory")
+        open(cache_dir, "w").close()
+        options = RenderOptions(output_dir=self.output_dir, formats=("md",), cache_dir=cache_dir)
+        report = render_batch(list(enumerate(self.records)), options, workers=1)
+        self.assertEqual([result.index for result in report.failures], [0, 1])
+        self.assertIn("FileExistsError", report.failures[0].error)
+
+    def test_unreadable_input_is_reported_after_the_records_before_it(self):
+        path = os.path.join(self.tmp.name, "cvs.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[" + ", ".join(json.dumps(record) for record in self.records) + ", {broken")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main([path, "-o", self.output_dir, "-f", "md", "-w", "1"]), 1)
+        self.assertIn("Rendered 2/3 CVs", out.getvalue())
+        self.assertIn("record 2: JSONDecodeError", out.getvalue())
+        self.assertEqual(len(os.listdir(self.output_dir)), 2)
+
+    def test_workers_must_be_positive(self):
+        path = self.write_jsonl([json.dumps(self.records[0])])
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main([path, "-o", self.output_dir, "-w", "0"])
+        with self.assertRaises(ValueError):
+            render_batch([], RenderOptions(output_dir=self.output_dir), workers=0)
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 95), 95.0)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_main_exit_code(self):
+        path = self.write_jsonl([json.dumps(self.records[0]), "[1, 2]"])
+        self.assertEqual(main([path, "-o", self.output_dir, "-f", "md", "-w", "1"]), 1)
+        path = self.write_jsonl([json.dumps(self.records[0])])
+        self.assertEqual(main([path, "-o", self.output_dir, "-f", "md", "-w", "1"]), 0)
+
+if __name__ == '__main__':
+    unittest.main()
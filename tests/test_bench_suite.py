@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from io import StringIO
+from benchmarks.suite import SUITE_VERSION, run_suite, compare, main
+
+class TestBenchSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = {"version": SUITE_VERSION, "results": {
+            "e3-w14-s6/md": {"latency_ms": 1.0, "peak_kib": 100.0, "size_bytes": 1000},
+            "e3-w14-s6/pdf": {"latency_ms": 10.0, "peak_kib": 500.0, "size_bytes": 5000},
+        }}
+
+    def test_run_suite_measures_every_scenario_and_target(self):
+        report = run_suite([1, 2], [5], [3], ["md", "docx-stream"], repeat=1)
+        self.assertEqual(report["version"], SUITE_VERSION)
+        self.assertEqual(list(report["results"]), ["e1-w5-s3/md", "e1-w5-s3/docx-stream",
+                                                   "e2-w5-s3/md", "e2-w5-s3/docx-stream"])
+        for metrics in report["results"].values():
+            self.assertGreater(metrics["latency_ms"], 0)
+            self.assertGreater(metrics["peak_kib"], 0)
+            self.assertGreater(metrics["size_bytes"], 0)
+        self.assertGreater(report["results"]["e2-w5-s3/md"]["size_bytes"], report["results"]["e1-w5-s3/md"]["size_bytes"])
+
+    def test_compare_flags_metrics_past_their_threshold(self):
+        current = {"version": SUITE_VERSION, "results": {
+            "e3-w14-s6/md": {"latency_ms": 1.2, "peak_kib": 150.0, "size_bytes": 900},
+            "e3-w14-s6/pdf": {"latency_ms": 14.0, "peak_kib": 500.0, "size_bytes": 5000},
+            "e25-w14-s6/md": {"latency_ms": 99.0, "peak_kib": 999.0, "size_bytes": 9999}, # Not in the baseline
+        }}
+        regressions = compare(self.baseline, current)
+        self.assertEqual([(key, metric) for key, metric, *_ in regressions],
+                         [("e3-w14-s6/md", "peak_kib"), ("e3-w14-s6/pdf", "latency_ms")])
+        self.assertAlmostEqual(regressions[1][4], 0.4)
+        self.assertEqual(compare(self.baseline, self.baseline), [])
+        with self.assertRaises(ValueError):
+            compare({"version": SUITE_VERSION + 1, "results": {}}, current)
+
+    def test_save_then_compare(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            args = ["--entries", "1", "--words", "5", "--skills", "3", "--targets", "md", "--repeat", "1"]
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                self.assertEqual(main(args + ["--save", path]), 0)
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            self.assertEqual(list(saved["results"]), ["e1-w5-s3/md"])
+
+            saved["results"]["e1-w5-s3/md"]["size_bytes"] = 1 # Current output is now far larger
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+            out = StringIO()
+            with redirect_stdout(out), redirect_stderr(StringIO()):
+                self.assertEqual(main(args + ["--compare", path, "--latency-threshold", "1000"]), 1)
+            self.assertIn("REGRESSION e1-w5-s3/md size_bytes", out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from io import StringIO
 from models import PersonalInformation, Education, Experience, Skills, CVData
-from cv_builder import generate_cv_content
+from cv_builder import generate_cv_content, iter_cv_content, write_cv_content, IncrementalRenderer
 
 class TestCvBuilder(unittest.TestCase):
 
@@ -170,5 +171,49 @@ class TestCvBuilder(unittest.TestCase):
         )
         self.assertEqual(content, expected_content)
 
+    def test_iter_cv_content_yields_sections_and_entries(self):
+        cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", summary="Engineer."),
+            experience=[Experience(title="Developer", company="Tech Corp", location="Remote",
+                                   start_date="2020", end_date="2021", description="Built things")] * 3,
+            skills=Skills(technical=["Python"])
+        )
+        chunks = list(iter_cv_content(cv_data))
+        self.assertEqual(chunks[:3], ["# John Doe\n", "## Summary\n", "Engineer.\n\n"])
+        self.assertEqual(chunks[4], "- **Developer** at Tech Corp, Remote\n  2020 - 2021\n  - Built things\n\n")
+        self.assertEqual(len(chunks), 9)
+        self.assertEqual("".join(chunks), generate_cv_content(cv_data))
+        self.assertEqual(list(iter_cv_content(CVData())), [])
+
+    def test_write_cv_content(self):
+        cv_data = CVData(personal_info=PersonalInformation(name="John Doe", email="john@example.com"),
+                         education=[Education(degree="B.Sc.", major="Physics", gpa="3.5")])
+        buffer = StringIO()
+        written = write_cv_content(cv_data, buffer)
+        self.assertEqual(buffer.getvalue(), generate_cv_content(cv_data))
+        self.assertEqual(written, len(buffer.getvalue()))
+
+    def test_incremental_renderer_rebuilds_only_changed_sections(self):
+        cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john@example.com", summary="Engineer."),
+            education=[Education(degree="B.Sc.", major="Physics", institution="Uni", gpa="3.5")],
+            experience=[Experience(title=f"Developer {i}", company="Tech Corp", description="Built things\nShipped")
+                        for i in range(5)],
+            skills=Skills(technical=["Python"], languages=["English"])
+        )
+        renderer = IncrementalRenderer()
+        self.assertEqual(renderer.render(cv_data), generate_cv_content(cv_data))
+        self.assertEqual((renderer.hits, renderer.misses), (0, 11))
+
+        cv_data.experience[2].description += "\nMentored juniors"
+        self.assertEqual(renderer.render(cv_data), generate_cv_content(cv_data))
+        self.assertEqual((renderer.hits, renderer.misses), (10, 12))
+
+        cv_data.personal_info.summary = ""
+        cv_data.skills.soft.append("Teamwork")
+        cv_data.education.pop()
+        self.assertEqual(renderer.render(cv_data), generate_cv_content(cv_data))
+        self.assertEqual(renderer.render(CVData()), "")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import copy
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+import serialization
+from models import CVData
+from cv_dedup import DuplicateIndex, Duplicate, lsh_bands, minhash, shingles, signature, similarity, cv_text, main
+from benchmarks.synthetic import make_cv
+
+def resubmitted(cv_data):
+    cv_data = copy.deepcopy(cv_data)
+    cv_data.personal_info.phone = "+44 7700 900123"
+    cv_data.skills.technical.append("Rust")
+    return cv_data
+
+class TestCvDedup(unittest.TestCase):
+
+    def test_signature_estimates_jaccard(self):
+        first, second = make_cv(seed=1), resubmitted(make_cv(seed=1))
+        a, b = shingles(cv_text(first)), shingles(cv_text(second))
+        jaccard = len(a & b) / len(a | b)
+        self.assertAlmostEqual(similarity(signature(first), signature(second)), jaccard, delta=0.1)
+        self.assertLess(similarity(signature(first), signature(make_cv(seed=2))), 0.3)
+        self.assertEqual(signature(first), signature(copy.deepcopy(first)))
+        self.assertEqual(len(signature(first, num_perm=64)), 64)
+
+    def test_small_sets_are_densified(self):
+        sig = minhash(shingles("Python developer"), num_perm=16)
+        self.assertEqual(len(sig), 16)
+        self.assertEqual(similarity(sig, minhash(shingles("python   DEVELOPER!"), num_perm=16)), 1.0)
+        self.assertEqual(minhash(set()), ())
+        self.assertEqual(similarity((), ()), 0.0)
+
+    def test_lsh_bands(self):
+        bands, rows = lsh_bands(0.8, 128)
+        self.assertLessEqual(bands * rows, 128)
+        self.assertGreater(1 - (1 - 0.85 ** rows) ** bands, 0.9) # Pairs just above the threshold are found
+        self.assertLess(1 - (1 - 0.4 ** rows) ** bands, 0.01)
+        low_bands, low_rows = lsh_bands(0.5, 128)
+        self.assertLess(low_rows, rows)
+
+    def test_flags_duplicates_at_ingest(self):
+        index = DuplicateIndex(threshold=0.8)
+        for seed in range(50):
+            self.assertEqual(index.add(seed, make_cv(seed=seed)), [])
+        duplicates = index.add('copy', resubmitted(make_cv(seed=7)))
+        self.assertEqual([duplicate.key for duplicate in duplicates], [7])
+        self.assertGreaterEqual(duplicates[0].similarity, 0.8)
+        self.assertEqual([duplicate.key for duplicate in index.query(make_cv(seed=7))], [7, 'copy'])
+        self.assertEqual(len(index), 51)
+
+    def test_replace_and_remove(self):
+        index = DuplicateIndex()
+        index.add('a', make_cv(seed=1))
+        index.add('b', make_cv(seed=2))
+        self.assertEqual(index.add('b', make_cv(seed=1)), [Duplicate('a', 1.0)]) # Replaced, not compared with itself
+        index.remove('a')
+        self.assertNotIn('a', index)
+        self.assertEqual(index.query(make_cv(seed=1)), [Duplicate('b', 1.0)])
+        self.assertEqual(index.add('empty', CVData()), [])
+        index.remove('empty')
+        with self.assertRaises(KeyError):
+            index.remove('a')
+        with self.assertRaises(ValueError):
+            DuplicateIndex(threshold=0)
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cvs.jsonl')
+            with open(path, 'w', encoding='utf-8') as f:
+                for cv_data in (make_cv(seed=1), make_cv(seed=2), resubmitted(make_cv(seed=1))):
+                    f.write(serialization.to_json(cv_data) + "\n")
+            output = io.StringIO()
+            with redirect_stdout(output), redirect_stderr(io.StringIO()):
+                self.assertEqual(main([path]), 0)
+        record, original, score = output.getvalue().strip().split("\t")
+        self.assertEqual((record, original), ('2', '0'))
+        self.assertGreaterEqual(float(score), 0.8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from docx import Document
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from cv_document import CVDocument, ContactItem, Run, build_document, as_document, split_bullets
+from cv_builder import generate_cv_content
+from export_utils import export_to_pdf, export_to_docx
+
+class TestCvDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(
+                name="John Doe",
+                email="john.doe@example.com",
+                phone="123-456-7890",
+                linkedin="linkedin.com/johndoe",
+                github="github.com/johndoe",
+                summary="A highly motivated individual with experience in software development."
+            ),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 location="Example City", start_date="2020-09-01", end_date="2022-06-30", gpa="3.9")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", location="Example Town",
+                                   start_date="2022-07-01", end_date="Present",
+                                   description="- Developed and maintained robust web applications.\n\n  - Collaborated with cross-functional teams.  ")],
+            skills=Skills(technical=["Python", "Flask", "SQL"], languages=["English"])
+        )
+
+    def test_build_document(self):
+        document = build_document(self.full_cv_data)
+        self.assertEqual(document.name, "John Doe")
+        self.assertEqual(document.contacts[2], ContactItem("LinkedIn", "linkedin.com/johndoe"))
+        self.assertEqual(document.contacts[2].labelled, "LinkedIn: linkedin.com/johndoe")
+        self.assertEqual(document.contacts[0].labelled, "john.doe@example.com")
+        self.assertEqual([section.key for section in document.sections], ['summary', 'education', 'experience', 'skills'])
+
+        education = document.section('education').entries[0]
+        self.assertEqual(education.heading, (Run("M.Sc.", bold=True), Run(" in Computer Science")))
+        self.assertEqual(education.place, "University of Example, Example City")
+        self.assertEqual(education.gpa, "3.9")
+
+        experience = document.section('experience').entries[0]
+        self.assertEqual(experience.bullets, ("- Developed and maintained robust web applications.",
+                                              "- Collaborated with cross-functional teams."))
+        self.assertIsNone(experience.gpa)
+        self.assertEqual(document.section('skills').paragraphs,
+                         ((Run("Technical Skills:", True), Run(" Python, Flask, SQL")),
+                          (Run("Languages:", True), Run(" English"))))
+
+    def test_empty_cv(self):
+        self.assertEqual(build_document(CVData()), CVDocument())
+        # Contact details are only shown under a name
+        self.assertEqual(build_document(CVData(personal_info=PersonalInformation(email="a@b.c"))).contacts, ())
+
+    def test_document_is_immutable_and_hashable(self):
+        document = build_document(self.full_cv_data)
+        with self.assertRaises(FrozenInstanceError):
+            document.name = "Jane Doe"
+        self.assertEqual(hash(document), hash(build_document(self.full_cv_data)))
+
+    def test_as_document(self):
+        document = build_document(self.full_cv_data)
+        self.assertIs(as_document(document), document)
+        self.assertEqual(as_document(self.full_cv_data), document)
+
+    def test_split_bullets(self):
+        self.assertEqual(split_bullets(" one \n\n\ttwo\n   "), ("one", "two"))
+        self.assertEqual(split_bullets(""), ())
+
+    def test_backends_accept_document(self):
+        document = build_document(self.full_cv_data)
+        self.assertEqual(generate_cv_content(document), generate_cv_content(self.full_cv_data))
+        for engine in ('platypus', 'canvas'):
+            self.assertEqual(export_to_pdf(document, "cv.pdf", engine=engine).getvalue()[:4], b"%PDF")
+        for engine in ('python-docx', 'stream'):
+            runs = [(r.text, r.bold) for r in Document(export_to_docx(document, "cv.docx", engine=engine)).paragraphs[7].runs]
+            self.assertEqual(runs, [("M.Sc.", True), (" in Computer Science", None)])
+
+    def test_pdf_text_is_not_parsed_as_markup(self):
+        cv_data = CVData(personal_info=PersonalInformation(name="R&D <Lab>", summary="Tags like <br/> & <b>"))
+        for engine in ('platypus', 'canvas'):
+            self.assertGreater(export_to_pdf(cv_data, "cv.pdf", engine=engine).getbuffer().nbytes, 0)
+
+if __name__ == '__main__':
+    unittest.main()
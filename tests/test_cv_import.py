@@ -0,0 +1,157 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from docx import Document
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from export_utils import export_to_pdf, export_to_docx
+from cv_import import import_cv, import_files, iter_import_paths, section_key, main
+
+class TestCvImport(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com", phone="123-456-7890",
+                                              linkedin="linkedin.com/johndoe", github="github.com/johndoe",
+                                              summary="A highly motivated individual with experience in software development."),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 location="Example City", start_date="2020-09-01", end_date="2022-06-30", gpa="3.9")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", location="Example Town",
+                                   start_date="2022-07-01", end_date="Present",
+                                   description="- Developed web applications.\n- Collaborated with cross-functional teams.")],
+            skills=Skills(technical=["Python", "Flask", "SQL"], soft=["Teamwork"], languages=["English"])
+        )
+
+    def test_docx_round_trip(self):
+        for engine in ('python-docx', 'stream'):
+            for optimize_size in (False, True):
+                data = export_to_docx(self.full_cv_data, "cv.docx", engine=engine, optimize_size=optimize_size).getvalue()
+                self.assertEqual(import_cv(data), self.full_cv_data, (engine, optimize_size))
+
+    def test_pdf_round_trip(self):
+        for engine in ('platypus', 'canvas'):
+            for optimize_size in (False, True):
+                data = export_to_pdf(self.full_cv_data, "cv.pdf", engine=engine, optimize_size=optimize_size).getvalue()
+                self.assertEqual(import_cv(data), self.full_cv_data, (engine, optimize_size))
+
+    def test_multi_page_pdf(self):
+        description = "\n".join("- " + " ".join(f"word{i}{j}" for j in range(30)) for i in range(4))
+        cv_data = CVData(personal_info=PersonalInformation(name="Jane Smith"),
+                         experience=[Experience(title=f"Engineer {i}", company="Tech Corp", location="Leeds",
+                                                start_date="2020", end_date="2021", description=description)
+                                     for i in range(8)])
+        data = export_to_pdf(cv_data, "cv.pdf").getvalue()
+        self.assertEqual(import_cv(data), cv_data)
+
+    def test_generic_docx(self):
+        document = Document()
+        document.add_paragraph("Jane Smith", style='Title')
+        document.add_paragraph("jane@mail.com • +44 7700 900123 • linkedin.com/in/jane")
+        document.add_paragraph("Profile", style='Heading 1')
+        document.add_paragraph("Data scientist with eight years of experience.")
+        document.add_paragraph("Work Experience", style='Heading 1')
+        document.add_paragraph("Data Scientist at Acme, London", style='Heading 3')
+        document.add_paragraph("Jan 2019 – Present")
+        document.add_paragraph("Built forecasting models", style='List Bullet')
+        document.add_paragraph("Awards", style='Heading 1')
+        document.add_paragraph("Best paper 2018")
+        document.add_paragraph("EDUCATION", style='Heading 1')
+        document.add_paragraph("BSc in Mathematics", style='Heading 3')
+        document.add_paragraph("University of Leeds, Leeds")
+        document.add_paragraph("2012 - 2015")
+        document.add_paragraph("Skills", style='Heading 1')
+        document.add_paragraph("Python; R; SQL")
+        document.add_paragraph("Languages: English, French")
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        cv_data = import_cv(buffer.getvalue())
+        self.assertEqual(cv_data.personal_info, PersonalInformation(
+            name="Jane Smith", email="jane@mail.com", phone="+44 7700 900123", linkedin="linkedin.com/in/jane",
+            summary="Data scientist with eight years of experience."))
+        self.assertEqual(cv_data.experience, [Experience(title="Data Scientist", company="Acme", location="London",
+                                                         start_date="Jan 2019", end_date="Present",
+                                                         description="Built forecasting models")])
+        self.assertEqual(cv_data.education, [Education(degree="BSc", major="Mathematics", institution="University of Leeds",
+                                                       location="Leeds", start_date="2012", end_date="2015")])
+        self.assertEqual(cv_data.skills, Skills(technical=["Python", "R", "SQL"], languages=["English", "French"]))
+
+    def test_section_key(self):
+        self.assertEqual(section_key("WORK EXPERIENCE"), 'experience')
+        self.assertEqual(section_key("Education & Training:"), 'education')
+        self.assertEqual(section_key("Professional Summary"), 'summary')
+        self.assertIsNone(section_key("Software Engineer"))
+
+    def test_unsupported_file(self):
+        with self.assertRaises(ValueError):
+            import_cv(b"plain text", "cv.txt")
+        with self.assertRaises(ValueError):
+            import_cv(b"PK\x03\x04 truncated")
+
+    def test_corrupted_files(self):
+        rng = random.Random(0)
+        for fmt, data in (("PDF", export_to_pdf(self.full_cv_data, "cv.pdf").getvalue()),
+                          ("DOCX", export_to_docx(self.full_cv_data, "cv.docx").getvalue())):
+            for attempt in range(60):
+                damaged = bytearray(data)
+                if attempt % 2:
+                    del damaged[rng.randrange(16, len(damaged)):]
+                else:
+                    for _ in range(rng.randrange(1, 20)):
+                        damaged[rng.randrange(16, len(damaged))] ^= 0xFF
+                try:
+                    import_cv(bytes(damaged))
+                except ValueError as exc:
+                    self.assertTrue(str(exc).startswith(f"Not a readable {fmt} document: "), (attempt, str(exc)))
+
+    def test_importer_bugs_are_not_reported_as_damaged_files(self):
+        data = export_to_pdf(self.full_cv_data, "cv.pdf").getvalue()
+        with mock.patch('cv_import.assemble', side_effect=TypeError("a bug")):
+            with self.assertRaisesRegex(TypeError, "a bug"):
+                import_cv(data)
+
+    def test_bulk_import_submits_paths_as_it_goes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cv.pdf')
+            with open(path, 'wb') as f:
+                f.write(b"%PDF-1.4 broken")
+            taken = []
+
+            def paths():
+                for _ in range(40):
+                    taken.append(path)
+                    yield path
+
+            results = import_files(paths(), workers=2, chunksize=1)
+            self.assertIsNotNone(next(results).error)
+            self.assertLessEqual(len(taken), 4) # Two chunks per worker in flight
+            self.assertEqual(len(list(results)), 39)
+
+    def test_bulk_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.mkdir(os.path.join(directory, 'more'))
+            paths = {'a.docx': export_to_docx(self.full_cv_data, "cv.docx").getvalue(),
+                     os.path.join('more', 'b.pdf'): export_to_pdf(self.full_cv_data, "cv.pdf").getvalue(),
+                     'c.pdf': b"%PDF-1.4 broken", 'notes.txt': b"ignored"}
+            for name, data in paths.items():
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(data)
+            found = list(iter_import_paths([directory]))
+            self.assertEqual([os.path.relpath(path, directory) for path in found],
+                             ['a.docx', 'c.pdf', os.path.join('more', 'b.pdf')])
+            for workers in (1, 2):
+                results = list(import_files(found, workers=workers, chunksize=1))
+                self.assertEqual([result.path for result in results], found)
+                self.assertEqual(results[0].cv_data, self.full_cv_data)
+                self.assertIsNotNone(results[1].error)
+                self.assertEqual(results[2].cv_data, self.full_cv_data)
+
+            output = os.path.join(directory, 'out.jsonl')
+            self.assertEqual(main([directory, '-o', output, '--workers', '1']), 1)
+            with open(output, encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
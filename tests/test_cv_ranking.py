@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+import serialization
+from models import PersonalInformation, Experience, Skills, CVData
+from ats_score import score_cv
+from cv_ranking import CVIndex, Match, main
+from benchmarks.synthetic import keyword_cv, job_description
+
+def make_cv(name, skills, description=""):
+    return CVData(personal_info=PersonalInformation(name=name),
+                  experience=[Experience(title="Engineer", description=description)],
+                  skills=Skills(technical=skills))
+
+class TestCvRanking(unittest.TestCase):
+
+    def setUp(self):
+        self.cvs = {
+            'ada': make_cv("Ada", ["Python", "Machine Learning", "AWS"], "- Built data pipelines"),
+            'bob': make_cv("Bob", ["Java", "Spring", "AWS"]),
+            'cy': make_cv("Cy", ["Python", "Django"], "- Built REST APIs"),
+        }
+        self.job = "Python engineer: machine learning, data pipelines and AWS. Machine learning in production."
+
+    def test_scores_match_ats_score(self):
+        index = CVIndex()
+        index.add_many(self.cvs.items())
+        expected = sorted(((key, score_cv(cv_data, self.job).score) for key, cv_data in self.cvs.items()),
+                          key=lambda item: -item[1])
+        self.assertEqual(index.top_k(self.job, k=3), [Match(key, score) for key, score in expected])
+        self.assertEqual(index.top_k(self.job, k=1)[0].key, 'ada')
+        self.assertEqual(index.scores(self.job), dict(expected))
+        self.assertEqual(index.explain('bob', self.job), score_cv(self.cvs['bob'], self.job))
+
+        for seed in range(20):
+            cv_data = keyword_cv(seed)
+            index.add(seed, cv_data)
+            text = job_description(seed)
+            scores = index.scores(text)
+            self.assertEqual(scores.get(seed, 0.0), score_cv(cv_data, text).score)
+
+    def test_incremental_updates(self):
+        index = CVIndex()
+        index.add_many(self.cvs.items())
+        index.add('bob', make_cv("Bob", ["Python", "Machine Learning", "AWS", "Data Pipelines", "Production"]))
+        self.assertEqual(index.top_k(self.job, k=1)[0].key, 'bob')
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.document_frequency('java'), 0)
+
+        index.remove('bob')
+        self.assertNotIn('bob', index)
+        self.assertNotIn('bob', [match.key for match in index.top_k(self.job, k=5)])
+        index.add('dee', CVData(personal_info=PersonalInformation(name="Dee"), skills=Skills(technical=["Go"])))
+        self.assertEqual(sorted(index.keys()), ['ada', 'cy', 'dee'])
+        self.assertNotIn('dee', [match.key for match in index.top_k(self.job, k=5)]) # No matching terms
+        with self.assertRaises(KeyError):
+            index.remove('bob')
+
+    def test_tfidf_discounts_common_terms(self):
+        index = CVIndex('tfidf')
+        index.add_many(self.cvs.items())
+        self.assertEqual(index.document_frequency('aws'), 2)
+        keywords = CVIndex()
+        keywords.add_many(self.cvs.items())
+        # 'bob' only shares the common term AWS
+        self.assertLess(index.scores(self.job)['bob'], keywords.scores(self.job)['bob'])
+        with self.assertRaises(ValueError):
+            CVIndex('bm25')
+
+    def test_empty_job(self):
+        index = CVIndex()
+        index.add_many(self.cvs.items())
+        self.assertEqual(index.top_k("the and of"), [])
+        with self.assertRaises(ValueError):
+            index.top_k(self.job, k=0)
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cvs_path = os.path.join(directory, 'cvs.jsonl')
+            with open(cvs_path, 'w', encoding='utf-8') as f:
+                for cv_data in self.cvs.values():
+                    f.write(serialization.to_json(cv_data) + "\n")
+            jobs = os.path.join(directory, 'jobs')
+            os.mkdir(jobs)
+            with open(os.path.join(jobs, 'ml.txt'), 'w', encoding='utf-8') as f:
+                f.write(self.job)
+            output = os.path.join(directory, 'ranking.jsonl')
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(main([cvs_path, jobs, '-k', '2', '-o', output]), 0)
+            with open(output, encoding='utf-8') as f:
+                rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['job'], 'ml')
+        self.assertEqual([match['name'] for match in rows[0]['matches']], ["Ada", "Bob"]) # Bob and Cy tie; index order decides
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import re
+import unittest
+import zipfile
+from docx import Document
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from export_utils import export_to_docx
+from docx_compact import compact_docx
+
+def paragraphs(buffer):
+    document = Document(buffer)
+    return [(p.style.name, p.alignment, [(r.text, r.bold, r.font.size) for r in p.runs]) for p in document.paragraphs]
+
+class TestDocxCompact(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com",
+                                              summary="A highly motivated individual."),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 start_date="2020-09-01", end_date="2022-06-30", gpa="3.9")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", start_date="2022-07-01",
+                                   end_date="Present", description="- Developed web applications.\n- Led a team.")],
+            skills=Skills(technical=["Python", "SQL"], soft=["Teamwork"])
+        )
+
+    def test_same_paragraphs_and_styles(self):
+        for engine in ('python-docx', 'stream'):
+            for cv_data in (self.full_cv_data, CVData()):
+                expected = paragraphs(export_to_docx(cv_data, "cv.docx", engine=engine))
+                actual = paragraphs(export_to_docx(cv_data, "cv.docx", engine=engine, optimize_size=True))
+                self.assertEqual(actual, expected)
+
+    def test_smaller_package(self):
+        regular = export_to_docx(self.full_cv_data, "cv.docx")
+        small = export_to_docx(self.full_cv_data, "cv.docx", optimize_size=True)
+        self.assertLess(small.getbuffer().nbytes, regular.getbuffer().nbytes / 3)
+
+        package = zipfile.ZipFile(small)
+        self.assertIsNone(package.testzip())
+        self.assertEqual(package.namelist()[0], '[Content_Types].xml')
+        names = set(package.namelist())
+        self.assertIn('word/document.xml', names)
+        self.assertIn('word/styles.xml', names)
+        for dropped in ('word/theme/theme1.xml', 'word/stylesWithEffects.xml', 'word/webSettings.xml',
+                        'word/fontTable.xml', 'docProps/thumbnail.jpeg', 'docProps/app.xml'):
+            self.assertNotIn(dropped, names)
+        self.assertFalse(any(name.startswith('customXml/') for name in names))
+        self.assertNotIn(b'latentStyles', package.read('word/styles.xml'))
+        self.assertNotIn(b'Theme"', package.read('word/styles.xml'))
+
+    def test_relationships_point_to_existing_parts(self):
+        package = zipfile.ZipFile(export_to_docx(self.full_cv_data, "cv.docx", optimize_size=True))
+        names = set(package.namelist())
+        for rels_name, base in (('_rels/.rels', ''), ('word/_rels/document.xml.rels', 'word/')):
+            targets = re.findall(r'Target="([^"]+)"', package.read(rels_name).decode('utf-8'))
+            self.assertTrue(targets)
+            for target in targets:
+                self.assertIn(target[1:] if target.startswith('/') else base + target, names)
+        for part in re.findall(r'PartName="/([^"]+)"', package.read('[Content_Types].xml').decode('utf-8')):
+            self.assertIn(part, names)
+
+    def test_output_is_deterministic(self):
+        data = export_to_docx(self.full_cv_data, "cv.docx").getvalue()
+        self.assertEqual(compact_docx(data), compact_docx(data))
+
+if __name__ == '__main__':
+    unittest.main()
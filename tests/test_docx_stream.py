@@ -0,0 +1,77 @@
+import unittest
+import zipfile
+from io import BytesIO
+from docx import Document
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from export_utils import export_to_docx
+from docx_stream import write_docx_stream
+
+def paragraphs(buffer):
+    document = Document(buffer)
+    return [(p.style.name, p.alignment, [(r.text, r.bold) for r in p.runs]) for p in document.paragraphs]
+
+class TestDocxStream(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(
+                name="John Doe",
+                email="john.doe@example.com",
+                phone="123-456-7890",
+                linkedin="linkedin.com/johndoe",
+                github="github.com/johndoe",
+                summary="A highly motivated individual with experience in software development."
+            ),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 location="Example City", start_date="2020-09-01", end_date="2022-06-30", gpa="3.9")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", location="Example Town",
+                                   start_date="2022-07-01", end_date="Present",
+                                   description="- Developed and maintained robust web applications.\n\n- Collaborated with cross-functional teams.")],
+            skills=Skills(technical=["Python", "Flask", "SQL"], soft=["Teamwork"], languages=["English"])
+        )
+
+    def test_matches_python_docx_engine(self):
+        for cv_data in (self.full_cv_data, CVData(), CVData(skills=Skills(soft=["Teamwork"]))):
+            expected = paragraphs(export_to_docx(cv_data, "cv.docx"))
+            actual = paragraphs(export_to_docx(cv_data, "cv.docx", engine='stream'))
+            self.assertEqual(actual, expected)
+
+    def test_same_package_parts(self):
+        expected = zipfile.ZipFile(export_to_docx(self.full_cv_data, "cv.docx"))
+        actual = zipfile.ZipFile(export_to_docx(self.full_cv_data, "cv.docx", engine='stream'))
+        self.assertEqual(sorted(actual.namelist()), sorted(expected.namelist()))
+        self.assertEqual(actual.read('word/styles.xml'), expected.read('word/styles.xml'))
+        self.assertIsNone(actual.testzip())
+
+    def test_special_characters(self):
+        cv_data = CVData(personal_info=PersonalInformation(
+            name="Anna & <Bob>",
+            summary=" Leading space\tand tab\nsecond line "
+        ))
+        expected = paragraphs(export_to_docx(cv_data, "cv.docx"))
+        actual = paragraphs(export_to_docx(cv_data, "cv.docx", engine='stream'))
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual[3][2][0][0], " Leading space\tand tab\nsecond line ")
+
+    def test_invalid_xml_characters_are_dropped(self):
+        cv_data = CVData(personal_info=PersonalInformation(name="John\x0b Doe"))
+        actual = paragraphs(export_to_docx(cv_data, "cv.docx", engine='stream'))
+        self.assertEqual(actual[0][2], [("John Doe", None)])
+
+    def test_output_is_deterministic(self):
+        first = export_to_docx(self.full_cv_data, "cv.docx", engine='stream').getvalue()
+        second = export_to_docx(self.full_cv_data, "cv.docx", engine='stream').getvalue()
+        self.assertEqual(first, second)
+
+    def test_write_to_file_object(self):
+        buffer = BytesIO()
+        write_docx_stream(self.full_cv_data, buffer)
+        buffer.seek(0)
+        self.assertEqual(paragraphs(buffer)[0][2], [("John Doe", None)])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            export_to_docx(self.full_cv_data, "cv.docx", engine='does-not-exist')
+
+if __name__ == '__main__':
+    unittest.main()
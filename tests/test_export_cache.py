@@ -0,0 +1,169 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from models import PersonalInformation, Education, Skills, CVData
+from export_cache import ExportCache, DiskExportCache, DeferredExport, fingerprint
+from export_utils import export_to_pdf, export_to_docx, set_render_cache
+
+class TestExportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            education=[Education(degree="M.Sc.", major="Computer Science")],
+            skills=Skills(technical=["Python"])
+        )
+        self.render_calls = 0
+
+    def render(self, cv_data):
+        self.render_calls += 1
+        return cv_data.personal_info.name.encode("utf-8")
+
+    def test_fingerprint_is_stable_for_equal_data(self):
+        copy = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            education=[Education(degree="M.Sc.", major="Computer Science")],
+            skills=Skills(technical=["Python"])
+        )
+        self.assertEqual(fingerprint(self.cv_data), fingerprint(copy))
+
+    def test_fingerprint_changes_with_content(self):
+        before = fingerprint(self.cv_data)
+        self.cv_data.skills.technical.append("SQL")
+        self.assertNotEqual(before, fingerprint(self.cv_data))
+
+    def test_get_or_render_serves_cached_bytes(self):
+        cache = ExportCache()
+        first = cache.get_or_render(self.cv_data, "pdf", self.render)
+        second = cache.get_or_render(self.cv_data, "pdf", self.render)
+        self.assertEqual(first, second)
+        self.assertEqual(self.render_calls, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_formats_are_cached_separately(self):
+        cache = ExportCache()
+        cache.get_or_render(self.cv_data, "pdf", self.render)
+        cache.get_or_render(self.cv_data, "docx", self.render)
+        self.assertEqual(self.render_calls, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_changed_cv_is_rendered_again(self):
+        cache = ExportCache()
+        cache.get_or_render(self.cv_data, "pdf", self.render)
+        self.cv_data.personal_info.name = "Jane Doe"
+        self.assertEqual(cache.get_or_render(self.cv_data, "pdf", self.render), b"Jane Doe")
+        self.assertEqual(self.render_calls, 2)
+
+    def test_lru_eviction(self):
+        cache = ExportCache(max_entries=2)
+        cache.put("a", "pdf", b"a")
+        cache.put("b", "pdf", b"b")
+        cache.get("a", "pdf") # "a" becomes most recently used
+        cache.put("c", "pdf", b"c")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b", "pdf"))
+        self.assertEqual(cache.get("a", "pdf"), b"a")
+        self.assertEqual(cache.get("c", "pdf"), b"c")
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ExportCache(max_entries=0)
+
+    def test_deferred_export_renders_only_when_called(self):
+        cache = ExportCache()
+        deferred = DeferredExport(cache, self.cv_data, "pdf", self.render)
+        self.assertEqual(self.render_calls, 0)
+        self.assertEqual(deferred(), b"John Doe")
+        self.assertEqual(deferred(), b"John Doe")
+        self.assertEqual(self.render_calls, 1)
+
+    def test_deferred_export_snapshots_cv_data(self):
+        deferred = DeferredExport(ExportCache(), self.cv_data, "pdf", self.render)
+        self.cv_data.personal_info.name = "Jane Doe"
+        self.assertEqual(deferred(), b"John Doe")
+
+def _put_many(directory, worker):
+    cache = DiskExportCache(directory)
+    for i in range(20):
+        cache.put(f"key{i}", "pdf", bytes([worker]) * 1000)
+        assert cache.get(f"key{i}", "pdf") in (bytes([w]) * 1000 for w in range(4))
+
+class TestDiskExportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = os.path.join(self.tmp.name, "cache")
+        self.cv_data = CVData(personal_info=PersonalInformation(name="John Doe"), skills=Skills(technical=["Python"]))
+
+    def test_entries_persist_across_instances(self):
+        DiskExportCache(self.directory).put("a", "pdf", b"pdf bytes")
+        cache = DiskExportCache(self.directory)
+        self.assertEqual(cache.get("a", "pdf"), b"pdf bytes")
+        self.assertIsNone(cache.get("a", "docx"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.stats()["bytes"], len(b"pdf bytes"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(DiskExportCache(self.directory).get("a", "pdf"))
+
+    def test_size_bounded_lru_eviction(self):
+        cache = DiskExportCache(self.directory, max_bytes=3000)
+        for key in ("a", "b", "c"):
+            cache.put(key, "pdf", b"x" * 1000)
+            os.utime(cache._path(key, "pdf"), (0, {"a": 1, "b": 2, "c": 3}[key])) # Deterministic ages
+        cache.get("a", "pdf") # "a" becomes most recently used
+        cache.put("d", "pdf", b"x" * 1000)
+        self.assertIsNone(cache.get("b", "pdf"))
+        self.assertIsNotNone(cache.get("a", "pdf"))
+        self.assertIsNotNone(cache.get("d", "pdf"))
+        self.assertLessEqual(cache.stats()["bytes"], 2700)
+
+    def test_writes_leave_no_temporary_files(self):
+        cache = DiskExportCache(self.directory)
+        cache.put("a", "pdf", b"data")
+        cache.put("a", "pdf", b"new data")
+        files = [name for _, _, names in os.walk(self.directory) for name in names]
+        self.assertEqual(len(files), 1)
+        self.assertEqual(cache.get("a", "pdf"), b"new data")
+
+    def test_concurrent_processes(self):
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_put_many, [self.directory] * 4, range(4)))
+        cache = DiskExportCache(self.directory)
+        self.assertEqual(len(cache), 20)
+        self.assertEqual(len(cache.get("key7", "pdf")), 1000)
+
+    def test_exports_use_the_render_cache(self):
+        cache = DiskExportCache(self.directory)
+        set_render_cache(cache)
+        self.addCleanup(set_render_cache, None)
+        first = export_to_pdf(self.cv_data, "cv.pdf").getvalue()
+        self.assertEqual(export_to_pdf(self.cv_data, "cv.pdf").getvalue(), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        export_to_pdf(self.cv_data, "cv.pdf", theme='compact')
+        export_to_pdf(self.cv_data, "cv.pdf", engine='canvas')
+        export_to_docx(self.cv_data, "cv.docx")
+        export_to_docx(self.cv_data, "cv.docx", engine='stream')
+        self.assertEqual(cache.misses, 5)
+        self.assertEqual(len(cache), 5)
+        # A later process (a fresh cache object on the same directory) skips rendering
+        set_render_cache(DiskExportCache(self.directory))
+        self.assertEqual(export_to_docx(self.cv_data, "cv.docx", engine='stream').getvalue()[:2], b"PK")
+        self.assertEqual(len(cache), 5)
+
+    def test_exports_can_bypass_or_replace_the_render_cache(self):
+        cache = DiskExportCache(self.directory)
+        set_render_cache(cache)
+        self.addCleanup(set_render_cache, None)
+        export_to_pdf(self.cv_data, "cv.pdf", cache=False)
+        export_to_docx(self.cv_data, "cv.docx", cache=False)
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+        other = ExportCache()
+        export_to_pdf(self.cv_data, "cv.pdf", cache=other)
+        self.assertEqual((len(other), len(cache)), (1, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from models import PersonalInformation, Experience, Skills, CVData
+from export_utils import export_to_pdf, export_to_docx
+from export_timing import ExportProfile, StageTiming, observe_exports, add_export_observer, remove_export_observer, start_export
+
+class TestExportTiming(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            experience=[Experience(title="Engineer", company="Tech Corp", description="- Built things")],
+            skills=Skills(technical=["Python"])
+        )
+
+    def test_pdf_stages(self):
+        profiles = []
+        with observe_exports(profiles.append):
+            export_to_pdf(self.cv_data, "cv.pdf")
+            export_to_pdf(self.cv_data, "cv.pdf", engine='canvas')
+        self.assertEqual([(profile.fmt, profile.engine) for profile in profiles], [('pdf', 'platypus'), ('pdf', 'canvas')])
+        self.assertEqual([stage.name for stage in profiles[0].stages], ['styles', 'document', 'story', 'layout'])
+        self.assertEqual([stage.name for stage in profiles[1].stages], ['styles', 'document', 'render'])
+        self.assertTrue(all(stage.seconds >= 0 for stage in profiles[0].stages))
+        self.assertGreater(profiles[0].total_seconds, 0)
+
+    def test_docx_stages(self):
+        profiles = []
+        with observe_exports(profiles.append):
+            export_to_docx(self.cv_data, "cv.docx")
+            export_to_docx(self.cv_data, "cv.docx", engine='stream')
+        self.assertEqual([stage.name for stage in profiles[0].stages], ['document', 'template', 'paragraphs', 'save'])
+        self.assertEqual([stage.name for stage in profiles[1].stages], ['document', 'render'])
+        self.assertEqual([row["stage"] for row in profiles[0].as_rows()], ['document', 'template', 'paragraphs', 'save'])
+
+    def test_output_size_is_reported(self):
+        profiles = []
+        with observe_exports(profiles.append):
+            pdf = export_to_pdf(self.cv_data, "cv.pdf")
+            docx = export_to_docx(self.cv_data, "cv.docx", optimize_size=True)
+        self.assertEqual([profile.output_bytes for profile in profiles], [pdf.getbuffer().nbytes, docx.getbuffer().nbytes])
+        self.assertEqual(profiles[1].stages[-1].name, 'compact')
+
+    def test_disabled_when_nobody_observes(self):
+        recorder = start_export('pdf', 'platypus')
+        self.assertIs(recorder, start_export('docx', 'stream'))
+        with recorder.stage('styles'):
+            pass
+        recorder.finish()
+        profiles = []
+        with observe_exports(profiles.append):
+            pass
+        export_to_pdf(self.cv_data, "cv.pdf")
+        self.assertEqual(profiles, [])
+
+    def test_context_observers_are_not_shared_between_threads(self):
+        profiles = []
+        with observe_exports(profiles.append):
+            thread = threading.Thread(target=export_to_docx, args=(self.cv_data, "cv.docx"), kwargs={"engine": "stream"})
+            thread.start()
+            thread.join()
+        self.assertEqual(profiles, [])
+
+    def test_global_observer(self):
+        profiles = []
+        add_export_observer(profiles.append)
+        try:
+            thread = threading.Thread(target=export_to_docx, args=(self.cv_data, "cv.docx"), kwargs={"engine": "stream"})
+            thread.start()
+            thread.join()
+        finally:
+            remove_export_observer(profiles.append)
+        export_to_docx(self.cv_data, "cv.docx", engine='stream')
+        self.assertEqual(len(profiles), 1)
+
+    def test_total_seconds(self):
+        profile = ExportProfile('pdf', 'platypus', [StageTiming('styles', 0.5, 3), StageTiming('layout', 1.5, -2)])
+        self.assertEqual(profile.total_seconds, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
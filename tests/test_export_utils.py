@@ -1,7 +1,9 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from models import PersonalInformation, Education, Experience, Skills, CVData
-from export_utils import export_to_pdf, export_to_docx
+from reportlab import rl_config
+from export_utils import export_to_pdf, export_to_docx, get_pdf_styles, get_pdf_base14_styles, register_pdf_theme, pdf_theme_names, PdfTheme
 
 class TestExportUtils(unittest.TestCase):
 
@@ -83,5 +85,60 @@ class TestExportUtils(unittest.TestCase):
         self.assertIsInstance(buffer, BytesIO)
         self.assertGreater(buffer.getbuffer().nbytes, 0)
 
+    def test_pdf_styles_are_built_once(self):
+        self.assertIs(get_pdf_styles('classic'), get_pdf_styles('classic'))
+
+    def test_pdf_styles_are_read_only(self):
+        styles = get_pdf_styles('classic')
+        with self.assertRaises(TypeError):
+            styles['NameStyle'] = None
+
+    def test_builtin_pdf_themes(self):
+        for theme in ('classic', 'compact', 'serif'):
+            self.assertIn(theme, pdf_theme_names())
+            buffer = export_to_pdf(self.full_cv_data, "full_cv.pdf", theme=theme)
+            self.assertGreater(buffer.getbuffer().nbytes, 0)
+        self.assertEqual(get_pdf_styles('serif')['NormalTextStyle'].fontName, 'Times-Roman')
+
+    def test_register_pdf_theme(self):
+        register_pdf_theme(PdfTheme(name='test-large', body_size=14))
+        self.assertEqual(get_pdf_styles('test-large')['NormalTextStyle'].fontSize, 14)
+        buffer = export_to_pdf(self.full_cv_data, "full_cv.pdf", theme='test-large')
+        self.assertGreater(buffer.getbuffer().nbytes, 0)
+
+    def test_unknown_pdf_theme(self):
+        with self.assertRaises(ValueError):
+            export_to_pdf(self.full_cv_data, "full_cv.pdf", theme='does-not-exist')
+
+    def test_optimize_size_pdf(self):
+        for engine in ('platypus', 'canvas'):
+            regular = export_to_pdf(self.full_cv_data, "full_cv.pdf", engine=engine).getvalue()
+            small = export_to_pdf(self.full_cv_data, "full_cv.pdf", engine=engine, optimize_size=True).getvalue()
+            self.assertTrue(small.startswith(b"%PDF"))
+            self.assertLess(len(small), len(regular))
+            self.assertNotIn(b"ASCII85Decode", small)
+            self.assertEqual(export_to_pdf(self.full_cv_data, "full_cv.pdf", engine=engine, optimize_size=True).getvalue(), small)
+        self.assertEqual(rl_config.useA85, 1) # Restored after the compact renders
+
+    def test_concurrent_compact_and_normal_pdfs(self):
+        # Normal renders running alongside compact ones keep their ASCII85 streams
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [(optimize_size, executor.submit(export_to_pdf, self.full_cv_data, "cv.pdf", optimize_size=optimize_size))
+                       for optimize_size in (True, False) * 12]
+            for optimize_size, future in futures:
+                self.assertEqual(b"ASCII85Decode" in future.result().getvalue(), not optimize_size)
+        self.assertEqual(rl_config.useA85, 1)
+
+    def test_base14_styles(self):
+        self.assertIs(get_pdf_base14_styles('serif'), get_pdf_styles('serif'))
+        register_pdf_theme(PdfTheme(name='test-embedded', font_name='DejaVuSans', bold_font_name='Courier-Bold'))
+        styles = get_pdf_base14_styles('test-embedded')
+        self.assertEqual(styles['NormalTextStyle'].fontName, 'Helvetica')
+        self.assertEqual(styles['NameStyle'].fontName, 'Courier-Bold')
+        register_pdf_theme(PdfTheme(name='test-embedded', font_name='Times-Roman', bold_font_name='DejaVuSans-Bold'))
+        styles = get_pdf_base14_styles('test-embedded')
+        self.assertEqual(styles['NormalTextStyle'].fontName, 'Times-Roman')
+        self.assertEqual(styles['NameStyle'].fontName, 'Helvetica-Bold')
+
 if __name__ == '__main__':
     unittest.main()
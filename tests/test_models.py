@@ -1,6 +1,10 @@
 import unittest
+from dataclasses import asdict
 from datetime import datetime
-from ats_cv_web_app.models import PersonalInformation, Education, Experience, Skills, CVData
+import copy
+import pickle
+import sys
+from models import PersonalInformation, Education, Experience, Skills, CVData, FrozenCVData
 
 class TestModels(unittest.TestCase):
 
@@ -124,5 +128,71 @@ class TestModels(unittest.TestCase):
         self.assertEqual(cv_data.experience[0].title, "Project Manager")
         self.assertEqual(cv_data.skills.technical, ["Java"])
 
+    def test_cv_data_from_dict(self):
+        cv_data = CVData(
+            personal_info=PersonalInformation(name="Jane Doe"),
+            education=[Education(degree="M.Sc.", gpa="3.8")],
+            experience=[Experience(title="Project Manager")],
+            skills=Skills(technical=["Java"])
+        )
+        self.assertEqual(CVData.from_dict(asdict(cv_data)), cv_data)
+        self.assertEqual(CVData.from_dict({}), CVData())
+        self.assertEqual(CVData.from_dict({"personal_info": {"name": "Jane Doe"}}).personal_info.name, "Jane Doe")
+
+    def test_cv_data_from_dict_rejects_unknown_fields(self):
+        with self.assertRaises(TypeError):
+            CVData.from_dict({"hobbies": []})
+        with self.assertRaises(TypeError):
+            CVData.from_dict({"personal_info": {"age": 30}})
+        with self.assertRaises(TypeError):
+            CVData.from_dict(["not", "a", "record"])
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_models_are_slotted(self):
+        for obj in (PersonalInformation(), Education(), Experience(), Skills(), CVData()):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            Education().honours = True
+
+    def test_dropdown_values_are_interned(self):
+        degree = "".join(["Master of ", "Science"]) # Built at runtime, so not interned already
+        title = "".join(["Software ", "Engineer"])
+        skill = "".join(["Pyt", "hon"])
+        self.assertIs(Education(degree=degree).degree, Education(degree="Master of Science").degree)
+        self.assertIs(Experience(title=title).title, Experience(title="Software Engineer").title)
+        self.assertIs(Skills(technical=[skill]).technical[0], Skills(technical=["Python"]).technical[0])
+        self.assertIsNone(Education(gpa=None).gpa)
+
+    def test_skills_do_not_modify_the_callers_lists(self):
+        skill = "".join(["Pyt", "hon"])
+        technical = [skill]
+        skills = Skills(technical=technical)
+        self.assertIsNot(skills.technical, technical)
+        self.assertIs(technical[0], skill)
+        self.assertIs(skills.technical[0], "Python")
+
+    def test_freeze_and_thaw(self):
+        cv_data = CVData(
+            personal_info=PersonalInformation(name="Jane Doe"),
+            education=[Education(degree="M.Sc.", gpa="3.8")],
+            experience=[Experience(title="Project Manager", description="Led projects")],
+            skills=Skills(technical=["Java"], languages=["English"])
+        )
+        frozen = cv_data.freeze()
+        self.assertIsInstance(frozen, FrozenCVData)
+        self.assertEqual(frozen.skills.technical, ("Java",))
+        self.assertEqual(hash(frozen), hash(copy.deepcopy(cv_data).freeze()))
+        self.assertEqual({frozen: 1}[cv_data.freeze()], 1)
+        with self.assertRaises(AttributeError):
+            frozen.personal_info.name = "John Doe"
+        self.assertEqual(frozen.thaw(), cv_data)
+        self.assertEqual(asdict(frozen)["education"][0]["degree"], "M.Sc.")
+
+    def test_copy_and_pickle(self):
+        cv_data = CVData(personal_info=PersonalInformation(name="Jane Doe"), skills=Skills(soft=["Teamwork"]))
+        self.assertEqual(copy.deepcopy(cv_data), cv_data)
+        self.assertEqual(pickle.loads(pickle.dumps(cv_data)), cv_data)
+        self.assertEqual(pickle.loads(pickle.dumps(cv_data.freeze())), cv_data.freeze())
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from models import PersonalInformation, Experience, Skills, CVData
+from cv_builder import generate_cv_content
+from export_timing import observe_exports
+from multi_export import export_all, export_zip, iter_completed, get_export_executor, render_format
+
+class TestMultiExport(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            experience=[Experience(title="Engineer", company="Tech Corp", description="- Built things")],
+            skills=Skills(technical=["Python"])
+        )
+
+    def test_export_all(self):
+        futures = export_all(self.cv_data)
+        self.assertEqual(list(futures), ['md', 'pdf', 'docx'])
+        self.assertEqual(futures['md'].result().decode('utf-8'), generate_cv_content(self.cv_data))
+        self.assertTrue(futures['pdf'].result().startswith(b"%PDF"))
+        self.assertTrue(futures['docx'].result().startswith(b"PK"))
+        self.assertIs(get_export_executor(), get_export_executor())
+
+    def test_formats_and_options(self):
+        futures = export_all(self.cv_data, formats=('docx', 'pdf', 'docx'), pdf_engine='canvas', docx_engine='stream',
+                             optimize_size=True)
+        self.assertEqual(list(futures), ['docx', 'pdf'])
+        self.assertEqual(dict(iter_completed(futures))['pdf'],
+                         render_format('pdf', self.cv_data, pdf_engine='canvas', optimize_size=True))
+        with self.assertRaises(ValueError):
+            export_all(self.cv_data, formats=('pdf', 'odt'))
+
+    def test_custom_executor_and_observers(self):
+        profiles = []
+        with ThreadPoolExecutor(max_workers=2) as executor, observe_exports(profiles.append):
+            results = dict(iter_completed(export_all(self.cv_data, executor=executor)))
+        self.assertEqual(set(results), {'md', 'pdf', 'docx'})
+        self.assertEqual(sorted(profile.fmt for profile in profiles), ['docx', 'pdf'])
+
+    def test_export_zip(self):
+        archive = zipfile.ZipFile(export_zip(self.cv_data))
+        self.assertEqual(sorted(archive.namelist()), ['John_Doe_CV.docx', 'John_Doe_CV.md', 'John_Doe_CV.pdf'])
+        self.assertIsNone(archive.testzip())
+        self.assertTrue(archive.read('John_Doe_CV.pdf').startswith(b"%PDF"))
+        self.assertEqual(archive.getinfo('John_Doe_CV.pdf').compress_type, zipfile.ZIP_STORED)
+
+        output = BytesIO()
+        self.assertIs(export_zip(self.cv_data, formats=('md',), file_stem='cv', fileobj=output), output)
+        self.assertEqual(zipfile.ZipFile(output).namelist(), ['cv.md'])
+
+if __name__ == '__main__':
+    unittest.main()
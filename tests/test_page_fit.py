@@ -0,0 +1,59 @@
+import unittest
+from models import PersonalInformation, Experience, Skills, CVData
+from export_utils import export_to_pdf, get_pdf_styles
+from page_fit import estimate_pages, fit_scale, fit_to_pages, count_pdf_pages, MIN_SCALE
+
+def make_cv(jobs, bullets=4, words=18):
+    description = "\n".join("- " + " ".join(f"word{i}{j}" for j in range(words)) for i in range(bullets))
+    return CVData(
+        personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com", summary="Summary " * 30),
+        experience=[Experience(title=f"Engineer {i}", company="Tech Corp", start_date="2020", end_date="2021",
+                               description=description) for i in range(jobs)],
+        skills=Skills(technical=["Python", "SQL"])
+    )
+
+class TestPageFit(unittest.TestCase):
+
+    def test_estimate_matches_built_pdf(self):
+        for jobs in (1, 4, 8):
+            for scale in (MIN_SCALE, 0.85, 1.0):
+                cv_data = make_cv(jobs)
+                estimate = estimate_pages(cv_data, scale=scale)
+                for engine in ('platypus', 'canvas'):
+                    pdf = export_to_pdf(cv_data, "cv.pdf", engine=engine, scale=scale)
+                    self.assertEqual(count_pdf_pages(pdf.getvalue()), estimate, (jobs, scale, engine))
+
+    def test_scaled_styles(self):
+        styles = get_pdf_styles('classic', 0.5)
+        self.assertEqual(styles['NormalTextStyle'].fontSize, get_pdf_styles('classic')['NormalTextStyle'].fontSize * 0.5)
+        self.assertIs(get_pdf_styles('classic', 0.5), styles)
+        self.assertIs(get_pdf_styles('classic', 1.0, base14=True), get_pdf_styles('classic'))
+
+    def test_fit_to_one_page(self):
+        cv_data = make_cv(3)
+        self.assertGreater(estimate_pages(cv_data), 1)
+        result = fit_to_pages(cv_data, 1)
+        self.assertTrue(result.fits)
+        self.assertEqual(result.pages, 1)
+        self.assertEqual(result.builds, 1)
+        self.assertLess(result.scale, 1.0)
+        self.assertGreaterEqual(result.scale, MIN_SCALE)
+        self.assertEqual(count_pdf_pages(result.pdf.getvalue()), 1)
+        # The next larger step no longer fits
+        self.assertGreater(estimate_pages(cv_data, scale=round(result.scale + 0.01, 2)), 1)
+
+    def test_fitting_cv_is_not_scaled(self):
+        result = fit_to_pages(make_cv(1), 1)
+        self.assertEqual((result.scale, result.pages, result.fits), (1.0, 1, True))
+
+    def test_cv_too_long_to_fit(self):
+        cv_data = make_cv(12)
+        self.assertEqual(fit_scale(cv_data, 1), MIN_SCALE)
+        result = fit_to_pages(cv_data, 1, engine='canvas')
+        self.assertFalse(result.fits)
+        self.assertGreater(result.pages, 1)
+        with self.assertRaises(ValueError):
+            fit_scale(cv_data, 0)
+
+if __name__ == '__main__':
+    unittest.main()
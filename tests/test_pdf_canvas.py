@@ -0,0 +1,96 @@
+import re
+import unittest
+from io import BytesIO
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from export_utils import export_to_pdf, get_pdf_styles
+from pdf_canvas import FRAME_LEFT, FRAME_WIDTH, CanvasLayout, build_blocks, text_width, _bold_font, _words
+from pdf_text import extract_lines
+
+def count_pages(buffer):
+    return len(re.findall(rb"/Type /Page(?!s)", buffer.getvalue()))
+
+class TestPdfCanvas(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(
+                name="John Doe",
+                email="john.doe@example.com",
+                phone="123-456-7890",
+                linkedin="linkedin.com/johndoe",
+                github="github.com/johndoe",
+                summary="A highly motivated individual with experience in software development."
+            ),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 location="Example City", start_date="2020-09-01", end_date="2022-06-30", gpa="3.9")],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", location="Example Town",
+                                   start_date="2022-07-01", end_date="Present",
+                                   description="- Developed and maintained robust web applications.\n- Collaborated with cross-functional teams.")],
+            skills=Skills(technical=["Python", "Flask", "SQL"], soft=["Teamwork"], languages=["English"])
+        )
+        bullet = "Designed, built and operated services used by millions of customers across many regions every day."
+        self.long_cv_data = CVData(
+            personal_info=PersonalInformation(name="Long CV", summary=" ".join([bullet] * 8)),
+            experience=[Experience(title=f"Engineer {i}", company="Company", location="Remote",
+                                   start_date="2010-01", end_date="2011-01", description="\n".join([bullet] * 6))
+                        for i in range(20)],
+            skills=Skills(technical=["Python"] * 40)
+        )
+
+    def test_canvas_engine_produces_pdf(self):
+        buffer = export_to_pdf(self.full_cv_data, "full_cv.pdf", engine='canvas')
+        self.assertIsInstance(buffer, BytesIO)
+        self.assertTrue(buffer.getvalue().startswith(b"%PDF"))
+        self.assertEqual(count_pages(buffer), 1)
+
+    def test_canvas_engine_empty_cv_data(self):
+        buffer = export_to_pdf(CVData(), "empty_cv.pdf", engine='canvas')
+        self.assertGreater(buffer.getbuffer().nbytes, 0)
+
+    def test_page_count_matches_platypus_engine(self):
+        for theme in ('classic', 'compact'):
+            platypus = export_to_pdf(self.long_cv_data, "long_cv.pdf", theme=theme)
+            canvas = export_to_pdf(self.long_cv_data, "long_cv.pdf", theme=theme, engine='canvas')
+            self.assertGreater(count_pages(platypus), 3)
+            self.assertEqual(count_pages(platypus), count_pages(canvas))
+
+    def test_layout_without_canvas_counts_pages(self):
+        layout = CanvasLayout()
+        for block in build_blocks(self.long_cv_data, get_pdf_styles('classic')):
+            layout.add(block)
+        canvas = export_to_pdf(self.long_cv_data, "long_cv.pdf", engine='canvas')
+        self.assertEqual(layout.pages, count_pages(canvas))
+
+    def test_words_keep_bold_boundaries(self):
+        style = get_pdf_styles('classic')['NormalTextStyle']
+        words = _words([("Technical Skills:", True), (" Python, SQL", False)], style)
+        self.assertEqual(words, [
+            [("Technical", "Helvetica-Bold")],
+            [("Skills:", "Helvetica-Bold")],
+            [("Python,", "Helvetica")],
+            [("SQL", "Helvetica")],
+        ])
+        words = _words([("M.Sc.", True), ("(Hons)", False)], style)
+        self.assertEqual(words, [[("M.Sc.", "Helvetica-Bold"), ("(Hons)", "Helvetica")]])
+
+    def test_long_words_are_split_to_the_frame_width(self):
+        url = "https://example.com/" + "a" * 380
+        cv_data = CVData(personal_info=PersonalInformation(name="Jane Doe", summary=f"See {url} for more."),
+                         experience=[Experience(title="Engineer", description="Token " + "x" * 400)])
+        for theme in ('classic', 'compact', 'serif'):
+            normal = get_pdf_styles(theme)['NormalTextStyle'].fontName
+            canvas_lines = extract_lines(export_to_pdf(cv_data, "long_words.pdf", theme=theme, engine='canvas').getvalue())
+            platypus_lines = extract_lines(export_to_pdf(cv_data, "long_words.pdf", theme=theme).getvalue())
+            self.assertEqual(len(canvas_lines), len(platypus_lines), theme)
+            for line in canvas_lines:
+                width = sum(text_width(run.text, _bold_font(normal) if run.bold else normal, line.size)
+                            for run in line.runs)
+                self.assertLessEqual(line.x + width, FRAME_LEFT + FRAME_WIDTH + 0.01, (theme, line.text))
+            self.assertEqual("".join(line.text for line in canvas_lines), "".join(line.text for line in platypus_lines))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            export_to_pdf(self.full_cv_data, "full_cv.pdf", engine='does-not-exist')
+
+if __name__ == '__main__':
+    unittest.main()
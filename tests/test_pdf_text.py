@@ -0,0 +1,41 @@
+import unittest
+from models import PersonalInformation, Experience, Skills, CVData
+from export_utils import export_to_pdf
+from pdf_text import extract_lines, extract_text
+
+class TestPdfText(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            experience=[Experience(title="Software Engineer", company="Tech Corp", start_date="2022",
+                                   end_date="Present", description="- Built (robust) apps\\tools.")],
+            skills=Skills(technical=["Python", "C++"])
+        )
+
+    def test_lines_runs_and_bullets(self):
+        for engine in ('platypus', 'canvas'):
+            for optimize_size in (False, True):
+                data = export_to_pdf(self.cv_data, "cv.pdf", engine=engine, optimize_size=optimize_size).getvalue()
+                lines = extract_lines(data)
+                self.assertEqual(lines[0].text, "John Doe")
+                self.assertGreater(lines[0].size, lines[1].size)
+                self.assertTrue(all(run.bold for run in lines[0].runs))
+                bullets = [line.text for line in lines if line.bullet]
+                self.assertEqual(bullets, ["- Built (robust) apps\\tools."])
+                skills = lines[-1]
+                self.assertEqual(skills.text, "Technical Skills: Python, C++")
+                self.assertTrue(skills.runs[0].bold)
+                self.assertFalse(skills.runs[-1].bold)
+
+    def test_extract_text(self):
+        text = extract_text(export_to_pdf(self.cv_data, "cv.pdf").getvalue())
+        self.assertIn("Software Engineer at Tech Corp", text)
+        self.assertIn("2022 - Present", text)
+
+    def test_not_a_pdf(self):
+        with self.assertRaises(ValueError):
+            extract_lines(b"not a pdf")
+
+if __name__ == '__main__':
+    unittest.main()
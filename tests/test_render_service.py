@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from models import PersonalInformation, Experience, Skills, CVData
+from serialization import to_json, encode_record
+from render_service import RenderService, HttpError, render_remote, render_record
+
+class GatedExecutor(ThreadPoolExecutor):
+    """
+    Thread pool whose renders wait for a gate, so tests can hold requests in flight.
+    """
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.gate = threading.Event()
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        def gated():
+            self.gate.wait(5)
+            return fn(*args, **kwargs)
+        return super().submit(gated)
+
+class TestRenderService(unittest.TestCase):
+
+    def setUp(self):
+        self.cv_data = CVData(
+            personal_info=PersonalInformation(name="John Doe", email="john.doe@example.com"),
+            experience=[Experience(title="Engineer", company="Tech Corp", description="- Built things")],
+            skills=Skills(technical=["Python"])
+        )
+
+    def test_identical_requests_are_coalesced(self):
+        executor = GatedExecutor()
+        service = RenderService(max_pending=2, executor=executor)
+
+        async def scenario():
+            first = asyncio.ensure_future(service.render('md', self.cv_data))
+            second = asyncio.ensure_future(service.render('md', self.cv_data))
+            other = asyncio.ensure_future(service.render('md', CVData(personal_info=PersonalInformation(name="Jane"))))
+            await asyncio.sleep(0.05)
+            with self.assertRaises(HttpError) as caught: # Two distinct renders already in flight
+                await service.render('pdf', self.cv_data)
+            self.assertEqual(caught.exception.status, 503)
+            executor.gate.set()
+            return await asyncio.gather(first, second, other)
+
+        results = asyncio.run(scenario())
+        service.close()
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(results[0].startswith(b"# John Doe"))
+        self.assertEqual(executor.submitted, 2)
+        metrics = service.metrics()
+        self.assertEqual(metrics["counters"], {"coalesced": 1, "rejected": 1, "renders": 2})
+        self.assertEqual(metrics["latency"]["md"]["count"], 2)
+        self.assertEqual(metrics["in_flight"], 0)
+
+    def test_cancelled_request_leaves_its_render_in_flight(self):
+        executor = GatedExecutor()
+        service = RenderService(max_pending=2, executor=executor)
+
+        async def scenario():
+            first = asyncio.ensure_future(service.render('md', self.cv_data))
+            await asyncio.sleep(0.05)
+            first.cancel() # The client disconnected
+            await asyncio.sleep(0)
+            self.assertEqual(service.metrics()["in_flight"], 1)
+            later = asyncio.ensure_future(service.render('md', self.cv_data))
+            await asyncio.sleep(0.05)
+            executor.gate.set()
+            data = await later
+            await asyncio.sleep(0)
+            return first, data
+
+        first, data = asyncio.run(scenario())
+        service.close()
+        self.assertTrue(first.cancelled())
+        self.assertTrue(data.startswith(b"# John Doe"))
+        self.assertEqual(executor.submitted, 1)
+        metrics = service.metrics()
+        self.assertEqual(metrics["counters"], {"coalesced": 1, "renders": 1})
+        self.assertEqual(metrics["in_flight"], 0)
+
+    def test_render_record_formats(self):
+        record = encode_record(self.cv_data)
+        self.assertTrue(render_record('pdf', record, 'classic', 'canvas').startswith(b"%PDF"))
+        self.assertTrue(render_record('docx', record, 'classic', 'stream').startswith(b"PK"))
+
+    def test_http_endpoints(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        service = RenderService(executor=executor)
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(service.start('127.0.0.1', 0))
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        try:
+            self.assertTrue(render_remote(url, 'pdf', self.cv_data).startswith(b"%PDF"))
+            self.assertTrue(render_remote(url, 'docx', self.cv_data, engine='stream').startswith(b"PK"))
+            self.assertEqual(render_remote(url, 'md', self.cv_data).decode('utf-8').splitlines()[0], "# John Doe")
+
+            with self.assertRaises(urllib.error.HTTPError) as caught:
+                render_remote(url, 'pdf', self.cv_data, engine='nope')
+            self.assertEqual(caught.exception.code, 400)
+            request = urllib.request.Request(f"{url}/render/pdf", data=b"{not json", method='POST')
+            with self.assertRaises(urllib.error.HTTPError) as caught:
+                urllib.request.urlopen(request, timeout=10)
+            self.assertEqual(caught.exception.code, 400)
+            request = urllib.request.Request(f"{url}/render/odt", data=to_json(self.cv_data).encode('utf-8'), method='POST')
+            with self.assertRaises(urllib.error.HTTPError) as caught:
+                urllib.request.urlopen(request, timeout=10)
+            self.assertEqual(caught.exception.code, 404)
+
+            with urllib.request.urlopen(f"{url}/health", timeout=10) as response:
+                health = json.loads(response.read())
+            self.assertEqual(health["status"], "ok")
+            self.assertEqual(health["counters"]["renders"], 3)
+            self.assertEqual(health["counters"]["status_400"], 2)
+            self.assertEqual(health["latency"]["pdf"]["count"], 1)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+            service.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import io
+import unittest
+from dataclasses import asdict
+from models import PersonalInformation, Education, Experience, Skills, CVData
+from serialization import (FORMAT_VERSION, MAGIC, to_bytes, from_bytes, encode_record, decode_record,
+                           dump_stream, iter_load_stream, to_dict, from_dict, to_json, from_json,
+                           dump_json_lines, iter_load_json_lines, _u32)
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.full_cv_data = CVData(
+            personal_info=PersonalInformation(
+                name="John Doe",
+                email="john.doe@example.com",
+                phone="123-456-7890",
+                linkedin="linkedin.com/johndoe",
+                github="github.com/johndoe",
+                summary="A highly motivated individual.\nLikes ünïcödé and emoji 🚀."
+            ),
+            education=[Education(degree="M.Sc.", major="Computer Science", institution="University of Example",
+                                 location="Example City", start_date="2020-09-01", end_date="2022-06-30", gpa="3.9"),
+                       Education(degree="B.Sc.", gpa=None)],
+            experience=[Experience(title="Software Engineer", company="Tech Corp", location="Example Town",
+                                   start_date="2022-07-01", end_date="Present", description="- Built things\n- Shipped")],
+            skills=Skills(technical=["Python", "SQL"], soft=[], languages=["English"])
+        )
+
+    def test_binary_round_trip(self):
+        for cv_data in (self.full_cv_data, CVData()):
+            data = to_bytes(cv_data)
+            self.assertTrue(data.startswith(MAGIC + bytes([FORMAT_VERSION])))
+            self.assertEqual(from_bytes(data), cv_data)
+        self.assertEqual(from_bytes(to_bytes(self.full_cv_data.freeze())), self.full_cv_data)
+
+    def test_values_containing_the_separator(self):
+        cv_data = CVData(personal_info=PersonalInformation(name="a\x00b", summary="\x00"), skills=Skills(soft=["\x00x"]))
+        self.assertEqual(from_bytes(to_bytes(cv_data)), cv_data)
+
+    def test_binary_is_smaller_than_json(self):
+        self.assertLess(len(to_bytes(self.full_cv_data)), len(to_json(self.full_cv_data).encode("utf-8")))
+
+    def test_older_records_get_defaults_for_added_fields(self):
+        # A record written before Education.gpa existed: six education fields
+        strings = ["Jane Doe", "", "", "", "", "", "PhD", "Physics", "MIT", "Boston", "2015", "2019"]
+        shape = [6, 1, 6, 0, 6, 3, 0, 0, 0]
+        body = _u32([len(shape), *shape, len(strings), *map(len, strings)]) + "\x00".join(strings).encode("utf-8")
+        cv_data = decode_record(body)
+        self.assertEqual(cv_data.education, [Education("PhD", "Physics", "MIT", "Boston", "2015", "2019", None)])
+        self.assertEqual(cv_data.personal_info.name, "Jane Doe")
+        self.assertEqual(cv_data.skills, Skills())
+
+    def test_newer_records_drop_unknown_fields(self):
+        # A record from a version with an extra personal_info field and a fourth skill list
+        strings = ["Jane Doe", "", "", "", "", "", "she/her", "Python", "Chess"]
+        shape = [7, 0, 7, 0, 6, 4, 1, 0, 0, 1]
+        body = _u32([len(shape), *shape, len(strings), *map(len, strings)]) + "\x00".join(strings).encode("utf-8")
+        cv_data = decode_record(body)
+        self.assertEqual(cv_data, CVData(personal_info=PersonalInformation(name="Jane Doe"),
+                                         skills=Skills(technical=["Python"])))
+
+    def test_malformed_input(self):
+        with self.assertRaises(ValueError):
+            from_bytes(b"XYZ\x01")
+        with self.assertRaises(ValueError):
+            from_bytes(MAGIC + bytes([FORMAT_VERSION + 1]) + encode_record(CVData()))
+        with self.assertRaises(ValueError):
+            decode_record(encode_record(self.full_cv_data)[:-5])
+        with self.assertRaises(ValueError):
+            decode_record(b"\x01\x00")
+
+    def test_corrupted_counts_fail_before_building_entries(self):
+        body = encode_record(self.full_cv_data)
+        for offset in (8, 20, 28): # n_education, n_experience and the technical skills count in the shape
+            corrupted = body[:offset] + _u32([50_000_000]) + body[offset + 4:]
+            with self.assertRaisesRegex(ValueError, "record shape"):
+                decode_record(corrupted)
+        for size in (2, 10, 40): # Truncated inside the shape and inside the length table
+            with self.assertRaises(ValueError):
+                decode_record(body[:size])
+
+    def test_stream_round_trip(self):
+        records = [self.full_cv_data, CVData(), CVData(personal_info=PersonalInformation(name="Jane Doe"))]
+        buffer = io.BytesIO()
+        self.assertEqual(dump_stream(records, buffer), 3)
+        buffer.seek(0)
+        self.assertEqual(list(iter_load_stream(buffer)), records)
+        truncated = io.BytesIO(buffer.getvalue()[:-3])
+        with self.assertRaises(ValueError):
+            list(iter_load_stream(truncated))
+
+    def test_json_round_trip(self):
+        data = to_dict(self.full_cv_data)
+        self.assertEqual(data["version"], FORMAT_VERSION)
+        self.assertEqual({key: value for key, value in data.items() if key != "version"}, asdict(self.full_cv_data))
+        self.assertEqual(from_json(to_json(self.full_cv_data)), self.full_cv_data)
+        buffer = io.StringIO()
+        dump_json_lines([self.full_cv_data, CVData()], buffer)
+        buffer.seek(0)
+        self.assertEqual(list(iter_load_json_lines(buffer)), [self.full_cv_data, CVData()])
+
+    def test_json_schema_evolution(self):
+        cv_data = from_dict({"personal_info": {"name": "Jane Doe", "pronouns": "she/her"},
+                             "education": [{"degree": "PhD"}], "certificates": []})
+        self.assertEqual(cv_data.personal_info, PersonalInformation(name="Jane Doe"))
+        self.assertIsNone(cv_data.education[0].gpa)
+        # Plain asdict output without a version loads too
+        self.assertEqual(from_dict(asdict(self.full_cv_data)), self.full_cv_data)
+        with self.assertRaises(ValueError):
+            from_dict({"version": FORMAT_VERSION + 1})
+        with self.assertRaises(ValueError):
+            from_dict({"education": ["not an object"]})
+
+    def test_strict_from_dict(self):
+        data = {"version": FORMAT_VERSION, "personal_info": {"name": "Jane Doe", "pronouns": "she/her"}}
+        with self.assertRaises(TypeError):
+            from_dict(data, strict=True)
+        with self.assertRaises(TypeError):
+            from_dict({"certificates": []}, strict=True)
+        with self.assertRaises(TypeError):
+            from_dict({"education": ["not an object"]}, strict=True)
+        self.assertEqual(from_dict(to_dict(self.full_cv_data), strict=True), self.full_cv_data)
+        # CVData.from_dict is the same decoder, strict by default
+        self.assertEqual(CVData.from_dict(data, strict=False), from_dict(data))
+        with self.assertRaises(TypeError):
+            CVData.from_dict(data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+from benchmarks.bench_startup import import_times, loaded_backends, module_time, direct_imports
+
+class TestStartup(unittest.TestCase):
+
+    def test_export_modules_do_not_import_backends(self):
+        for module in ('export_utils', 'batch_render', 'render_service'):
+            with self.subTest(module=module):
+                self.assertEqual(loaded_backends(import_times(module)), [])
+
+    def test_backends_load_on_first_export_and_warm_up(self):
+        times = import_times('export_utils', "export_utils.warm_up_exports()")
+        self.assertEqual(loaded_backends(times), ['docx', 'reportlab'])
+        times = import_times('export_utils', "from models import CVData\n"
+                                             "export_utils.export_to_pdf(CVData(), 'cv.pdf', engine='canvas')")
+        self.assertEqual(loaded_backends(times), ['reportlab'])
+
+    def test_import_time_breakdown(self):
+        times = import_times('cv_builder')
+        self.assertGreater(module_time(times, 'cv_builder').cumulative_us, 0)
+        self.assertIn('cv_document', [entry.name for entry in direct_imports(times, 'cv_builder')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from taxonomy import Taxonomy, build_index, canonical_name, get_taxonomy, main, normalize, read_entries
+
+ENTRIES = [
+    ("Python", 980, ["py", "python3"]),
+    ("PyTorch", 600, []),
+    ("Pandas", 700, []),
+    ("PHP", 500, []),
+    ("Machine Learning", 800, ["ml"]),
+    ("Deep Learning", 650, []),
+    ("C++", 750, ["cpp"]),
+    ("Py", 10, []),
+]
+
+class TestTaxonomy(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = Taxonomy.from_entries(ENTRIES)
+
+    def test_normalize(self):
+        self.assertEqual(normalize("  UI/UX Design "), "ui ux design")
+        self.assertEqual(normalize("C++"), "c++")
+        self.assertEqual(normalize("Université de Genève"), "universite de geneve")
+        self.assertEqual(normalize("Node.js."), "node.js")
+        self.assertEqual(normalize("..."), "")
+
+    def test_prefix_suggestions_by_weight(self):
+        self.assertEqual(self.taxonomy.search("p", 3), ["Python", "Pandas", "PyTorch"])
+        self.assertEqual(self.taxonomy.search("py"), ["Python", "PyTorch", "Py"])
+        self.assertEqual(self.taxonomy.search("PYT", 1), ["Python"])
+
+    def test_exact_match_first(self):
+        self.assertEqual(self.taxonomy.search("php", 3)[0], "PHP")
+        self.assertEqual(self.taxonomy.search("c++"), ["C++"])
+
+    def test_later_words_match(self):
+        self.assertEqual(self.taxonomy.search("learn"), ["Machine Learning", "Deep Learning"])
+
+    def test_aliases_and_canonical(self):
+        self.assertEqual(self.taxonomy.search("ml"), ["Machine Learning"])
+        self.assertEqual(self.taxonomy.canonical(" python3 "), "Python")
+        self.assertEqual(self.taxonomy.canonical("CPP"), "C++")
+        self.assertIsNone(self.taxonomy.canonical("learning")) # Word suffixes only help suggestions
+        self.assertIsNone(self.taxonomy.canonical("Rust"))
+
+    def test_typos_fall_back_to_close_spellings(self):
+        self.assertEqual(self.taxonomy.search("pyhton", 1), ["Python"])
+        self.assertEqual(self.taxonomy.search("machine lerning", 1), ["Machine Learning"])
+        self.assertEqual(self.taxonomy.search("zzzzqqq"), [])
+
+    def test_empty_query_gives_heaviest(self):
+        self.assertEqual(self.taxonomy.search("", 2), ["Python", "Machine Learning"])
+        self.assertEqual(self.taxonomy.top(2), ["Python", "Machine Learning"])
+        self.assertEqual(len(self.taxonomy), len(ENTRIES))
+
+    def test_duplicate_names_are_merged(self):
+        taxonomy = Taxonomy.from_entries([("SQL", 5, []), ("sql", 9, ["structured query language"])])
+        self.assertEqual(len(taxonomy), 1)
+        self.assertEqual(taxonomy.canonical("Structured Query Language"), "SQL")
+
+    def test_index_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "skills.idx")
+            with open(path, 'wb') as f:
+                f.write(build_index(ENTRIES))
+            taxonomy = Taxonomy.open(path)
+            self.assertEqual(taxonomy.search("p", 3), self.taxonomy.search("p", 3))
+            self.assertEqual(taxonomy.canonical("ml"), "Machine Learning")
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            Taxonomy(b"not a taxonomy index at all")
+
+    def test_read_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "skills.tsv")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("# comment\nPython\t980\tpy|python3\n\nRust\n")
+            self.assertEqual(list(read_entries(path)), [("Python", 980, ["py", "python3"]), ("Rust", 1, [])])
+
+    def test_seed_taxonomies(self):
+        self.assertEqual(canonical_name('skills', "javascript "), "JavaScript")
+        self.assertEqual(canonical_name('skills', "  Obscure Skill "), "Obscure Skill")
+        self.assertEqual(canonical_name('degrees', "Master of Business Administration"), "MBA")
+        self.assertTrue(get_taxonomy('titles').search("engineer"))
+        self.assertEqual(get_taxonomy('missing').search("x"), [])
+
+    def test_seed_aliases_keep_distinct_names(self):
+        self.assertEqual(canonical_name('skills', "js"), "JavaScript")
+        self.assertEqual(canonical_name('skills', "Unix"), "Unix")
+        self.assertEqual(canonical_name('skills', "troubleshooting"), "troubleshooting")
+        self.assertEqual(canonical_name('titles', "tech lead"), "Technical Lead")
+        self.assertEqual(canonical_name('titles', "Research Assistant"), "Research Assistant")
+        self.assertEqual(canonical_name('titles', "Team Lead"), "Team Lead")
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, index = os.path.join(tmp, "skills.tsv"), os.path.join(tmp, "skills.idx")
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write("".join(f"{name}\t{weight}\t{'|'.join(aliases)}\n" for name, weight, aliases in ENTRIES))
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(main(["build", source, "-o", index]), 0)
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    self.assertEqual(main(["search", index, "learn", "-n", "1"]), 0)
+            self.assertEqual(out.getvalue(), "Machine Learning\n")
+
+if __name__ == '__main__':
+    unittest.main()
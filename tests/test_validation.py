@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+import serialization
+from models import CVData, PersonalInformation, Education, Experience, Skills
+from validation import (ERROR, WARNING, Issue, Rule, Validator, check_entry, check_field, has_errors, validate_cv,
+                        validate_record, validate_records, main)
+from benchmarks.synthetic import make_cv
+
+def valid_cv():
+    cv_data = make_cv(seed=3)
+    cv_data.skills = Skills(technical=["Python", "SQL"], soft=["Teamwork"], languages=["English"])
+    return cv_data
+
+class TestValidation(unittest.TestCase):
+
+    def test_valid_cv_has_no_issues(self):
+        self.assertEqual(Validator().issues(valid_cv()), ())
+        self.assertEqual(Validator().issues(valid_cv().freeze()), ())
+
+    def test_personal_information_rules(self):
+        self.assertEqual(check_field(PersonalInformation, "email", ""),
+                         [Issue("email", "required", "Email is required.", WARNING)])
+        self.assertEqual([issue.code for issue in check_field(PersonalInformation, "email", "jane@example")], ["email"])
+        self.assertEqual(check_field(PersonalInformation, "email", " jane.doe@example.co.uk "), [])
+        self.assertEqual([issue.code for issue in check_field(PersonalInformation, "github", "github.com/jane")], ["url"])
+        self.assertEqual(check_field(PersonalInformation, "linkedin", ""), []) # Optional
+        self.assertEqual(check_field(PersonalInformation, "phone", "+44 (0)20 7946-0958"), [])
+        self.assertEqual([issue.code for issue in check_field(PersonalInformation, "phone", "call me")], ["phone"])
+        self.assertEqual(check_field(PersonalInformation, "summary", ""), [])
+
+    def test_entry_rules(self):
+        issues = check_entry(Education(degree="BSc", major="Physics", institution="MIT", location="Boston",
+                                       start_date="Sept 2018", end_date="Present"))
+        self.assertEqual([(issue.path, issue.code) for issue in issues], [("start_date", "date")])
+        issues = check_entry(Experience(title="Engineer", company="ACME", location="Berlin", start_date="2021-03",
+                                        end_date="2020-01", description="Built things."))
+        self.assertEqual([(issue.path, issue.code) for issue in issues], [("end_date", "date_order")])
+        self.assertTrue(has_errors(issues))
+        self.assertEqual({issue.path for issue in check_entry(Experience())},
+                         {"title", "company", "location", "start_date", "end_date", "description"})
+
+    def test_paths_and_severities(self):
+        cv_data = valid_cv()
+        cv_data.education[1].end_date = "2030-13"
+        cv_data.skills.technical.append("python ")
+        issues = Validator().issues(cv_data)
+        self.assertEqual([(issue.path, issue.code, issue.severity) for issue in issues],
+                         [("education[1].end_date", "date", ERROR), ("skills.technical", "duplicate", WARNING)])
+        self.assertTrue(has_errors(issues))
+        self.assertFalse(has_errors(issues[1:]))
+
+    def test_wrong_types_are_reported(self):
+        result = validate_record(0, {"personal_info": {"name": "Jane", "email": 42, "phone": "+1 123 456 7890"}})
+        self.assertEqual([(issue.path, issue.code) for issue in result.issues], [("personal_info.email", "type")])
+        self.assertFalse(result.valid)
+
+    def test_unhashable_values_skip_the_cache(self):
+        validator = Validator()
+        cv_data = valid_cv()
+        cv_data.personal_info.name = ["x"]
+        self.assertEqual([(issue.path, issue.code) for issue in validator.validate(cv_data)],
+                         [("personal_info.name", "type")])
+        self.assertEqual(validator.stats()["entries"], 0)
+
+    def test_custom_schema(self):
+        validator = Validator({PersonalInformation: {'summary': (Rule('length', lambda text: len(text) <= 10, "Too long."),)}})
+        issues = validator.issues(CVData(PersonalInformation(summary="A" * 11)))
+        self.assertEqual(issues, (Issue("personal_info.summary", "length", "Too long."),))
+
+    def test_results_are_cached_per_cv_version(self):
+        validator = Validator(max_entries=2)
+        cv_data = valid_cv()
+        self.assertEqual(validator.validate(cv_data), ())
+        self.assertIs(validator.validate(cv_data), validator.validate(cv_data))
+        self.assertEqual(validator.stats()["hits"], 2)
+        cv_data.experience[0].start_date = "yesterday"
+        self.assertEqual([issue.code for issue in validator.validate(cv_data)], ["date"])
+        self.assertEqual(validator.stats()["misses"], 2)
+        validator.validate(make_cv(seed=4))
+        self.assertEqual(validator.stats()["entries"], 2)
+        validator.clear()
+        self.assertEqual(validator.stats()["entries"], 0)
+        self.assertEqual(validate_cv(valid_cv()), ())
+
+    def test_validate_records(self):
+        records = [(0, serialization.to_dict(valid_cv())), (1, serialization.encode_record(CVData())),
+                   (2, ValueError("bad line")), (3, ["not", "a", "record"])]
+        for workers in (1, 2):
+            results = list(validate_records(iter(records), workers=workers, chunksize=1))
+            self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+            self.assertEqual([result.valid for result in results], [True, True, False, False])
+            self.assertEqual(len(results[1].issues), 3) # Missing name, email and phone are warnings
+            self.assertEqual(results[2].error, "ValueError: bad line")
+        with self.assertRaises(ValueError):
+            list(validate_records(records, chunksize=0))
+
+    def test_command_line(self):
+        invalid = valid_cv()
+        invalid.personal_info.email = "nope"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cvs.jsonl")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(serialization.to_json(valid_cv()) + "\n" + serialization.to_json(invalid) + "\n")
+            out, err = io.StringIO(), io.StringIO()
+            with redirect_stdout(out), redirect_stderr(err):
+                self.assertEqual(main([path, "--workers", "1"]), 1)
+            self.assertEqual(out.getvalue(), "1\tpersonal_info.email\terror\tPlease enter a valid email address.\n")
+            self.assertIn("1 valid, 1 invalid, 0 failed", err.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,401 @@
+"""
+Declarative validation of CVData records.
+
+SCHEMA lists the rules for every field of the models.py types: required values, email,
+phone and profile URL formats, YYYY-MM dates, start dates before end dates and duplicate
+skills. A key naming several fields ('start_date', 'end_date') gives its rules a tuple of
+their values. A Validator compiles the schema once into a flat plan per model type,
+holding an attribute getter, the compiled rule and the field name for every check. A
+validation is then one pass over the plans with no schema lookups. Problems come back as
+Issue tuples with a path such as "experience[1].end_date", a code, a message and a
+severity; warnings do not make a record invalid.
+
+Results are cached per CV version, keyed by the record's field values, so the app's
+reruns only re-validate a CV after it has changed:
+
+    issues = validate_cv(cv_data)
+    errors = [issue for issue in issues if issue.severity == ERROR]
+
+Records (as in batch_render.py) are validated in a process pool by validate_records, or
+from the command line; one "record<TAB>path<TAB>severity<TAB>message" line is printed
+per issue:
+
+    python validation.py cvs.jsonl --workers 8 [--warnings]
+"""
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from models import (CVData, Education, Experience, PersonalInformation, Skills, FrozenEducation, FrozenExperience,
+                    FrozenPersonalInformation, FrozenSkills)
+
+ERROR = 'error'
+WARNING = 'warning'
+
+_EMAIL = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+")
+_PHONE = re.compile(r"\+?[\d\s().\-/]+")
+_URL = re.compile(r"https?://[^\s/]+\.[^\s/]+(?:/\S*)?", re.IGNORECASE)
+_YEAR_MONTH = re.compile(r"\d{4}-(?:0[1-9]|1[0-2])")
+_PRESENT = 'present'
+
+
+class Issue(NamedTuple):
+    path: str # e.g. "personal_info.email", "education[0].start_date"
+    code: str # e.g. 'required', 'email', 'date_order'
+    message: str
+    severity: str = ERROR
+
+
+class Rule(NamedTuple):
+    code: str
+    test: Callable[[Any], bool] # True when the value is valid
+    message: str
+    severity: str = ERROR
+
+
+def required(label: str, severity: str = ERROR) -> Rule:
+    return Rule('required', lambda value: bool(value and value.strip()), f"{label} is required.", severity)
+
+
+def pattern(code: str, regex: 're.Pattern', message: str, severity: str = ERROR) -> Rule:
+    """
+    A format rule; empty values pass (required() reports those).
+    """
+    match = regex.fullmatch
+    return Rule(code, lambda value: not value or match(value.strip()) is not None, message, severity)
+
+
+def _phone_digits(value: str) -> bool:
+    if not value:
+        return True
+    digits = sum(char.isdigit() for char in value)
+    return 7 <= digits <= 15 and _PHONE.fullmatch(value.strip()) is not None
+
+
+def _is_date(value: str, present: bool) -> bool:
+    value = value.strip()
+    return _YEAR_MONTH.fullmatch(value) is not None or present and value.casefold() == _PRESENT
+
+
+def date(label: str, present: bool = False) -> Rule:
+    example = "YYYY-MM (e.g., 2022-06) or 'Present'" if present else "YYYY-MM (e.g., 2018-09)"
+    return Rule('date', lambda value: not value or _is_date(value, present), f"{label} must be in the format {example}.")
+
+
+def _in_order(dates: Tuple[str, str]) -> bool:
+    start, end = (value.strip() for value in dates)
+    # Only compared once both are well-formed; YYYY-MM strings sort chronologically
+    if not (_YEAR_MONTH.fullmatch(start) and _YEAR_MONTH.fullmatch(end)):
+        return True
+    return start <= end
+
+
+def _unique(values: Sequence[str]) -> bool:
+    return len({value.strip().casefold() for value in values}) == len(values)
+
+
+DATE_ORDER = Rule('date_order', _in_order, "End date is before the start date.")
+NO_BLANK_ITEMS = Rule('required', lambda values: all(value.strip() for value in values), "Remove empty entries.")
+UNIQUE_ITEMS = Rule('duplicate', _unique, "The same entry is listed twice.", WARNING)
+
+FieldKey = Union[str, Tuple[str, ...]]
+
+SCHEMA: Dict[type, Dict[FieldKey, Tuple[Rule, ...]]] = {
+    PersonalInformation: {
+        'name': (required("Full name", WARNING),),
+        'email': (required("Email", WARNING), pattern('email', _EMAIL, "Please enter a valid email address.")),
+        'phone': (required("Phone number", WARNING),
+                  Rule('phone', _phone_digits, "Please enter a valid phone number (e.g., +1 123 456 7890).")),
+        'linkedin': (pattern('url', _URL, "Please enter a valid URL (e.g., https://linkedin.com/in/yourprofile)."),),
+        'github': (pattern('url', _URL, "Please enter a valid URL (e.g., https://github.com/yourusername)."),),
+    },
+    Education: {
+        'degree': (required("Degree"),),
+        'major': (required("Major"),),
+        'institution': (required("Institution name"),),
+        'location': (required("Location"),),
+        'start_date': (required("Start date"), date("Start date")),
+        'end_date': (required("End date"), date("End date", present=True)),
+        ('start_date', 'end_date'): (DATE_ORDER,),
+    },
+    Experience: {
+        'title': (required("Job title"),),
+        'company': (required("Company name"),),
+        'location': (required("Location"),),
+        'start_date': (required("Start date"), date("Start date")),
+        'end_date': (required("End date"), date("End date", present=True)),
+        ('start_date', 'end_date'): (DATE_ORDER,),
+        'description': (required("Responsibilities and achievements"),),
+    },
+    Skills: {
+        'technical': (NO_BLANK_ITEMS, UNIQUE_ITEMS),
+        'soft': (NO_BLANK_ITEMS, UNIQUE_ITEMS),
+        'languages': (NO_BLANK_ITEMS, UNIQUE_ITEMS),
+    },
+}
+
+# Frozen variants share the rules of their mutable model
+_MODELS = {FrozenPersonalInformation: PersonalInformation, FrozenEducation: Education,
+           FrozenExperience: Experience, FrozenSkills: Skills}
+
+# (getter, field name, rule) for every check of a model, in schema order
+Plan = Tuple[Tuple[Callable[[Any], Any], str, Rule], ...]
+
+
+def compile_schema(schema: Dict[type, Dict[FieldKey, Tuple[Rule, ...]]]) -> Dict[type, Plan]:
+    """
+    Flattens a schema into one plan per model type (frozen variants included).
+    """
+    plans = {}
+    for model, spec in schema.items():
+        plan = []
+        for key, rules in spec.items():
+            names = (key,) if isinstance(key, str) else tuple(key)
+            getter = attrgetter(*names)
+            plan.extend((getter, names[-1], rule) for rule in rules)
+        plans[model] = tuple(plan)
+    for frozen, model in _MODELS.items():
+        if model in plans:
+            plans[frozen] = plans[model]
+    return plans
+
+
+def _run(plan: Plan, obj: Any, prefix: str, issues: List[Issue]) -> None:
+    failed = None
+    for getter, name, rule in plan:
+        try:
+            if rule.test(getter(obj)):
+                continue
+            issue = Issue(prefix + name, rule.code, rule.message, rule.severity)
+        except (TypeError, AttributeError): # A record with a number or a list where text belongs
+            if failed == name:
+                continue
+            issue = Issue(prefix + name, 'type', f"{name} has the wrong type.")
+        failed = name
+        issues.append(issue)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_PERSONAL = attrgetter(*(f.name for f in fields(PersonalInformation)))
+_EDUCATION = attrgetter(*(f.name for f in fields(Education)))
+_EXPERIENCE = attrgetter(*(f.name for f in fields(Experience)))
+
+
+def _cv_key(cv_data: CVData) -> Hashable:
+    # Every field value; cheaper to build and compare than a hash of the serialized record
+    skills = cv_data.skills
+    return (_PERSONAL(cv_data.personal_info), tuple(map(_EDUCATION, cv_data.education)),
+            tuple(map(_EXPERIENCE, cv_data.experience)),
+            tuple(skills.technical), tuple(skills.soft), tuple(skills.languages))
+
+
+class Validator:
+    """
+    Validates CVs against a compiled schema, caching the issues of recent CV versions
+    (LRU, max_entries). Safe to share between threads.
+    """
+
+    def __init__(self, schema: Dict[type, Dict[FieldKey, Tuple[Rule, ...]]] = SCHEMA, max_entries: int = 128):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._plans = compile_schema(schema)
+        # Plans of the rules naming a single field, applied to a bare value by check_field
+        self._field_plans: Dict[Tuple[type, str], Plan] = {
+            (model, key): tuple((_identity, key, rule) for rule in rules)
+            for model, spec in schema.items() for key, rules in spec.items() if isinstance(key, str)}
+        self._entries: "OrderedDict[Hashable, Tuple[Issue, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_field(self, model: type, name: str, value: Any) -> List[Issue]:
+        """
+        Issues of one field value, checked by the rules naming only that field (the
+        app's per-input messages). Paths are the bare field name.
+        """
+        issues: List[Issue] = []
+        _run(self._field_plans.get((model, name), ()), value, "", issues)
+        return issues
+
+    def check_entry(self, entry: Any, prefix: str = "") -> List[Issue]:
+        """
+        Issues of one model instance (an Education entry, PersonalInformation, ...).
+        """
+        issues: List[Issue] = []
+        _run(self._plans.get(type(entry), ()), entry, prefix, issues)
+        return issues
+
+    def issues(self, cv_data: CVData) -> Tuple[Issue, ...]:
+        """
+        Validates cv_data without the cache.
+        """
+        plans = self._plans
+        issues: List[Issue] = []
+        _run(plans.get(type(cv_data.personal_info), ()), cv_data.personal_info, "personal_info.", issues)
+        for index, edu in enumerate(cv_data.education):
+            _run(plans.get(type(edu), ()), edu, f"education[{index}].", issues)
+        for index, exp in enumerate(cv_data.experience):
+            _run(plans.get(type(exp), ()), exp, f"experience[{index}].", issues)
+        _run(plans.get(type(cv_data.skills), ()), cv_data.skills, "skills.", issues)
+        return tuple(issues)
+
+    def validate(self, cv_data: CVData) -> Tuple[Issue, ...]:
+        """
+        Issues of cv_data in schema order; an unchanged CV is answered from the cache.
+        """
+        key = _cv_key(cv_data)
+        try:
+            hash(key)
+        except TypeError: # A list or dict where text belongs; issues() reports it
+            return self.issues(cv_data)
+        with self._lock:
+            issues = self._entries.get(key)
+            if issues is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return issues
+            self.misses += 1
+        issues = self.issues(cv_data)
+        with self._lock:
+            self._entries[key] = issues
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return issues
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                "max_entries": self.max_entries}
+
+
+_DEFAULT_VALIDATOR = Validator()
+
+
+def validate_cv(cv_data: CVData) -> Tuple[Issue, ...]:
+    """
+    Validates cv_data using the shared, cached validator.
+    """
+    return _DEFAULT_VALIDATOR.validate(cv_data)
+
+
+def check_field(model: type, name: str, value: Any) -> List[Issue]:
+    return _DEFAULT_VALIDATOR.check_field(model, name, value)
+
+
+def check_entry(entry: Any) -> List[Issue]:
+    return _DEFAULT_VALIDATOR.check_entry(entry)
+
+
+def has_errors(issues: Iterable[Issue]) -> bool:
+    return any(issue.severity == ERROR for issue in issues)
+
+
+@dataclass
+class RecordValidation:
+    index: int
+    issues: Tuple[Issue, ...] = ()
+    error: Optional[str] = None # Set when the record could not be decoded
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None and not has_errors(self.issues)
+
+
+def validate_record(index: int, record: object) -> RecordValidation:
+    from batch_render import parse_record
+
+    try:
+        cv_data = parse_record(record)
+    except Exception as exc:
+        return RecordValidation(index, error=f"{type(exc).__name__}: {exc}")
+    # Batch records are rarely repeated, so the cache would only cost a key per record
+    return RecordValidation(index, _DEFAULT_VALIDATOR.issues(cv_data))
+
+
+def _validate_chunk(chunk: List[Tuple[int, object]]) -> List[RecordValidation]:
+    return [validate_record(index, record) for index, record in chunk]
+
+
+def _chunks(records: Iterable[Tuple[int, object]], size: int) -> Iterator[List[Tuple[int, object]]]:
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_records(records: Iterable[Tuple[int, object]], workers: Optional[int] = None,
+                     chunksize: int = 64) -> Iterator[RecordValidation]:
+    """
+    Validates (index, record) pairs, yielding one RecordValidation per record in input
+    order. workers=1 validates in the current process; otherwise chunks of records go to
+    a process pool, with at most two chunks per worker in flight so large inputs are
+    streamed rather than held in memory.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in _chunks(records, chunksize):
+            yield from _validate_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for chunk in _chunks(records, chunksize):
+            pending.append(executor.submit(_validate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from batch_render import iter_records
+
+    parser = argparse.ArgumentParser(description="Validate CVData records.")
+    parser.add_argument("input", help="JSONL file, JSON array of records or binary CV stream.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunksize", type=int, default=64, help="Records sent to a worker per task.")
+    parser.add_argument("--warnings", action='store_true', help="Also print warnings.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    checked = invalid = failed = 0
+    for result in validate_records(iter_records(args.input), workers=args.workers, chunksize=args.chunksize):
+        checked += 1
+        if result.error:
+            failed += 1
+            print(f"Record {result.index}: {result.error}", file=sys.stderr)
+            continue
+        invalid += not result.valid
+        for issue in result.issues:
+            if issue.severity == ERROR or args.warnings:
+                print(f"{result.index}\t{issue.path}\t{issue.severity}\t{issue.message}")
+    elapsed = time.perf_counter() - start
+    print(f"Validated {checked} record(s) in {elapsed:.2f} s: {checked - invalid - failed} valid, "
+          f"{invalid} invalid, {failed} failed", file=sys.stderr)
+    return 1 if invalid or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())